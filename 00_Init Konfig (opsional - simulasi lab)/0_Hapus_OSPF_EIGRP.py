@@ -1,8 +1,9 @@
-from netmiko import ConnectHandler
-import concurrent.futures
+import argparse
 import json
 import os
 import re
+import sys
+import time
 
 router_admin = {
     "device_type": "cisco_ios",
@@ -12,64 +13,137 @@ router_admin = {
 }
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "00_Lib"))
+from shard import open_jump_pool  # noqa: E402
+from collect_trace import TRACE_DIR  # noqa: E402
+from ios_prompt import send_config_bulk  # noqa: E402
+from ios_config import config_delta  # noqa: E402
 json_path = os.path.join(BASE_DIR, "01_IP_Management", "router_list.json")
 
 with open(json_path) as f:
     router_list = json.load(f)
 
-def nested_ssh(conn, target_ip: str, username="cisco", password="cisco"):
-    out = conn.send_command_timing(f"ssh -l {username} {target_ip}")
-    if "Password" in out:
-        out = conn.send_command_timing(password)
-    return out
+# running-config baseline per router (diambil sekali pakai --save-baseline)
+BASELINE_DIR = os.path.join(BASE_DIR, "03_Output", "Baseline_Config")
+
+# "baseline" = balikin ke baseline dengan satu push delta, "clear" = hapus per interface (cara lama)
+RESET_MODE = "baseline"
+
+# pool jump host, dibuat di __main__ (shard.open_jump_pool)
+jump_pool = None
 
 def clear_config(router_name: str, target_ip: str):
-    conn = None
     try:
         print(f"[+] SSH ke {router_name} ({target_ip})")
-        conn = ConnectHandler(**router_admin)
-
-        nested_ssh(conn, target_ip)
-        conn.send_command_timing("terminal length 0")
-
-        # hapus routing process
-        conn.send_command_timing("conf t")
-        conn.send_command_timing("no router ospf 1")
-        conn.send_command_timing("no router eigrp 1")
-        conn.send_command_timing("end")
-
-        # ambil daftar interface
-        output = conn.send_command_timing("show run | s interface")
-        interfaces = re.findall(r"^interface (\\S+)", output, re.M)
-
-        # bersiin OSPF di interface
-        conn.send_command_timing("conf t")
-        for intf in interfaces:
-            conn.send_command_timing(f"interface {intf}")
-            conn.send_command_timing("no ip ospf authentication")
-            conn.send_command_timing("no ip ospf authentication-key")
-            conn.send_command_timing("no ip ospf message-digest-key 1 md5")
-            conn.send_command_timing("no ip ospf message-digest-key 2 md5")
-            conn.send_command_timing("no ip ospf message-digest-key 3 md5")
-            conn.send_command_timing("no mtu")
-            conn.send_command_timing("no ip ospf network")
-
-            conn.send_command_timing("exit")
-
-        conn.send_command_timing("end")
-        conn.send_command_timing("wr")
-        conn.send_command_timing("exit")
+        with jump_pool.device(target_ip, router_name) as conn:
+            conn.send_command_timing("terminal length 0")
+
+            # hapus routing process
+            conn.send_command_timing("conf t")
+            conn.send_command_timing("no router ospf 1")
+            conn.send_command_timing("no router eigrp 1")
+            conn.send_command_timing("end")
+
+            # ambil daftar interface
+            output = conn.send_command_timing("show run | s interface")
+            interfaces = re.findall(r"^interface (\S+)", output, re.M)
+
+            # bersiin OSPF di interface
+            conn.send_command_timing("conf t")
+            for intf in interfaces:
+                conn.send_command_timing(f"interface {intf}")
+                conn.send_command_timing("no ip ospf authentication")
+                conn.send_command_timing("no ip ospf authentication-key")
+                conn.send_command_timing("no ip ospf message-digest-key 1 md5")
+                conn.send_command_timing("no ip ospf message-digest-key 2 md5")
+                conn.send_command_timing("no ip ospf message-digest-key 3 md5")
+                conn.send_command_timing("no mtu")
+                conn.send_command_timing("no ip ospf network")
+
+                conn.send_command_timing("exit")
+
+            conn.send_command_timing("end")
+            conn.send_command_timing("wr")
 
         print(f"[✓] Clear selesai: {router_name}")
 
     except Exception as e:
         print(f"[!] Gagal {router_name}: {e}")
 
-    finally:
-        if conn:
-            conn.disconnect()
+def baseline_path(router_name: str) -> str:
+    return os.path.join(BASELINE_DIR, f"{router_name}_running-config.txt")
+
+def save_baseline(router_name: str, target_ip: str):
+    """Simpan running-config router sekarang sebagai baseline (cukup sekali per router)."""
+    try:
+        with jump_pool.device(target_ip, router_name) as conn:
+            conn.send_command_timing("terminal length 0")
+            output = conn.send_command_timing("show running-config")
+
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(baseline_path(router_name), "w") as f:
+            f.write(output)
+        print(f"[✓] Baseline disimpan: {router_name}")
+
+    except Exception as e:
+        print(f"[!] Gagal simpan baseline {router_name}: {e}")
+
+def reset_to_baseline(router_name: str, target_ip: str):
+    """
+    Balikin router ke baseline : ambil running-config sekali, hitung delta terhadap
+    baseline, lalu push delta-nya dalam satu bulk write. Balikin waktu reset (detik).
+    """
+    path = baseline_path(router_name)
+    if not os.path.exists(path):
+        print(f"[!] Baseline {router_name} belum ada, jalankan dulu dengan --save-baseline")
+        return None
+    with open(path) as f:
+        baseline = f.read()
+
+    t0 = time.perf_counter()
+    try:
+        with jump_pool.device(target_ip, router_name) as conn:
+            conn.send_command_timing("terminal length 0")
+            current = conn.send_command_timing("show running-config")
+
+            delta = config_delta(current, baseline)
+            if delta:
+                _, errors = send_config_bulk(conn, delta)
+                for err in errors:
+                    print(f"[!] {router_name} menolak '{err['line']}': {err['error']}")
+                conn.send_command_timing("wr")
+
+        elapsed = time.perf_counter() - t0
+        print(f"[✓] Reset selesai: {router_name} ({len(delta)} baris delta, {elapsed:.2f}s)")
+        return elapsed
+
+    except Exception as e:
+        print(f"[!] Gagal {router_name}: {e}")
+        return None
 
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(clear_config, rname, ip) for rname, ip in router_list.items()]
-        concurrent.futures.wait(futures)
+    parser = argparse.ArgumentParser(description="Reset konfigurasi OSPF/EIGRP semua router")
+    parser.add_argument("--mode", choices=["baseline", "clear"], default=RESET_MODE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="simpan running-config sekarang sebagai baseline, tanpa reset")
+    args = parser.parse_args()
+
+    if args.save_baseline:
+        task = save_baseline
+    elif args.mode == "baseline":
+        task = reset_to_baseline
+    else:
+        task = clear_config
+
+    # tiap jump host jalan paralel dengan jatah sesinya sendiri
+    jump_pool = open_jump_pool(router_admin)
+    hasil = jump_pool.run(task, router_list)
+    jump_pool.close()
+
+    if task is reset_to_baseline:
+        print("\n=== Waktu reset per router ===")
+        for rname in router_list:
+            elapsed = hasil[rname]
+            print(f"{rname:<6} {'gagal' if elapsed is None else f'{elapsed:.2f}s'}")
+    print(jump_pool.latency_summary())
+    print(jump_pool.trace.save(TRACE_DIR, "hapus_ospf_eigrp"))
@@ -1,7 +1,6 @@
-from netmiko import ConnectHandler
-import concurrent.futures
 import json
 import os
+import sys
 
 router_admin = {
     "device_type": "cisco_ios",
@@ -11,6 +10,10 @@ router_admin = {
 }
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "00_Lib"))
+from shard import open_jump_pool  # noqa: E402
+from collect_trace import TRACE_DIR  # noqa: E402
+from ios_prompt import send_config  # noqa: E402
 json_path = os.path.join(BASE_DIR, "01_IP_Management", "router_list.json")
 
 with open(json_path) as f:
@@ -221,46 +224,34 @@ router_configs = {
 }
 
 
+# pool jump host, dibuat di __main__ (shard.open_jump_pool)
+jump_pool = None
+
+
 def configure_router(name, ip, commands):
-    conn = None
     try:
         print(f"[+] SSH ke Admin → {name} ({ip})")
-        conn = ConnectHandler(**router_admin)
-        conn.find_prompt()
-
-        # Nested SSH ke router target
-        ssh_cmd = f"ssh -l cisco {ip}"
-        out = conn.send_command_timing(ssh_cmd)
-        if "Password" in out:
-            conn.send_command_timing("cisco")
 
-        # Masuk konfigurasi
-        conn.send_command_timing("conf t")
+        # Nested SSH ke router target (sesi jump host dari pool)
+        with jump_pool.device(ip, name) as conn:
+            # conf t + konfig + end (sekali write kalau PUSH_MODE bulk)
+            for err in send_config(conn, commands):
+                print(f"[!] {name} menolak '{err['line']}': {err['error']}")
 
-        # Konfig 
-        for cmd in commands:
-            conn.send_command_timing(cmd)
-
-        # Keluar ama simpan konpik
-        conn.send_command_timing("end")
-        conn.send_command_timing("wr")
-        conn.send_command_timing("exit")
+            # Keluar ama simpan konpik
+            conn.send_command_timing("wr")
 
         print(f"[✓] Selesai: {name}")
 
     except Exception as e:
         print(f"[!] Error pada {name}: {e}")
 
-    finally:
-        if conn:
-            conn.disconnect()
-
 
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [
-            executor.submit(configure_router, rname, ip, router_configs[ip])
-            for rname, ip in router_list.items()
-            if ip in router_configs
-        ]
-        concurrent.futures.wait(futures)
+    jump_pool = open_jump_pool(router_admin)
+    # tiap jump host jalan paralel dengan jatah sesinya sendiri
+    targets = {rname: ip for rname, ip in router_list.items() if ip in router_configs}
+    jump_pool.run(lambda rname, ip: configure_router(rname, ip, router_configs[ip]), targets)
+    jump_pool.close()
+    print(jump_pool.latency_summary())
+    print(jump_pool.trace.save(TRACE_DIR, "init_konfig"))
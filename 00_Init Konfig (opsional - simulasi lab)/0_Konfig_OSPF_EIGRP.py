@@ -1,7 +1,6 @@
-from netmiko import ConnectHandler
-import concurrent.futures
 import json
 import os
+import sys
 
 router_admin = {
     "device_type": "cisco_ios",
@@ -11,6 +10,10 @@ router_admin = {
 }
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "00_Lib"))
+from shard import open_jump_pool  # noqa: E402
+from collect_trace import TRACE_DIR  # noqa: E402
+from ios_prompt import send_config  # noqa: E402
 
 router_list_path = os.path.join(BASE_DIR, "01_IP_Management", "router_list.json")
 with open(router_list_path) as f:
@@ -22,11 +25,8 @@ with open(roles_path) as f:
 
 ROLES = roles["ROLES"]
 
-def nested_ssh(conn, target_ip: str, username="cisco", password="cisco"):
-    out = conn.send_command_timing(f"ssh -l {username} {target_ip}")
-    if "Password" in out:
-        out = conn.send_command_timing(password)
-    return out
+# pool jump host, dibuat di __main__ (shard.open_jump_pool)
+jump_pool = None
 
 def is_mgmt_ip(ip: str) -> bool:
     return ip.startswith("100.100.100.")
@@ -99,36 +99,29 @@ def generate_config(router_name: str, interfaces):
     return config_lines
 
 def push_config(router_name: str, target_ip: str):
-    conn = None
     try:
         print(f"[+] SSH ke {router_name} ({target_ip})")
-        conn = ConnectHandler(**router_admin)
+        with jump_pool.device(target_ip, router_name) as conn:
+            conn.send_command_timing("terminal length 0")
+            output = conn.send_command_timing("show ip int br")
+            interfaces = parse_show_ip_int_br(output)
 
-        nested_ssh(conn, target_ip)
-        conn.send_command_timing("terminal length 0")
-        output = conn.send_command_timing("show ip int br")
-        interfaces = parse_show_ip_int_br(output)
+            cfg = generate_config(router_name, interfaces)
 
-        cfg = generate_config(router_name, interfaces)
+            for err in send_config(conn, cfg):
+                print(f"[!] {router_name} menolak '{err['line']}': {err['error']}")
 
-        conn.send_command_timing("conf t")
-        for cmd in cfg:
-            conn.send_command_timing(cmd)
-
-        conn.send_command_timing("end")
-        conn.send_command_timing("wr")
-        conn.send_command_timing("exit")
+            conn.send_command_timing("wr")
 
         print(f"[✓] Selesai: {router_name}")
 
     except Exception as e:
         print(f"[!] Gagal {router_name}: {e}")
 
-    finally:
-        if conn:
-            conn.disconnect()
-
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(push_config, rname, ip) for rname, ip in router_list.items()]
-        concurrent.futures.wait(futures)
+    jump_pool = open_jump_pool(router_admin)
+    # tiap jump host jalan paralel dengan jatah sesinya sendiri
+    jump_pool.run(push_config, router_list)
+    jump_pool.close()
+    print(jump_pool.latency_summary())
+    print(jump_pool.trace.save(TRACE_DIR, "konfig_ospf_eigrp"))
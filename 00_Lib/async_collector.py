@@ -0,0 +1,191 @@
+import os
+import time
+import asyncio
+
+import asyncssh
+
+from ios_config import section_commands, split_sections
+from ios_prompt import PROMPT_RE, PASSWORD_LABEL
+from collect_trace import Trace
+from jumphost import NESTED_ERROR_RE
+from raw_store import output_filename
+
+
+def last_prompt(out: str) -> str:
+    """Prompt di akhir output (R1#, Password:, ...), kosong kalau tidak ada."""
+    match = PROMPT_RE.search(out)
+    return match.group(1) if match else ""
+
+
+class AsyncShell:
+    """Shell interaktif (pty) di atas satu channel SSH, baca sampai prompt IOS."""
+
+    def __init__(self, process):
+        self.process = process
+        self.buffer = ""
+
+    async def read_until_prompt(self, timeout: float) -> str:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            match = PROMPT_RE.search(self.buffer)
+            if match:
+                out, self.buffer = self.buffer[:match.end()], self.buffer[match.end():]
+                return out
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"prompt tidak muncul, buffer terakhir: {self.buffer[-80:]!r}")
+            chunk = await asyncio.wait_for(self.process.stdout.read(65536), remaining)
+            if not chunk:
+                raise ConnectionError("channel ditutup oleh remote")
+            self.buffer += chunk.replace("\r\n", "\n").replace("\r", "")
+
+    async def send(self, line: str, timeout: float) -> str:
+        """Kirim satu baris, balikin output tanpa echo command (prompt tetap ikut)."""
+        self.process.stdin.write(line + "\n")
+        out = await self.read_until_prompt(timeout)
+        first_nl = out.find("\n")
+        if first_nl >= 0 and out[:first_nl].strip() == line.strip():
+            out = out[first_nl + 1:]
+        return out
+
+    def close(self):
+        self.process.close()
+
+
+class AsyncCollector:
+    """
+    Engine collector berbasis asyncio (asyncssh).
+
+    - beberapa koneksi SSH ke jump host dibuka sekali, tiap router dapet channel
+      baru di salah satu koneksi itu (multiplexing), lalu nested ssh ke router
+    - jumlah router yang diproses bareng dibatasi `concurrency`
+    - tiap router punya batas waktu `timeout` (detik)
+    - hasil ditulis ke base_dir/<folder>/<router>_<cmd>.txt, sama seperti ambil_data
+    - `split_config=True` : semua "show run | section X" diganti satu "show running-config"
+      yang dipotong lokal
+    - `save(router, cmd, output)` ganti cara nulis hasil (default : file ditulis apa adanya,
+      output kosong dilewati)
+    - durasi tiap command masuk `trace` (phase "command") dan `latency` (format PromptSession)
+    """
+
+    def __init__(self, admin_params: dict, commands: dict, base_dir: str,
+                 concurrency: int = 50, timeout: float = 60.0, jump_connections: int = 4,
+                 username="cisco", password="cisco", command_timeout: float = 30.0,
+                 split_config: bool = False, save=None, trace: Trace = None):
+        self.admin_params = admin_params
+        self.commands = commands
+        self.base_dir = base_dir
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.jump_connections = jump_connections
+        self.username = username
+        self.password = password
+        self.command_timeout = command_timeout
+        self.local_sections = section_commands(commands) if split_config else {}
+        self.save = save or self._save
+        self.trace = trace or Trace()
+        self.latency = []
+
+        self._conns = []
+        self._next = 0
+
+    async def _connect(self):
+        params = self.admin_params
+        for _ in range(self.jump_connections):
+            conn = await asyncssh.connect(
+                params.get("host") or params.get("ip"),
+                port=params.get("port", 22),
+                username=params["username"],
+                password=params["password"],
+                known_hosts=None,
+            )
+            self._conns.append(conn)
+
+    def _pick_conn(self):
+        conn = self._conns[self._next % len(self._conns)]
+        self._next += 1
+        return conn
+
+    async def _send(self, shell, router_name: str, mgmt_ip: str, line: str, label: str = None) -> str:
+        t0 = time.perf_counter()
+        out = await shell.send(line, self.command_timeout)
+        seconds = time.perf_counter() - t0
+        label = label or line
+        self.latency.append({"cmd": label, "seconds": seconds, "mode": "prompt", "host": mgmt_ip})
+        self.trace.add("command", seconds, router_name, mgmt_ip, label, len(out.encode()))
+        return out
+
+    async def _collect_device(self, router_name: str, mgmt_ip: str):
+        conn = self._pick_conn()
+        process = await conn.create_process(term_type="vt100", encoding="utf-8")
+        shell = AsyncShell(process)
+        send = lambda line, label=None: self._send(shell, router_name, mgmt_ip, line, label)  # noqa: E731
+        try:
+            jump_prompt = last_prompt(await shell.read_until_prompt(self.command_timeout))
+
+            out = await send(f"ssh -l {self.username} {mgmt_ip}")
+            if "Password" in out:
+                out = await send(self.password, PASSWORD_LABEL)
+            # nested ssh gagal : jangan sampai output jump host disimpan jadi rawdata router ini
+            error = NESTED_ERROR_RE.search(out)
+            if error:
+                raise ConnectionError(f"nested ssh ke {mgmt_ip} gagal: {error.group(0).strip()}")
+            prompt = last_prompt(out)
+            if prompt in (jump_prompt, "Password:") or not prompt.endswith(("#", ">")):
+                raise ConnectionError(f"nested ssh ke {mgmt_ip} gagal: prompt terakhir {prompt!r}")
+            await send("terminal length 0")
+
+            for cmd in self.commands:
+                if cmd not in self.local_sections:
+                    self.save(router_name, cmd, await send(cmd))
+
+            if self.local_sections:
+                running = await send("show running-config")
+                for cmd, result in split_sections(running, self.local_sections).items():
+                    self.save(router_name, cmd, result)
+
+            await send("exit")
+        finally:
+            shell.close()
+
+    def _save(self, router_name: str, cmd: str, result: str):
+        if result and result.strip():
+            path_out = os.path.join(self.base_dir, self.commands[cmd], output_filename(router_name, cmd))
+            with open(path_out, "w") as f:
+                f.write(result)
+
+    async def _worker(self, sem, router_name, mgmt_ip, results):
+        async with sem:
+            t0 = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._collect_device(router_name, mgmt_ip), self.timeout)
+                status = "ok"
+                print(f"[✓] Selesai: {router_name} ")
+            except asyncio.TimeoutError:
+                status = "timeout"
+                print(f"[!] Timeout {router_name} (> {self.timeout}s)")
+            except Exception as e:
+                status = f"error: {e}"
+                print(f"[!] Error {router_name}: {e}")
+            results[router_name] = {"status": status, "seconds": time.perf_counter() - t0}
+
+    async def collect(self, router_list: dict) -> dict:
+        for folder in set(self.commands.values()):
+            os.makedirs(os.path.join(self.base_dir, folder), exist_ok=True)
+
+        await self._connect()
+        sem = asyncio.Semaphore(self.concurrency)
+        results = {}
+        try:
+            await asyncio.gather(*(
+                self._worker(sem, rname, ip, results) for rname, ip in router_list.items()
+            ))
+        finally:
+            for conn in self._conns:
+                conn.close()
+            self._conns = []
+        return results
+
+    def run(self, router_list: dict) -> dict:
+        return asyncio.run(self.collect(router_list))
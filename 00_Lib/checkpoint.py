@@ -0,0 +1,73 @@
+import os
+import json
+import time
+import random
+import threading
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Jeda sebelum percobaan ke-`attempt` (mulai 1) : exponential backoff dengan
+    full jitter, acak di [0, min(cap, base * 2^(attempt-1))].
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class Checkpoint:
+    """
+    Catatan unit (router, command) yang sudah selesai di-collect (checkpoint.json) :
+
+        {
+          "started_at": ...,
+          "done":   {"R1": ["show interfaces", ...]},
+          "failed": {"R5": "nested ssh ke 100.100.100.5 gagal: ..."}
+        }
+
+    `resume=False` mulai dari kosong, `resume=True` lanjut dari file yang ada.
+    Disimpan ke disk tiap ada router yang selesai / gagal, jadi kalau proses
+    mati di tengah jalan progress-nya tidak hilang. Aman dipakai beberapa thread.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data = {"started_at": time.time(), "done": {}, "failed": {}}
+        if resume and os.path.exists(path):
+            with open(path) as f:
+                self.data = json.load(f)
+            self.data["failed"] = {}
+
+    def done(self, router_name: str) -> set:
+        with self._lock:
+            return set(self.data["done"].get(router_name, []))
+
+    def todo(self, router_name: str, commands) -> list:
+        """Command yang belum selesai untuk router ini (urutan asli dipertahankan)."""
+        done = self.done(router_name)
+        return [cmd for cmd in commands if cmd not in done]
+
+    def mark_done(self, router_name: str, commands):
+        with self._lock:
+            units = self.data["done"].setdefault(router_name, [])
+            units.extend(cmd for cmd in commands if cmd not in units)
+            self.data["failed"].pop(router_name, None)
+        self.save()
+
+    def forget(self, router_names):
+        """Hapus catatan router-router ini, collect berikutnya mulai dari kosong lagi."""
+        with self._lock:
+            for name in router_names:
+                self.data["done"].pop(name, None)
+                self.data["failed"].pop(name, None)
+
+    def mark_failed(self, router_name: str, error: str):
+        with self._lock:
+            self.data["failed"][router_name] = error
+        self.save()
+
+    def save(self):
+        with self._lock:
+            tmp = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp, self.path)
@@ -0,0 +1,112 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+
+# probe murah per router : cuma baris timestamp perubahan config terakhir
+PROBE_COMMAND = "show running-config | include Last configuration change"
+PROBE_RE = re.compile(r"^! Last configuration change at .+$", re.M)
+
+
+def probe_value(output: str) -> str:
+    """Ambil baris 'Last configuration change ...' dari output probe ("" kalau tidak ada)."""
+    match = PROBE_RE.search(output or "")
+    return match.group(0).strip() if match else ""
+
+
+# hash pengganti untuk output kosong (file-nya memang tidak ditulis)
+EMPTY = ""
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class CollectManifest:
+    """
+    Manifest hasil collect rawdata (manifest.json di folder rawdata) :
+
+        {
+          "updated_at": ...,
+          "changed": ["R3", ...],          # router yang file-nya berubah di run terakhir
+          "routers": {
+            "R1": {"probe": "! Last configuration change at ...",
+                   "collected_at": ...,
+                   "files": {"show interfaces": "<sha256>", "show cdp neighbor": "", ...}}
+          }
+        }
+
+    Hash "" (EMPTY) = output command itu kosong, tidak ada file yang ditulis.
+
+    Aman dipanggil dari beberapa thread sekaligus.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data = {"routers": {}, "changed": []}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.data = json.load(f)
+        self.data["changed"] = []
+
+    def router(self, router_name: str) -> dict:
+        return self.data["routers"].setdefault(router_name, {"probe": "", "files": {}})
+
+    def unchanged(self, router_name: str, probe: str, paths: dict) -> bool:
+        """
+        True kalau probe sama dengan run sebelumnya (dan probe-nya valid), dan tiap command
+        di `paths` ({command: file output}) sudah tercatat dengan file output yang masih ada.
+        Command baru / file yang dihapus bikin router-nya diambil ulang.
+        """
+        entry = self.data["routers"].get(router_name)
+        if not probe or entry is None or entry.get("probe") != probe:
+            return False
+        files = entry["files"]
+        return all(cmd in files and (files[cmd] == EMPTY or os.path.exists(path)) for cmd, path in paths.items())
+
+    def _record(self, router_name: str, cmd: str, digest: str) -> bool:
+        """Catat hash, router masuk "changed" kalau hash-nya beda. Dipanggil dengan _lock dipegang."""
+        files = self.router(router_name)["files"]
+        if files.get(cmd) == digest:
+            return False
+        files[cmd] = digest
+        if router_name not in self.data["changed"]:
+            self.data["changed"].append(router_name)
+        return True
+
+    def update_file(self, router_name: str, cmd: str, content: str, path_out: str) -> bool:
+        """
+        Tulis `content` ke `path_out` cuma kalau hash-nya beda dari manifest (atau
+        file-nya hilang). Balikin True kalau file ditulis ulang. File hilang yang ditulis
+        lagi dengan isi yang sama tidak bikin router-nya dianggap berubah.
+        """
+        digest = content_hash(content)
+        with self._lock:
+            if not self._record(router_name, cmd, digest) and os.path.exists(path_out):
+                return False
+        with open(path_out, "w") as f:
+            f.write(content)
+        return True
+
+    def mark_empty(self, router_name: str, cmd: str):
+        """Output command kosong (tidak ada file) : tetap dicatat supaya command-nya dianggap sudah diambil."""
+        with self._lock:
+            self._record(router_name, cmd, EMPTY)
+
+    def set_probe(self, router_name: str, probe: str):
+        with self._lock:
+            entry = self.router(router_name)
+            entry["probe"] = probe
+            entry["collected_at"] = time.time()
+
+    def save(self):
+        with self._lock:
+            self.data["updated_at"] = time.time()
+            self.data["changed"].sort(key=lambda r: (len(r), r))
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp, self.path)
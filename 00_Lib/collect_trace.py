@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+from ios_prompt import PASSWORD_LABEL
+
+# trace durasi (JSON-lines + metrik Prometheus) per run
+TRACE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "03_Output", "Trace")
+
+# batas bucket histogram latency (detik), format Prometheus
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Trace:
+    """
+    Catatan durasi tiap tahap kerja ke device, satu record per kejadian :
+
+        {"run": ..., "ts": ..., "phase": "command", "device": "R1", "host": "100.100.100.1",
+         "cmd": "show interfaces", "seconds": 0.12, "bytes": 5120, "ok": true}
+
+    phase : connect (login jump host), nested_connect (ssh -l ke router),
+    nested_auth (password sampai prompt router), command, batch, push, write.
+    Aman dipakai beberapa thread.
+    """
+
+    def __init__(self):
+        self.run = time.strftime("%Y%m%d-%H%M%S")
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, seconds: float, device=None, host=None, cmd=None, nbytes: int = 0, ok: bool = True):
+        record = {
+            "run": self.run, "ts": time.time(), "phase": phase, "device": device, "host": host,
+            "cmd": cmd, "seconds": seconds, "bytes": nbytes, "ok": ok,
+        }
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    @contextmanager
+    def span(self, phase: str, device=None, host=None, cmd=None):
+        """Ukur blok kode. Isi `info["bytes"]` di dalam blok kalau ada jumlah byte."""
+        info = {"bytes": 0}
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            yield info
+            ok = True
+        finally:
+            self.add(phase, time.perf_counter() - t0, device, host, cmd, info["bytes"], ok)
+
+    # --- output --- #
+    def write_jsonl(self, path: str):
+        """Tambah record run ini ke file JSON-lines (satu record per baris)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            records = list(self.records)
+        with open(path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    def write_prometheus(self, path: str, prefix: str = "collector"):
+        """Histogram latency per (phase, cmd) + total byte, format teks Prometheus."""
+        groups = {}
+        with self._lock:
+            for r in self.records:
+                groups.setdefault((r["phase"], r["cmd"] or ""), []).append(r)
+
+        def labels(phase, cmd, extra=""):
+            cmd = cmd.replace("\\", "\\\\").replace('"', '\\"')
+            return f'{{phase="{phase}",cmd="{cmd}"{extra}}}'
+
+        lines = [
+            f"# HELP {prefix}_seconds Durasi tiap tahap kerja ke device",
+            f"# TYPE {prefix}_seconds histogram",
+        ]
+        for (phase, cmd), records in sorted(groups.items()):
+            values = [r["seconds"] for r in records]
+            for bound in BUCKETS + (float("inf"),):
+                count = sum(1 for v in values if v <= bound)
+                le = ',le="+Inf"' if bound == float("inf") else f',le="{bound}"'
+                lines.append(f"{prefix}_seconds_bucket{labels(phase, cmd, le)} {count}")
+            lines.append(f"{prefix}_seconds_sum{labels(phase, cmd)} {sum(values):.6f}")
+            lines.append(f"{prefix}_seconds_count{labels(phase, cmd)} {len(values)}")
+
+        lines += [
+            f"# HELP {prefix}_bytes_total Total byte output / file per tahap",
+            f"# TYPE {prefix}_bytes_total counter",
+        ]
+        for (phase, cmd), records in sorted(groups.items()):
+            lines.append(f"{prefix}_bytes_total{labels(phase, cmd)} {sum(r['bytes'] for r in records)}")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def slowest_devices(self, n: int = 5) -> str:
+        """Tabel device paling lambat (total durasi semua record device itu)."""
+        per_device = {}
+        with self._lock:
+            for r in self.records:
+                # record batch = gabungan record command di dalamnya, jangan dihitung dua kali
+                if not r["device"] or r["phase"] == "batch":
+                    continue
+                d = per_device.setdefault(r["device"], {"nested": 0.0, "command": 0.0, "write": 0.0,
+                                                         "total": 0.0, "bytes": 0, "gagal": 0})
+                key = "nested" if r["phase"].startswith("nested") else "write" if r["phase"] == "write" else "command"
+                d[key] += r["seconds"]
+                d["total"] += r["seconds"]
+                d["bytes"] += r["bytes"] if r["phase"] != "write" else 0
+                d["gagal"] += 0 if r["ok"] else 1
+        if not per_device:
+            return "[i] Belum ada record trace per device"
+
+        rows = sorted(per_device.items(), key=lambda item: item[1]["total"], reverse=True)[:n]
+        lines = [
+            f"=== {len(rows)} device paling lambat ===",
+            f"{'device':<16}{'nested (s)':>11}{'command (s)':>13}{'write (s)':>11}{'total (s)':>11}{'byte':>10}{'gagal':>7}",
+        ]
+        for device, d in rows:
+            lines.append(f"{device:<16}{d['nested']:>11.2f}{d['command']:>13.2f}{d['write']:>11.3f}"
+                         f"{d['total']:>11.2f}{d['bytes']:>10}{d['gagal']:>7}")
+        return "\n".join(lines)
+
+    def save(self, out_dir: str, name: str, n: int = 5) -> str:
+        """Tulis <name>_trace.jsonl + <name>_metrics.prom di out_dir, balikin tabel device terlambat."""
+        self.write_jsonl(os.path.join(out_dir, f"{name}_trace.jsonl"))
+        self.write_prometheus(os.path.join(out_dir, f"{name}_metrics.prom"))
+        return self.slowest_devices(n)
+
+
+class TracedSession:
+    """
+    Bungkus sesi device (netmiko / PromptSession) : tiap send_command,
+    send_command_timing dan send_config_set dicatat ke Trace sebagai phase
+    "command" (durasi + byte output). Baris setelah prompt "Password:" dicatat sebagai
+    PASSWORD_LABEL, bukan isinya. Atribut lain diteruskan apa adanya.
+    """
+
+    def __init__(self, conn, trace: Trace, device=None, host=None):
+        self.conn = conn
+        self.trace = trace
+        self.device = device
+        self.host = host
+        self._awaiting_password = False
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+    def trace_record(self, phase: str, seconds: float, cmd=None, nbytes: int = 0, ok: bool = True):
+        self.trace.add(phase, seconds, self.device, self.host, cmd, nbytes, ok)
+
+    def _timed(self, method, cmd_label, *args, **kwargs):
+        with self.trace.span("command", self.device, self.host, cmd_label) as info:
+            out = getattr(self.conn, method)(*args, **kwargs)
+            info["bytes"] = len(out or "")
+        return out
+
+    def send_command(self, command_string, *args, **kwargs):
+        return self._timed("send_command", command_string, command_string, *args, **kwargs)
+
+    def send_command_timing(self, command_string, *args, **kwargs):
+        label = PASSWORD_LABEL if self._awaiting_password else command_string
+        out = self._timed("send_command_timing", label, command_string, *args, **kwargs)
+        self._awaiting_password = (out or "").rstrip().endswith("Password:")
+        return out
+
+    def send_config_set(self, config_commands=None, *args, **kwargs):
+        label = f"<config_set {len(config_commands or [])} baris>"
+        return self._timed("send_config_set", label, config_commands, *args, **kwargs)
@@ -0,0 +1,520 @@
+import os
+import re
+import json
+import time
+import socket
+import logging
+import threading
+
+import paramiko
+
+from ios_config import SINGLE_VALUE, parse_blocks, render_blocks, section
+from raw_store import output_filename
+
+# === Path utama === #
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAWDATA_DIR = os.path.join(ROOT_DIR, "03_Output", "rawdata")
+ROUTER_LIST_PATH = os.path.join(ROOT_DIR, "01_IP_Management", "router_list.json")
+
+# client yang disconnect duluan bikin paramiko nge-print "Socket exception", abaikan
+logging.getLogger("paramiko.transport").setLevel(logging.CRITICAL)
+
+# command show -> folder rawdata yang dipakai sebagai jawaban
+CANNED_COMMANDS = {
+    "show interfaces": "interfaces",
+    "show ip ospf interface": "ospf",
+    "show ip protocols": "ip protocols",
+    "show run | section interface": "config",
+    "show run | section router ospf": "ospf_config",
+    "show cdp neighbor": "cdp",
+}
+
+# baris "no ..." yang memang muncul di running-config IOS
+SHOWN_NEGATIONS = {"ip address", "cdp enable", "switchport"}
+
+INTF_NAMES = {"fa": "FastEthernet", "gi": "GigabitEthernet", "lo": "Loopback"}
+
+# kata pertama yang diterima di mode konfigurasi, selain ini -> "% Invalid input"
+CONFIG_KEYWORDS = {
+    "hostname", "cdp", "no", "int", "interface", "ip", "router", "network", "redistribute",
+    "passive-interface", "mtu", "shut", "shutdown", "switchport", "duplex", "speed",
+    "log-adjacency-changes", "description", "default", "router-id", "auto-summary",
+}
+
+
+def make_fleet(n: int):
+    """
+    Bikin daftar router palsu sebanyak n :
+    - R1..R12 pakai IP asli dari router_list.json
+    - sisanya dapet IP 10.x.y.z (R13, R14, ...)
+    """
+    with open(ROUTER_LIST_PATH) as f:
+        real = json.load(f)
+
+    fleet = {}
+    for i in range(1, n + 1):
+        name = f"R{i}"
+        if name in real:
+            fleet[name] = real[name]
+        else:
+            fleet[name] = f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}"
+    return fleet
+
+
+class FakeRouter:
+    """
+    Satu router simulasi : hostname, running-config yang bisa diubah lewat conf t,
+    dan jawaban show command lain dari rawdata.
+    """
+
+    def __init__(self, hostname: str, ip: str, template: str, rawdata_dir: str = RAWDATA_DIR):
+        self.hostname = hostname
+        self.ip = ip
+        self.template = template
+        self.rawdata_dir = rawdata_dir
+        self.changed_at = time.time()
+        self._outputs = {}
+        self._blocks = None
+
+    def _canned(self, cmd: str, folder: str) -> str:
+        path = os.path.join(self.rawdata_dir, folder, output_filename(self.template, cmd))
+        if not os.path.exists(path):
+            return ""
+        with open(path) as f:
+            text = f.read()
+        # file rawdata diakhiri prompt router template (contoh: "R1#")
+        if text.endswith(f"{self.template}#"):
+            text = text[: -len(self.template) - 1]
+        return text
+
+    # --- running-config --- #
+    @property
+    def blocks(self):
+        if self._blocks is None:
+            self._blocks = [[f"hostname {self.hostname}", []]]
+            self._blocks += parse_blocks(self._canned("show run | section interface", "config"))
+            self._blocks += parse_blocks(self._canned("show run | section router ospf", "ospf_config"))
+        return self._blocks
+
+    def running_config(self) -> str:
+        body = "".join(render_blocks([b]) + "!\n" for b in self.blocks)
+        changed = time.strftime("%H:%M:%S UTC %a %b %d %Y", time.gmtime(self.changed_at))
+        head = f"!\n! Last configuration change at {changed} by cisco\n!\nversion 12.4\n!\n"
+        return (f"Building configuration...\n\nCurrent configuration : {len(head) + len(body) + 4} bytes\n"
+                f"{head}{body}end\n")
+
+    def _find(self, header: str):
+        for block in self.blocks:
+            if block[0] == header:
+                return block
+        return None
+
+    def enter_block(self, header: str) -> str:
+        if self._find(header) is None:
+            self.blocks.append([header, []])
+            self.changed_at = time.time()
+        return header
+
+    def configure(self, context, cmd: str):
+        """Terapkan satu baris config di konteks blok `context` (None = global)."""
+        cmd = _expand(cmd)
+        negate = cmd.startswith("no ")
+        body = cmd[3:] if negate else cmd
+        self.changed_at = time.time()
+
+        if context is None:
+            if cmd.startswith("default interface "):
+                # interface fisik balik ke default : semua child hilang, block tetap ada
+                block = self._find(cmd[len("default "):])
+                if block is not None:
+                    block[1].clear()
+                return
+            block = self._find(body)
+            if negate:
+                if block is not None:
+                    self.blocks.remove(block)
+                return
+            if cmd.startswith(SINGLE_VALUE):
+                self.blocks[:] = [b for b in self.blocks if not b[0].startswith(cmd.split()[0] + " ")]
+            self.blocks[:] = [b for b in self.blocks if b[0] != f"no {cmd}"]
+            if self._find(cmd) is None:
+                self.blocks.append([cmd, []])
+            return
+
+        self.enter_block(context)
+        children = self._find(context)[1]
+        matched = [c for c in children if c.strip() == body or c.strip().startswith(body + " ")]
+        if negate:
+            for c in matched:
+                children.remove(c)
+            # IOS cuma nampilin bentuk "no" untuk beberapa default tertentu
+            if not matched and body in SHOWN_NEGATIONS:
+                children.append(f" {cmd}")
+            return
+        if cmd.startswith(SINGLE_VALUE):
+            prefix = next(p for p in SINGLE_VALUE if cmd.startswith(p))
+            children[:] = [c for c in children if not c.strip().startswith(prefix)]
+        # "ip address x y" menggantikan "no ip address", dst
+        children[:] = [c for c in children
+                       if not (c.strip().startswith("no ") and (cmd + " ").startswith(c.strip()[3:] + " "))]
+        if all(c.strip() != cmd for c in children):
+            children.append(f" {cmd}")
+
+    # --- show --- #
+    def show(self, cmd: str) -> str:
+        """Output show command tanpa prompt di akhir."""
+        parts = [p.strip() for p in cmd.split("|")]
+        if parts[0] in ("show running-config", "show run"):
+            text = self.running_config()
+            if len(parts) == 2 and parts[1].split()[0] in ("section", "s"):
+                return section(text, parts[1].split(None, 1)[1])
+            if len(parts) == 2 and parts[1].split()[0] in ("include", "i"):
+                regex = re.compile(parts[1].split(None, 1)[1])
+                return "".join(f"{line}\n" for line in text.splitlines() if regex.search(line))
+            return text
+
+        if cmd not in self._outputs:
+            folder = CANNED_COMMANDS.get(cmd)
+            self._outputs[cmd] = self._canned(cmd, folder) if folder else ""
+        return self._outputs[cmd]
+
+
+def _expand(cmd: str) -> str:
+    """Singkatan IOS yang dipakai di script lab -> bentuk lengkap di running-config."""
+    cmd = " ".join(cmd.split())
+    cmd = re.sub(r"^(no )?int(?:erface)? ", r"\1interface ", cmd)
+    cmd = re.sub(r"^(no )?interface (fa|gi|lo)(?=\d)",
+                 lambda m: (m.group(1) or "") + "interface " + INTF_NAMES[m.group(2).lower()], cmd, flags=re.I)
+    cmd = re.sub(r"^(no )?ip add ", r"\1ip address ", cmd)
+    cmd = re.sub(r"^(no )?shut$", r"\1shutdown", cmd)
+    return cmd
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    def __init__(self, server):
+        self.server = server
+
+    def check_auth_password(self, username, password):
+        if self.server.login_delay:
+            time.sleep(self.server.login_delay)
+        if username == self.server.username and password == self.server.password:
+            with self.server._lock:
+                self.server.stats["auth"] += 1
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED_OPEN_REQUEST
+
+    def check_channel_pty_request(self, channel, term, width, height, pixelwidth, pixelheight, modes):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        # satu koneksi bisa bawa banyak channel shell sekaligus
+        threading.Thread(target=_ShellSession(self.server, channel).run, daemon=True).start()
+        return True
+
+
+class _ShellSession:
+    """State satu channel shell : jump host -> (opsional) nested router."""
+
+    def __init__(self, server, chan):
+        self.server = server
+        self.chan = chan
+        self.router = None          # FakeRouter aktif (nested ssh)
+        self.mode = "exec"          # exec / config / config-if / config-router
+        self.context = None         # header blok config yang lagi diedit
+        self.pending_ip = None      # nunggu password untuk nested ssh
+
+    # --- helper kirim --- #
+    def send(self, text: str):
+        self.chan.sendall(text.replace("\r\n", "\n").replace("\n", "\r\n").encode())
+
+    def prompt(self) -> str:
+        if self.pending_ip:
+            return "Password: "
+        name = self.router.hostname if self.router else self.server.hostname
+        if self.mode == "exec":
+            return f"{name}#"
+        return f"{name}({self.mode})#"
+
+    # --- loop utama --- #
+    def run(self):
+        try:
+            self.send(f"\n{self.prompt()}")
+        except OSError:
+            return
+        buf = b""
+        while True:
+            try:
+                data = self.chan.recv(4096)
+            except (EOFError, OSError):
+                break
+            if not data:
+                break
+            if self.server.rtt:
+                # satu kali round trip jaringan per write dari client
+                time.sleep(self.server.rtt)
+            buf += data
+            while True:
+                idx = min((i for i in (buf.find(b"\r"), buf.find(b"\n")) if i >= 0), default=-1)
+                if idx < 0:
+                    break
+                line = buf[:idx].decode(errors="ignore")
+                term = buf[idx:idx + 1]
+                buf = buf[idx + 1:]
+                if term == b"\r" and buf.startswith(b"\n"):
+                    buf = buf[1:]
+                try:
+                    keep = self.handle_line(line)
+                except OSError:
+                    # client sudah disconnect duluan
+                    return
+                if not keep:
+                    try:
+                        self.chan.close()
+                    except (EOFError, OSError):
+                        pass  # client (netmiko disconnect) sudah nutup transport duluan
+                    return
+
+    def handle_line(self, line: str) -> bool:
+        # password nested ssh tidak di-echo
+        if self.pending_ip:
+            ip = self.pending_ip
+            self.pending_ip = None
+            if line.strip() != self.server.password:
+                self.send("\n% Authentication failed.\n")
+                self.send(self.prompt())
+                return True
+            if self.server.nested_delay:
+                time.sleep(self.server.nested_delay)
+            self.router = self.server.router_for_ip(ip)
+            self.mode = "exec"
+            with self.server._lock:
+                self.server.stats["nested"] += 1
+            self.send(f"\n\n{self.prompt()}")
+            return True
+
+        self.send(line + "\n")
+        cmd = line.strip()
+
+        if self.server.command_delay and cmd:
+            time.sleep(self.server.command_delay)
+        with self.server._lock:
+            self.server.stats["commands"] += 1
+
+        if not cmd:
+            self.send(self.prompt())
+            return True
+
+        if self.router is None:
+            return self.handle_jumphost(cmd)
+        return self.handle_router(cmd)
+
+    def handle_jumphost(self, cmd: str) -> bool:
+        parts = cmd.split()
+        if parts[0] == "ssh" and "-l" in parts and len(parts) >= 4:
+            if self.server.take_failure(parts[-1]):
+                self.send(f"Trying {parts[-1]} ...\n% Connection timed out; remote host not responding\n\n")
+                self.send(self.prompt())
+                return True
+            self.pending_ip = parts[-1]
+            self.send(self.prompt())
+            return True
+        if cmd in ("exit", "logout"):
+            return False
+        self.send(self.prompt())
+        return True
+
+    def handle_router(self, cmd: str) -> bool:
+        if self.mode == "exec":
+            if cmd in ("exit", "logout"):
+                ip = self.router.ip
+                self.router = None
+                self.send(f"\n[Connection to {ip} closed by foreign host]\n{self.prompt()}")
+                return True
+            if cmd in ("conf t", "configure terminal"):
+                self.mode = "config"
+                self.send("Enter configuration commands, one per line.  End with CNTL/Z.\n")
+                self.send(self.prompt())
+                return True
+            if cmd in ("wr", "write", "write memory", "copy run start"):
+                self.send("Building configuration...\n[OK]\n")
+                self.send(self.prompt())
+                return True
+            if cmd.startswith("show"):
+                self.send(self.router.show(cmd))
+            self.send(self.prompt())
+            return True
+
+        # --- mode konfigurasi --- #
+        first = cmd.split()[0]
+        if cmd in ("end", "\x1a"):
+            self.mode, self.context = "exec", None
+        elif cmd == "exit":
+            self.mode = "exec" if self.mode == "config" else "config"
+            self.context = None
+        elif first not in CONFIG_KEYWORDS:
+            self.send(f"{' ' * (len(self.prompt()) + 1)}^\n% Invalid input detected at '^' marker.\n\n")
+        elif first in ("int", "interface", "router"):
+            self.context = self.router.enter_block(_expand(cmd))
+            self.mode = "config-router" if first == "router" else "config-if"
+        else:
+            self.router.configure(self.context, cmd)
+        self.send(self.prompt())
+        return True
+
+
+class FakeIOSServer:
+    """
+    SSH server lokal yang meniru jump host (router_admin) dan router di belakangnya.
+
+    Dipakai buat benchmark / uji script device tanpa lab GNS3 :
+      - login ke jump host (paramiko, key exchange beneran)
+      - `ssh -l cisco <ip>` -> Password: -> prompt router (R1#)
+      - show command dijawab dari 03_Output/rawdata
+      - delay login / nested ssh / per command / round trip (rtt) bisa diatur
+      - `failures` {ip: n} : nested ssh ke ip itu gagal (timeout) n kali dulu, -1 = selalu gagal
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, hostname="Admin", username="cisco", password="cisco",
+                 router_list=None, login_delay=0.0, nested_delay=0.0, command_delay=0.0, rtt=0.0,
+                 rawdata_dir=RAWDATA_DIR, failures=None):
+        self.host = host
+        self.port = port
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.login_delay = login_delay
+        self.nested_delay = nested_delay
+        self.command_delay = command_delay
+        self.rtt = rtt
+        self.rawdata_dir = rawdata_dir
+        self.failures = dict(failures or {})
+
+        if router_list is None:
+            with open(ROUTER_LIST_PATH) as f:
+                router_list = json.load(f)
+        self.router_list = dict(router_list)
+        self._ip_to_name = {ip: name for name, ip in self.router_list.items()}
+        self._routers = {}
+
+        self.stats = {"connections": 0, "auth": 0, "nested": 0, "commands": 0}
+        self._lock = threading.Lock()
+        self._sock = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._host_key = paramiko.RSAKey.generate(2048)
+
+    # --- device --- #
+    def take_failure(self, ip: str) -> bool:
+        """True kalau nested ssh ke ip ini harus gagal sekarang (jatah gagal dikurangi)."""
+        with self._lock:
+            left = self.failures.get(ip, 0)
+            if left == 0:
+                return False
+            if left > 0:
+                self.failures[ip] = left - 1
+            return True
+
+    def router_for_ip(self, ip: str) -> FakeRouter:
+        with self._lock:
+            if ip not in self._routers:
+                name = self._ip_to_name.get(ip, f"R{ip.replace('.', '_')}")
+                num = int(name[1:]) if name[1:].isdigit() else 1
+                template = f"R{(num - 1) % 12 + 1}"
+                self._routers[ip] = FakeRouter(name, ip, template, self.rawdata_dir)
+            return self._routers[ip]
+
+    # --- server --- #
+    def start(self) -> int:
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((self.host, self.port))
+        self._sock.listen(1024)
+        self._sock.settimeout(0.2)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+        return self.port
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self._sock:
+            self._sock.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def admin_params(self, device_type="cisco_ios") -> dict:
+        """Parameter ConnectHandler, pengganti router_admin di script."""
+        return {
+            "device_type": device_type,
+            "host": self.host,
+            "port": self.port,
+            "username": self.username,
+            "password": self.password,
+        }
+
+    def _accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                client, _ = self._sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            threading.Thread(target=self._handle_client, args=(client,), daemon=True).start()
+
+    def _handle_client(self, client):
+        with self._lock:
+            self.stats["connections"] += 1
+        transport = paramiko.Transport(client)
+        transport.add_server_key(self._host_key)
+        iface = _ServerInterface(self)
+        try:
+            transport.start_server(server=iface)
+            # channel dijalankan dari check_channel_shell_request, di sini cuma dikuras.
+            # referensi channel disimpan, kalau kena GC paramiko langsung nutup channelnya
+            channels = []
+            while transport.is_active() and not self._stop.is_set():
+                chan = transport.accept(0.5)
+                if chan is not None:
+                    channels.append(chan)
+        except (paramiko.SSHException, EOFError, OSError):
+            pass
+        finally:
+            transport.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fake IOS jump host untuk uji lokal")
+    parser.add_argument("--port", type=int, default=2222)
+    parser.add_argument("--login-delay", type=float, default=0.0)
+    parser.add_argument("--nested-delay", type=float, default=0.0)
+    parser.add_argument("--command-delay", type=float, default=0.0)
+    parser.add_argument("--rtt", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeIOSServer(port=args.port, login_delay=args.login_delay,
+                           nested_delay=args.nested_delay, command_delay=args.command_delay, rtt=args.rtt)
+    server.start()
+    print(f"[✓] Fake IOS jump host jalan di 127.0.0.1:{server.port} (user cisco / cisco)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,314 @@
+import gc
+import os
+import hashlib
+import re
+import csv
+import json
+from sys import intern
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Ground truth skenario dalam bentuk tabel (pengganti ground_truth.txt yang teks bebas).
+#
+#   topologi,label,routers,scope
+#   2,HelloMismatch,R1 & R2,pair
+#   10,RedistributeMismatch,R2,router
+#   1,Normal,,normal
+#
+# Satu baris = satu label. scope "pair" : mismatch di link antara dua router,
+# "router" : mismatch di satu router, "normal" : topologi tanpa mismatch. Bisa disimpan
+# sebagai .csv (di atas) atau .json (list object dengan key yang sama, routers berupa list).
+#
+# ground_truth.txt tetap sumber utamanya (yang diedit tangan), tabel GT cuma turunannya :
+# dibuat lewat convert() / jalankan modul ini, sha256 ground_truth.txt asalnya disimpan di
+# <tabel>.sha256. sync() membaca tabel (tanpa regex, GroundTruth langsung punya index per
+# topologi, per pasangan router dan per router) dan membuatnya ulang dulu kalau
+# ground_truth.txt sudah berubah, jadi dua file itu tidak bisa beda isi diam-diam.
+
+COLUMNS = ["topologi", "label", "routers", "scope"]
+SCOPES = {"pair": 2, "router": 1, "normal": 0}  # scope : jumlah router
+SEP = " & "
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GT_TXT_PATH = os.path.join(ROOT_DIR, "02-0_Dataset", "ground_truth.txt")
+GT_TABLE_PATH = os.path.join(ROOT_DIR, "02-0_Dataset", "ground_truth.csv")
+
+
+class GTEntry:
+    """Satu baris tabel GT. routers : tuple nama router sesuai urutan di GT."""
+
+    __slots__ = ("topologi", "label", "routers", "scope")
+
+    def __init__(self, topologi: int, label: str, routers=(), scope: str = "pair"):
+        if scope not in SCOPES:
+            raise ValueError(f"scope '{scope}' tidak dikenal (harus {', '.join(SCOPES)})")
+        routers = tuple(routers)
+        if len(routers) != SCOPES[scope]:
+            raise ValueError(f"topologi {topologi} {label}: scope {scope} harus {SCOPES[scope]} router, "
+                             f"bukan {len(routers)} ({SEP.join(routers)})")
+        self.topologi = int(topologi)
+        self.label = label
+        self.routers = routers
+        self.scope = intern(scope)
+
+    def to_dict(self) -> dict:
+        return {"topologi": self.topologi, "label": self.label, "routers": list(self.routers), "scope": self.scope}
+
+    def __eq__(self, other):
+        return isinstance(other, GTEntry) and all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def __repr__(self):
+        return f"GTEntry({self.topologi}, {self.label!r}, {SEP.join(self.routers)!r}, {self.scope!r})"
+
+
+class GroundTruth:
+    """
+    Tabel GT + index hash (semua lookup O(1)) :
+      - by_topology[topologi]         = [GTEntry, ...]
+      - by_pair[(topologi, lo, hi)]    = {label, ...}  (lo / hi = pasangan router urut string)
+      - by_router[(topologi, router)]  = {label, ...}
+    `labels` membatasi label yang masuk index (None = semua). RouterIDMismatch pasangan
+    juga masuk by_router untuk kedua router-nya (semua adjacency router itu ikut berlabel),
+    sama dengan parse_ground_truth.
+    """
+
+    def __init__(self, entries, labels=None):
+        self.entries = list(entries)
+        self.labels = set(labels) if labels is not None else None
+        self.by_topology = defaultdict(list)
+        self.by_pair = defaultdict(set)
+        self.by_router = defaultdict(set)
+        for e in self.entries:
+            topo_id, label, routers = e.topologi, e.label, e.routers
+            self.by_topology[topo_id].append(e)
+            if self.labels is not None and label not in self.labels:
+                continue
+            if e.scope == "pair":
+                a, b = routers
+                self.by_pair[(topo_id, a, b) if a <= b else (topo_id, b, a)].add(label)
+                if label == "RouterIDMismatch":
+                    self.by_router[(topo_id, a)].add(label)
+                    self.by_router[(topo_id, b)].add(label)
+            elif e.scope == "router":
+                self.by_router[(topo_id, routers[0])].add(label)
+
+    def topologies(self) -> list:
+        return sorted(self.by_topology)
+
+    def pair_labels(self, topologi: int, router_a: str, router_b: str) -> set:
+        return self.by_pair.get((topologi, *pair_key(router_a, router_b)), set())
+
+    def router_labels(self, topologi: int, router: str) -> set:
+        return self.by_router.get((topologi, router), set())
+
+    def labels_for(self, topologi: int, router_a: str, router_b: str) -> set:
+        """Semua label GT untuk satu adjacency (label pasangan + label router_a + label router_b)."""
+        return (self.pair_labels(topologi, router_a, router_b)
+                | self.router_labels(topologi, router_a) | self.router_labels(topologi, router_b))
+
+    def pair_rules(self):
+        """Bentuk lama parse_ground_truth : pair_rules[topologi][frozenset({R1, R2})] = {label, ...}."""
+        rules = defaultdict(lambda: defaultdict(set))
+        for (topo_id, lo, hi), labels in self.by_pair.items():
+            rules[topo_id][frozenset({lo, hi})] |= labels
+        return rules
+
+    def single_rules(self):
+        """Bentuk lama parse_ground_truth : single_rules[topologi][router] = {label, ...}."""
+        rules = defaultdict(lambda: defaultdict(set))
+        for (topo_id, router), labels in self.by_router.items():
+            rules[topo_id][router] |= labels
+        return rules
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"GroundTruth({len(self.entries)} baris, {len(self.by_topology)} topologi)"
+
+
+def pair_key(router_a: str, router_b: str) -> tuple:
+    """Pasangan router tanpa arah : (R1, R2) dan (R2, R1) jadi key yang sama."""
+    return (router_a, router_b) if router_a <= router_b else (router_b, router_a)
+
+
+# === Konversi dari ground_truth.txt === #
+def parse_text(path: str):
+    """
+    Baca ground_truth.txt (format lama) jadi list GTEntry sesuai urutan di file.
+    Balikin (entries, skipped) : skipped = baris / segmen yang tidak dikenali.
+
+    Contoh GT:
+      Topologi 3  -> DeadMismatch R1 & R9
+      Topologi 10 -> RedistributeMismatch R2
+      Topologi 7  -> AuthKeyMismatch & AuthMismatch R2 & R3
+      Topologi 12 -> (HelloMismatch R1 & R2)  & (DeadMismatch R1 & R9)
+    """
+    entries, skipped = [], []
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    for line in lines:
+        # Format: "Topologi X -> ...."
+        m = re.match(r"Topologi\s+(\d+)\s*->\s*(.+)", line)
+        if not m:
+            skipped.append(line)
+            continue
+
+        topo_id = int(m.group(1))
+        desc = m.group(2).strip()
+
+        # Jika Normal, berarti tidak ada mismatch di topologi ini
+        if "Normal" in desc:
+            entries.append(GTEntry(topo_id, "Normal", (), "normal"))
+            continue
+
+        # "(A)  & (B)" atau "(A) & (B)" → beberapa segmen mismatch
+        desc = desc.replace(")  & (", ") & (")
+        desc = desc.replace(") & (", ")###(")
+        segments = [seg.strip("() ").strip() for seg in desc.split("###")]
+
+        for seg in segments:
+            if not seg or seg == "...":
+                continue
+
+            # "DeadMismatch R1 & R9" / "RedistributeMismatch R2" / "AuthKeyMismatch & AuthMismatch R2 & R3"
+            m_pair = re.search(r"(R\d+)\s*&\s*(R\d+)", seg)
+            m_single = re.search(r"(R\d+)\s*$", seg)
+            if m_pair:
+                routers, scope, label_part = m_pair.groups(), "pair", seg[:m_pair.start()]
+            elif m_single:
+                routers, scope, label_part = m_single.groups(), "router", seg[:m_single.start()]
+            else:
+                skipped.append(f"Topologi {topo_id} -> {seg}")
+                continue
+            for lbl in label_part.split("&"):
+                if lbl.strip():
+                    entries.append(GTEntry(topo_id, lbl.strip(), routers, scope))
+
+    return entries, skipped
+
+
+# === File === #
+def save(entries, path: str):
+    """Tulis tabel GT ke .json atau .csv (dari ekstensi path)."""
+    if path.endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([e.to_dict() for e in entries], f, indent=1)
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        for e in entries:
+            writer.writerow([e.topologi, e.label, SEP.join(e.routers), e.scope])
+
+
+def _rows(path: str):
+    """(nomor baris, topologi, label, routers, scope) dari file tabel GT."""
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            for i, r in enumerate(json.load(f), 1):
+                try:
+                    yield i, r["topologi"], r["label"], r["routers"], r["scope"]
+                except (KeyError, TypeError) as e:
+                    raise ValueError(f"{path}:{i}: item harus object dengan key {', '.join(COLUMNS)} ({e!r})") from None
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header != COLUMNS:
+            raise ValueError(f"{path}: header harus {','.join(COLUMNS)}, bukan {header}")
+        for i, row in enumerate(reader, 2):
+            if len(row) != len(COLUMNS):
+                raise ValueError(f"{path}:{i}: harus {len(COLUMNS)} kolom ({','.join(COLUMNS)}), bukan {len(row)}")
+            t, lbl, routers, scope = row
+            # "R1 & R2" (boleh juga "R1&R2" kalau diedit manual)
+            yield i, t, lbl, routers.replace(" ", "").split("&") if routers else (), scope
+
+
+def read_entries(path: str) -> list:
+    """Baca tabel GT (.json / .csv) jadi list GTEntry. Baris yang tidak valid → ValueError + nomor barisnya."""
+    entries = []
+    for i, topologi, label, routers, scope in _rows(path):
+        try:
+            entries.append(GTEntry(topologi, intern(label), map(intern, routers), scope))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"{path}:{i}: {e}") from None
+    return entries
+
+
+@contextmanager
+def _gc_paused():
+    """
+    GC otomatis dimatikan selama bulk load : ratusan ribu object kecil (GTEntry, tuple, set)
+    tanpa reference cycle, GC cuma bolak-balik men-scan object yang pasti masih dipakai.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def load(path: str, labels=None) -> GroundTruth:
+    """Baca tabel GT dan bangun index-nya."""
+    with _gc_paused():
+        return GroundTruth(read_entries(path), labels)
+
+
+# === Sinkron ground_truth.txt -> tabel GT === #
+def source_hash(txt_path: str) -> str:
+    with open(txt_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def stamp_path(table_path: str) -> str:
+    return table_path + ".sha256"
+
+
+def convert(txt_path: str, table_path: str):
+    """Tulis tabel GT dari ground_truth.txt + sha256 txt-nya. Balikin (entries, skipped) seperti parse_text."""
+    entries, skipped = parse_text(txt_path)
+    save(entries, table_path)
+    with open(stamp_path(table_path), "w", encoding="utf-8") as f:
+        f.write(source_hash(txt_path) + "\n")
+    return entries, skipped
+
+
+def is_stale(txt_path: str, table_path: str) -> bool:
+    """True kalau tabel GT belum ada atau bukan hasil konversi ground_truth.txt yang sekarang."""
+    try:
+        with open(stamp_path(table_path), encoding="utf-8") as f:
+            stamp = f.read().strip()
+    except FileNotFoundError:
+        return True
+    return not os.path.exists(table_path) or stamp != source_hash(txt_path)
+
+
+def sync(txt_path: str, table_path: str, labels=None):
+    """
+    GroundTruth dari tabel GT, tabel dibuat ulang dulu dari ground_truth.txt kalau
+    belum ada / sudah basi. Tanpa ground_truth.txt, tabelnya dipakai apa adanya.
+    Balikin (gt, dibuat_ulang).
+    """
+    rebuilt = os.path.exists(txt_path) and is_stale(txt_path, table_path)
+    if rebuilt:
+        convert(txt_path, table_path)
+    return load(table_path, labels), rebuilt
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Konversi sekali ground_truth.txt jadi tabel GT (.csv / .json)")
+    parser.add_argument("txt", nargs="?", default=GT_TXT_PATH)
+    parser.add_argument("out", nargs="?", default=GT_TABLE_PATH)
+    args = parser.parse_args()
+
+    entries, skipped = convert(args.txt, args.out)
+    gt = load(args.out)
+    print(f"[✓] {len(entries)} baris GT ({len(gt.by_topology)} topologi) disimpan ke {args.out}")
+    for line in skipped:
+        print(f"[!] Tidak dikenali, dilewati: {line}")
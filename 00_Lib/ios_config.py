@@ -0,0 +1,148 @@
+import re
+
+# baris running-config yang bukan konfigurasi (header, komentar, penutup)
+NON_CONFIG_RE = re.compile(r"^(Building configuration|Current configuration|!|end$|version |ntp clock-period)")
+TRAILING_PROMPT_RE = re.compile(r"^[\w.\-]+[>#]$")
+
+# "show run | section <regex>" : bisa dipotong lokal dari satu "show running-config"
+SECTION_CMD_RE = re.compile(r"^show run(?:ning-config)?\s*\|\s*s(?:ection)?\s+(.+)$")
+
+# command yang nilainya cuma satu, baris baru menggantikan baris lama
+SINGLE_VALUE = ("hostname ", "ip address ", "mtu ", "router-id ", "ip ospf hello-interval ",
+                "ip ospf dead-interval ", "ip ospf network ", "ip ospf authentication-key ")
+
+# interface logical : bisa dihapus pakai "no interface X" (subinterface "X.N" juga).
+# Interface fisik tidak bisa dihapus, cuma bisa dibalikin ke default.
+LOGICAL_INTERFACES = ("Loopback", "Tunnel", "Port-channel", "Vlan", "BVI", "Dialer", "Virtual-")
+
+
+def parse_blocks(text: str):
+    """
+    Pecah running-config jadi list blok [header, [child, ...]] sesuai urutan aslinya.
+    Child disimpan apa adanya (masih ada indentasi), baris non-config dibuang.
+    """
+    blocks = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        if not line.strip() or NON_CONFIG_RE.match(line) or TRAILING_PROMPT_RE.match(line):
+            continue
+        if line[0].isspace():
+            if blocks:
+                blocks[-1][1].append(line)
+            continue
+        blocks.append([line, []])
+    return blocks
+
+
+def render_blocks(blocks) -> str:
+    lines = []
+    for header, children in blocks:
+        lines.append(header)
+        lines.extend(children)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def section(text: str, pattern: str) -> str:
+    """
+    Tiru `show running-config | section <regex>` : blok yang header atau salah satu
+    child-nya cocok regex ditampilkan utuh.
+    """
+    regex = re.compile(pattern)
+    picked = [
+        b for b in parse_blocks(text)
+        if regex.search(b[0]) or any(regex.search(c) for c in b[1])
+    ]
+    return render_blocks(picked)
+
+
+def section_commands(commands) -> dict:
+    """{cmd: regex} untuk command `show run | section X` yang ada di `commands`."""
+    found = {}
+    for cmd in commands:
+        match = SECTION_CMD_RE.match(cmd.strip())
+        if match:
+            found[cmd] = match.group(1).strip()
+    return found
+
+
+def split_sections(output: str, patterns: dict) -> dict:
+    """
+    Potong output `show running-config` jadi output tiap `show run | section X`
+    ({cmd: regex}). Hasilnya sama persis dengan kalau command-nya dijalankan di
+    router, termasuk prompt di akhir kalau output aslinya bawa prompt.
+    """
+    last = output.rstrip("\n").rsplit("\n", 1)[-1]
+    prompt = last if TRAILING_PROMPT_RE.match(last) else ""
+    return {cmd: section(output, pattern) + prompt for cmd, pattern in patterns.items()}
+
+
+def _negate(line: str) -> str:
+    return line[3:] if line.startswith("no ") else f"no {line}"
+
+
+def _remove_block(header: str) -> str:
+    """Baris yang menghapus blok `header` : "no <header>", interface fisik -> "default interface X"."""
+    if header.startswith("interface "):
+        name = header.split()[1]
+        if "." not in name and not name.startswith(LOGICAL_INTERFACES):
+            return f"default {header}"
+    return _negate(header)
+
+
+def _restored(line: str, baseline_lines) -> bool:
+    """
+    "no X" yang kelebihan tidak perlu dinegasikan kalau baseline punya baris X / "X <nilai>"
+    yang nanti dikirim : "no shutdown" vs baseline "shutdown", "no ip address" vs baseline
+    "ip address 10.0.0.1 255.255.255.0" (negasinya "ip address" saja malah invalid).
+    """
+    if not line.startswith("no "):
+        return False
+    target = line[3:]
+    return any(b == target or b.startswith(target + " ") for b in baseline_lines)
+
+
+def config_delta(current: str, baseline: str):
+    """
+    Baris konfigurasi (untuk dikirim di `conf t`) yang mengubah running-config
+    `current` balik persis ke `baseline`.
+
+    - blok yang tidak ada di baseline   -> "no <header>" ("default interface X" untuk
+                                           interface fisik, IOS menolak "no interface" fisik)
+    - blok yang hilang dari current     -> header + semua child-nya
+    - blok yang ada di dua-duanya       -> header, "no <child>" yang kelebihan,
+                                           lalu child baseline yang hilang
+    Child "no X" yang kelebihan cuma dinegasikan jadi "X" kalau baseline tidak punya
+    baris X sendiri (baris baseline itu yang mengembalikannya).
+    """
+    cur = {h: [c.strip() for c in ch] for h, ch in parse_blocks(current)}
+    base = {h: [c.strip() for c in ch] for h, ch in parse_blocks(baseline)}
+
+    delta = []
+    for header in cur:
+        if header in base:
+            continue
+        if header.startswith(SINGLE_VALUE) and any(b.startswith(header.split()[0] + " ") for b in base):
+            continue  # diganti langsung waktu baris baseline dikirim
+        if _restored(header, base):
+            continue
+        line = _remove_block(header)
+        if line.startswith("default ") and not cur[header]:
+            continue  # interface fisik yang sudah default
+        delta.append(line)
+
+    for header, children in base.items():
+        if header not in cur:
+            delta.append(header)
+            delta.extend(f" {c}" for c in children)
+            continue
+
+        extra = [c for c in cur[header] if c not in children]
+        missing = [c for c in children if c not in cur[header]]
+        # baris single value yang nanti ditimpa baseline tidak perlu di-"no"-kan
+        extra = [c for c in extra if not any(c.startswith(p) and m.startswith(p)
+                                             for p in SINGLE_VALUE for m in missing)
+                 and not _restored(c, children)]
+        if extra or missing:
+            delta.append(header)
+            delta.extend(f" {_negate(c)}" for c in extra)
+            delta.extend(f" {c}" for c in missing)
+    return delta
@@ -0,0 +1,173 @@
+import re
+
+# Parser show command IOS versi satu-lintasan.
+#
+# Tiap output di-scan sekali oleh satu regex ter-compile (re.M) yang cuma cocok di
+# baris yang token awalnya dipedulikan parser (header interface, "Timer intervals",
+# "ip address", ...). Token itu jadi kunci tabel dispatch ke handler-nya, baris lain
+# tidak pernah nyentuh kode Python. Hasilnya sama persis dengan parser di
+# 2_Pembuatan_JSON.py (PARSER_ENGINE = "regex") untuk output IOS standar.
+
+# awalan baris header interface di "show interfaces" / "show ip ospf interface"
+INTERFACE_HEADER = r"(?:FastEthernet|GigabitEthernet|Loopback)\S*"
+
+AREA_RE = re.compile(r"Area (\d+)")
+HELLO_RE = re.compile(r"Hello (\d+)")
+DEAD_RE = re.compile(r"Dead (\d+)")
+NET_TYPE_RE = re.compile(r"Network Type (\S+)")
+
+
+def _normalize(text: str) -> str:
+    """Samakan akhir baris ke \\n (regex re.M cuma kenal \\n, splitlines kenal \\r juga)."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# === show run | section interface === #
+CONFIG_LINE_RE = re.compile(
+    r"^[ \t]*(?:(?P<intf>interface)\S*[ \t]+(?P<name>\S+)"
+    r"|(?P<token>ip address|ip ospf authentication-key|ip ospf message-digest-key|ip ospf authentication)"
+    r".*)",
+    re.M,
+)
+
+
+def _cfg_ip_address(data, line):
+    parts = line.split()
+    if len(parts) >= 4:
+        data["ip"] = parts[2]
+        data["subnet"] = parts[3]
+
+
+def _cfg_auth_key(data, line):
+    data.setdefault("ospf", {"auth_key": {}})["auth_key"] = {"simple": line.split()[-1]}
+
+
+def _cfg_md5_key(data, line):
+    parts = line.split()
+    if len(parts) >= 5:
+        data.setdefault("ospf", {"auth_key": {}})["auth_key"][parts[3]] = parts[-1]
+
+
+def _cfg_auth(data, line):
+    if "authentication-key" not in line:
+        data.setdefault("ospf", {}).setdefault("auth_key", {})
+
+
+CONFIG_DISPATCH = {
+    "ip address": _cfg_ip_address,
+    "ip ospf authentication-key": _cfg_auth_key,
+    "ip ospf message-digest-key": _cfg_md5_key,
+    "ip ospf authentication": _cfg_auth,
+}
+
+
+def parse_config_interface(config_output):
+    """Parse 'show run | section interface' → ambil IP & OSPF auth key"""
+    interfaces = {}
+    current = None
+    dispatch = CONFIG_DISPATCH
+
+    for m in CONFIG_LINE_RE.finditer(_normalize(config_output)):
+        if m.group("intf"):
+            current = interfaces[m.group("name")] = {}
+        elif current is not None:
+            dispatch[m.group("token")](current, m.group(0))
+
+    for data in interfaces.values():
+        if "ospf" in data and "auth_key" not in data["ospf"]:
+            data["ospf"]["auth_key"] = {}
+    return interfaces
+
+
+# === show interfaces === #
+INTERFACES_LINE_RE = re.compile(rf"^(?:(?P<intf>{INTERFACE_HEADER})|[ \t]+MTU (?P<mtu>\d+) bytes)", re.M)
+
+
+def parse_show_interfaces(interfaces_output):
+    """Parse 'show interfaces' → ambil MTU"""
+    mtu_data = {}
+    current_intf = None
+
+    for m in INTERFACES_LINE_RE.finditer(_normalize(interfaces_output)):
+        if m.group("intf"):
+            current_intf = m.group("intf")
+        elif current_intf:
+            mtu_data[current_intf] = int(m.group("mtu"))
+    return mtu_data
+
+
+# === show ip ospf interface === #
+OSPF_LINE_RE = re.compile(
+    rf"^(?:(?P<intf>{INTERFACE_HEADER})"
+    r"|[ \t]+(?P<token>Internet Address|Process ID|Timer intervals|"
+    r"Simple password authentication enabled|Message digest authentication enabled)(?P<rest>.*))",
+    re.M,
+)
+
+
+def _ospf_area(data, rest):
+    if "Area" in rest:
+        data["area"] = int(AREA_RE.search(rest).group(1))
+
+
+def _ospf_net_type(data, rest):
+    if "Network Type" in rest:
+        data["Network Type"] = NET_TYPE_RE.search(rest).group(1).rstrip(",").capitalize()
+
+
+def _ospf_timer(data, rest):
+    data["Hello"] = int(HELLO_RE.search(rest).group(1))
+    data["Dead"] = int(DEAD_RE.search(rest).group(1))
+
+
+def _ospf_simple(data, rest):
+    data["ospf auth"] = "simple"
+
+
+def _ospf_md5(data, rest):
+    data["ospf auth"] = "message-digest"
+
+
+OSPF_DISPATCH = {
+    "Internet Address": _ospf_area,
+    "Process ID": _ospf_net_type,
+    "Timer intervals": _ospf_timer,
+    "Simple password authentication enabled": _ospf_simple,
+    "Message digest authentication enabled": _ospf_md5,
+}
+
+
+def parse_show_ip_ospf_interface(ospf_output):
+    """Parse 'show ip ospf interface' → area, hello/dead, net type, ospf auth"""
+    ospf_data = {}
+    current = None
+    dispatch = OSPF_DISPATCH
+
+    for m in OSPF_LINE_RE.finditer(_normalize(ospf_output)):
+        if m.group("intf"):
+            current = ospf_data[m.group("intf")] = {"ospf auth": "none"}
+        elif current is not None:
+            dispatch[m.group("token")](current, m.group("rest"))
+    return ospf_data
+
+
+# === show cdp neighbor === #
+# baris tetangga diawali Device ID "R9.cisco..."
+CDP_LINE_RE = re.compile(r"^\S+\.cisco.*$", re.M)
+
+
+def parse_show_cdp_neighbor(cdp_output):
+    """Parse 'show cdp neighbor' → neighbor mapping"""
+    neighbors = {}
+    for m in CDP_LINE_RE.finditer(_normalize(cdp_output)):
+        parts = m.group(0).split()
+        local_intf = parts[1] + parts[2]    # contoh: Fas 2/0
+        port_id = parts[-2] + " " + parts[-1]  # contoh: Fas 0/1
+        if local_intf.startswith("Fas"):
+            local_intf = local_intf.replace("Fas", "FastEthernet")
+        if port_id.startswith("Fas"):
+            port_id = port_id.replace("Fas", "FastEthernet")
+        neighbors[local_intf] = {"router": parts[0].split(".")[0], "interface": port_id}
+    return neighbors
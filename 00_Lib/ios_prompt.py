@@ -0,0 +1,261 @@
+import re
+import time
+
+# prompt IOS yang dikenali di akhir output :
+#   R1#  R1>  R1(config)#  R1(config-if)#  R1(config-router)#  Password:
+PROMPT_RE = re.compile(r"(?:^|\n)([\w.\-]+(?:\(config[\w\-]*\))?[>#]|Password:) ?$")
+
+# akhiran yang kelihatan kayak prompt tapi belum pasti (konfirmasi, pertanyaan)
+AMBIGUOUS_RE = re.compile(r"(?:\[confirm\]|\?|\]:?|:) ?$")
+
+# dicatat di latency / trace sebagai ganti baris yang dikirim setelah prompt "Password:"
+PASSWORD_LABEL = "<password>"
+
+
+class PromptSession:
+    """
+    Bungkus koneksi netmiko supaya command selesai begitu prompt IOS muncul.
+
+    `send_command_timing` di sini drop-in pengganti versi netmiko : bukannya nunggu
+    timer idle (default ~2 detik per baris), baris dikirim lalu channel dibaca sampai
+    prompt dikenali. Kalau yang muncul ambigu (misal "[confirm]") atau prompt tidak
+    muncul dalam `prompt_timeout`, baru jatuh ke mode timing bawaan netmiko.
+
+    Latency tiap command dicatat di `latency` : {"cmd", "seconds", "mode"}, password
+    dicatat sebagai PASSWORD_LABEL.
+    Atribut / method lain diteruskan ke koneksi netmiko aslinya.
+    """
+
+    def __init__(self, conn, prompt_timeout: float = 10.0, poll: float = 0.005, timing_last_read: float = 2.0):
+        self.conn = conn
+        self.prompt_timeout = prompt_timeout
+        self.poll = poll
+        self.timing_last_read = timing_last_read
+        self.latency = []
+        self._awaiting_password = False
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+    def read_until_prompt(self, timeout: float = None, echo: str = ""):
+        """
+        Baca channel sampai prompt dikenali. Balikin (output, ketemu_prompt).
+        Kalau `echo` diisi, prompt baru dihitung setelah echo command itu muncul,
+        jadi prompt sisa dari command sebelumnya tidak bikin return kecepetan.
+        """
+        timeout = self.prompt_timeout if timeout is None else timeout
+        deadline = time.perf_counter() + timeout
+        out = ""
+        while time.perf_counter() < deadline:
+            chunk = self.conn.read_channel()
+            if chunk:
+                out += chunk.replace("\r\n", "\n").replace("\r", "")
+                start = out.find(echo) + len(echo) if echo else 0
+                if start >= len(echo) and PROMPT_RE.search(out[start:]):
+                    return out, True
+                continue
+            if out and AMBIGUOUS_RE.search(out):
+                return out, False
+            time.sleep(self.poll)
+        return out, False
+
+    def find_prompt(self, *args, **kwargs) -> str:
+        self.conn.read_channel()
+        self.conn.write_channel(self.conn.RETURN)
+        out, _ = self.read_until_prompt()
+        lines = out.strip().splitlines()
+        return lines[-1].strip() if lines else ""
+
+    def send_command_timing(self, command_string: str, *args, **kwargs) -> str:
+        t0 = time.perf_counter()
+        self.conn.read_channel()  # buang sisa output lama
+        self.conn.write_channel(command_string + self.conn.RETURN)
+
+        # password tidak di-echo oleh IOS
+        password = self._awaiting_password
+        echo = "" if password else command_string.strip()
+        out, found = self.read_until_prompt(echo=echo)
+        mode = "prompt"
+        if not found:
+            # prompt ambigu / tidak muncul -> tunggu idle kayak send_command_timing biasa
+            mode = "timing"
+            out += self.conn.read_channel_timing(last_read=self.timing_last_read).replace("\r\n", "\n")
+        self._awaiting_password = out.rstrip().endswith("Password:")
+
+        self.latency.append({"cmd": PASSWORD_LABEL if password else command_string,
+                             "seconds": time.perf_counter() - t0, "mode": mode})
+
+        # buang echo command di baris pertama
+        first_nl = out.find("\n")
+        if first_nl >= 0 and out[:first_nl].strip() == command_string.strip():
+            out = out[first_nl + 1:]
+        return out
+
+
+def latency_summary(records) -> str:
+    """Ringkasan latency per command dari list record PromptSession.latency"""
+    if not records:
+        return "[i] Belum ada latency command yang tercatat"
+    total = sum(r["seconds"] for r in records)
+    n_timing = sum(1 for r in records if r["mode"] == "timing")
+    slowest = max(records, key=lambda r: r["seconds"])
+    return (
+        f"[i] {len(records)} command, rata-rata {total / len(records) * 1000:.1f} ms, "
+        f"fallback timing {n_timing}x, paling lambat '{slowest['cmd']}' {slowest['seconds'] * 1000:.1f} ms"
+    )
+
+
+# pesan error IOS yang muncul di echo konfigurasi
+CONFIG_ERROR_RE = re.compile(r"^% (Invalid input detected|Incomplete command|Ambiguous command).*$", re.M)
+ECHO_RE = re.compile(r"^[\w.\-]+\(config[\w\-]*\)#(.*)$")
+EXEC_PROMPT_RE = re.compile(r"(?:^|\n)[\w.\-]+# ?$")
+
+
+def _record(conn, phase: str, label: str, seconds: float, output: str, ok: bool = True):
+    """Catat ke latency PromptSession dan ke trace (kalau sesinya TracedSession)."""
+    if hasattr(conn, "latency"):
+        conn.latency.append({"cmd": label, "seconds": seconds, "mode": "bulk" if phase == "push" else phase})
+    trace_record = getattr(conn, "trace_record", None)
+    if trace_record:
+        trace_record(phase, seconds, label, len(output), ok)
+
+
+def _read_until(conn, done, timeout: float, poll: float = 0.005, marks=None) -> str:
+    """Baca channel sampai done(out). `marks` (list) diisi (waktu, panjang output) tiap chunk datang."""
+    deadline = time.perf_counter() + timeout
+    out = ""
+    while time.perf_counter() < deadline:
+        chunk = conn.read_channel()
+        if chunk:
+            out += chunk.replace("\r\n", "\n").replace("\r", "")
+            if marks is not None:
+                marks.append((time.perf_counter(), len(out)))
+            if done(out):
+                return out
+            continue
+        time.sleep(poll)
+    raise TimeoutError(f"Output bulk config tidak selesai dalam {timeout}s, terakhir: {out[-80:]!r}")
+
+
+def config_errors(output: str):
+    """Cari baris config yang ditolak IOS dari echo output (prompt + command + pesan %)."""
+    errors = []
+    last_cmd = None
+    for line in output.splitlines():
+        echo = ECHO_RE.match(line)
+        if echo:
+            last_cmd = echo.group(1).strip()
+            continue
+        err = CONFIG_ERROR_RE.match(line.strip())
+        if err:
+            errors.append({"line": last_cmd, "error": line.strip()})
+    return errors
+
+
+def send_config_bulk(conn, lines, chunk_size: int = 0, timeout: float = 60.0):
+    """
+    Push blok konfigurasi sekaligus : `conf t` + semua baris + `end` ditulis ke
+    channel dalam satu write (atau per `chunk_size` baris), lalu output dibaca
+    sampai prompt exec (R1#) balik. Balikin (output, errors) dengan errors = baris
+    yang kena "% Invalid input" / "% Incomplete command" / "% Ambiguous command".
+    """
+    t0 = time.perf_counter()
+    lines = [line for line in lines if line.strip()]
+    size = chunk_size if chunk_size > 0 else max(len(lines), 1)
+    chunks = [lines[i:i + size] for i in range(0, len(lines), size)] or [[]]
+
+    output = ""
+    conn.read_channel()  # buang sisa output lama
+    for i, chunk in enumerate(chunks):
+        block = list(chunk)
+        if i == 0:
+            block.insert(0, "conf t")
+        last = i == len(chunks) - 1
+        if last:
+            block.append("end")
+        conn.write_channel(conn.RETURN.join(block) + conn.RETURN)
+
+        if last:
+            # prompt exec yang dihitung cuma yang muncul setelah echo "end"
+            done = lambda out: "#end\n" in out and EXEC_PROMPT_RE.search(out[out.rfind("#end\n") + 4:])  # noqa: E731
+        else:
+            # tunggu echo baris terakhir chunk + prompt config berikutnya
+            tail = chunk[-1].strip()
+            done = lambda out, tail=tail: tail in out and PROMPT_RE.search(out[out.rfind(tail):])  # noqa: E731
+        output += _read_until(conn, done, timeout)
+
+    errors = config_errors(output)
+    _record(conn, "push", f"<bulk {len(lines)} baris>", time.perf_counter() - t0, output, not errors)
+    return output, errors
+
+
+# "bulk" = seluruh config dikirim sekali write lalu dicek error-nya, "line" = per baris (cara lama)
+PUSH_MODE = "bulk"
+
+
+def send_config(conn, lines, mode: str = PUSH_MODE):
+    """Push config sesuai PUSH_MODE, balikin errors (mode "line" tidak ngecek error, selalu [])."""
+    if mode == "bulk":
+        return send_config_bulk(conn, lines)[1]
+    conn.send_command_timing("conf t")
+    for line in lines:
+        conn.send_command_timing(line)
+    conn.send_command_timing("end")
+    return []
+
+
+def send_commands_batch(conn, commands, timeout: float = 60.0) -> dict:
+    """
+    Kirim semua show command satu device dalam satu write, baca satu aliran output,
+    lalu pecah per command pakai baris echo ("R1#show ...") sebagai batas.
+    Balikin {cmd: output} dengan format sama seperti send_command(cmd, expect_string=r"#") :
+    output tanpa echo, prompt ikut di akhir.
+    """
+    t0 = time.perf_counter()
+    commands = list(commands)
+    if not commands:
+        return {}
+    last = commands[-1].strip()
+
+    conn.read_channel()  # buang sisa output lama
+    conn.write_channel(conn.RETURN.join(commands) + conn.RETURN)
+
+    def done(out):
+        pos = out.rfind(last + "\n")
+        return pos >= 0 and EXEC_PROMPT_RE.search(out[pos + len(last) + 1:])
+
+    marks = []
+    stream = _read_until(conn, done, timeout, marks=marks)
+
+    results = {}
+    ends = {}
+    pos = 0
+    for i, cmd in enumerate(commands):
+        echo = stream.find(cmd.strip() + "\n", pos)
+        if echo < 0:
+            raise ValueError(f"Echo '{cmd}' tidak ketemu di output batch")
+        start = echo + len(cmd.strip()) + 1
+        if i + 1 < len(commands):
+            nxt = re.compile(r"(?:^|\n)([\w.\-]+#)" + re.escape(commands[i + 1].strip()) + "\n")
+            match = nxt.search(stream, start - 1)
+            if not match:
+                raise ValueError(f"Echo '{commands[i + 1]}' tidak ketemu di output batch")
+            # output sampai prompt sebelum echo command berikutnya (prompt ikut)
+            body_end = match.start(1)
+            results[cmd] = stream[start:body_end] + match.group(1)
+            ends[cmd] = match.end(1)
+            pos = match.start(1)
+        else:
+            results[cmd] = stream[start:]
+            ends[cmd] = len(stream)
+
+    _record(conn, "batch", f"<batch {len(commands)} command>", time.perf_counter() - t0, stream)
+    # durasi per command di dalam batch : dari prompt command sebelumnya sampai prompt command ini muncul
+    trace_record = getattr(conn, "trace_record", None)
+    if trace_record:
+        prev = t0
+        for cmd in commands:
+            arrived = next((t for t, n in marks if n >= ends[cmd]), marks[-1][0])
+            trace_record("command", arrived - prev, cmd.strip(), len(results[cmd]))
+            prev = arrived
+    return results
@@ -0,0 +1,165 @@
+import re
+import queue
+import threading
+import concurrent.futures
+from contextlib import contextmanager
+
+from netmiko import ConnectHandler
+
+from ios_prompt import PromptSession, latency_summary
+from collect_trace import Trace, TracedSession
+
+
+# pesan IOS kalau ssh dari jump host ke router gagal
+NESTED_ERROR_RE = re.compile(r"^% (Connection timed out|Connection refused|Authentication failed|"
+                             r"Destination unreachable|Bad IP address).*$", re.M)
+
+
+def nested_ssh(conn, target_ip: str, username="cisco", password="cisco", trace: Trace = None, device=None):
+    trace = trace or Trace()
+    with trace.span("nested_connect", device, target_ip):
+        out = conn.send_command_timing(f"ssh -l {username} {target_ip}")
+    if "Password" in out:
+        with trace.span("nested_auth", device, target_ip):
+            out = conn.send_command_timing(password)
+    error = NESTED_ERROR_RE.search(out)
+    if error:
+        raise ConnectionError(f"nested ssh ke {target_ip} gagal: {error.group(0).strip()}")
+    return out
+
+
+class JumpHostPool:
+    """
+    Pool sesi SSH ke jump host (router_admin).
+
+    Login + key exchange ke jump host cuma dilakukan sekali per sesi, bukan sekali
+    per router. Tiap router dapet sesi pinjaman, nested ssh ke router target,
+    lalu balik lagi ke prompt jump host dan sesinya dipakai router berikutnya.
+
+        pool = JumpHostPool(router_admin, size=5)
+        with pool.device("100.100.100.1") as conn:
+            conn.send_command("show ip ospf interface", expect_string=r"#")
+        pool.close()
+
+    mode="prompt" : sesi yang dipinjamkan dibungkus PromptSession, jadi
+    send_command_timing (termasuk nested ssh) selesai begitu prompt IOS muncul
+    dan latency tiap command dikumpulkan di `latency`.
+    mode="timing" : perilaku netmiko biasa (nunggu timer idle tiap baris).
+
+    Durasi login jump host, nested ssh, tiap command dan push config dicatat di
+    `trace` (lihat collect_trace.Trace).
+    """
+
+    def __init__(self, admin_params: dict, size: int = 5, username="cisco", password="cisco", mode: str = "timing"):
+        if mode not in ("timing", "prompt"):
+            raise ValueError(f"mode harus 'timing' atau 'prompt', bukan {mode!r}")
+        self.admin_params = admin_params
+        self.size = size
+        self.username = username
+        self.password = password
+        self.mode = mode
+        self.latency = []
+        self.trace = Trace()
+
+        self._idle = queue.LifoQueue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+        self.stats = {"opened": 0, "reused": 0, "broken": 0}
+
+    # --- ambil / balikin sesi --- #
+    def _acquire(self):
+        self._slots.acquire()
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self.stats["reused"] += 1
+            return conn
+        except queue.Empty:
+            pass
+
+        try:
+            host = self.admin_params.get("host") or self.admin_params.get("ip")
+            with self.trace.span("connect", host=host):
+                conn = ConnectHandler(**self.admin_params)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._all.append(conn)
+            self.stats["opened"] += 1
+        return conn
+
+    def _release(self, conn, broken: bool = False):
+        if broken:
+            with self._lock:
+                self.stats["broken"] += 1
+                if conn in self._all:
+                    self._all.remove(conn)
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
+        else:
+            self._idle.put(conn)
+        self._slots.release()
+
+    def _back_to_jumphost(self, conn):
+        """Keluar dari router target sampai prompt balik ke jump host."""
+        jump_prompt = re.compile(rf"^{re.escape(conn.base_prompt)}[>#]\s*$")
+        for _ in range(3):
+            prompt = conn.find_prompt()
+            if jump_prompt.match(prompt):
+                return
+            if "(config" in prompt:
+                conn.send_command_timing("end")
+            conn.send_command_timing("exit")
+        raise RuntimeError(f"Gagal balik ke jump host, prompt terakhir: {prompt}")
+
+    @contextmanager
+    def device(self, target_ip: str, name: str = None):
+        """Pinjam satu sesi jump host yang sudah nested ssh ke target_ip (name = nama router di trace)."""
+        conn = self._acquire()
+        session = PromptSession(conn) if self.mode == "prompt" else conn
+        broken = False
+        try:
+            nested_ssh(session, target_ip, self.username, self.password, self.trace, name or target_ip)
+            yield TracedSession(session, self.trace, name or target_ip, target_ip)
+        except Exception:
+            broken = True
+            raise
+        finally:
+            if not broken:
+                try:
+                    self._back_to_jumphost(session)
+                except Exception:
+                    broken = True
+            if session is not conn:
+                with self._lock:
+                    self.latency.extend(dict(r, host=target_ip) for r in session.latency)
+            self._release(conn, broken)
+
+    def run(self, fn, router_list: dict) -> dict:
+        """Jalankan fn(router, ip) untuk semua router, paralel sebanyak `size`. Balikin {router: hasil fn}."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = {rname: executor.submit(fn, rname, ip) for rname, ip in router_list.items()}
+            return {rname: future.result() for rname, future in futures.items()}
+
+    def latency_summary(self) -> str:
+        return latency_summary(self.latency)
+
+    def close(self):
+        with self._lock:
+            conns, self._all = self._all, []
+        for conn in conns:
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+import threading
+
+
+class ParseCache:
+    """
+    Cache hasil parsing di disk, kuncinya (nama parser, versi parser, sha256 input).
+
+        cache = ParseCache(path, versions={"parse_router": "1"})
+        data = cache.get("parse_router", teks)
+        if data is None:
+            data = parse(teks)
+            cache.put("parse_router", teks, data)
+
+    Tiap entry satu file JSON di path/<2 huruf awal>/<key>.json (ditulis atomik, jadi
+    aman dipakai beberapa proses sekaligus). Versi parser ikut di kunci : kalau versi
+    di `versions` dinaikkan, entry lama tidak pernah kena lagi dan dibuang di prune().
+    Ukuran total dibatasi `max_bytes`, yang dibuang duluan yang paling lama tidak
+    dipakai (LRU, dari mtime file yang di-touch tiap hit).
+    """
+
+    def __init__(self, path: str, versions: dict, max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.versions = dict(versions)
+        self.max_bytes = max_bytes
+        self.stats = {"hit": 0, "miss": 0, "evicted": 0, "stale": 0}
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def key(self, parser: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return hashlib.sha256(f"{parser}\0{self.versions[parser]}\0{digest}".encode()).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f"{key}.json")
+
+    def get(self, parser: str, text: str):
+        """Hasil parse yang tersimpan, atau None kalau belum ada (miss)."""
+        path_entry = self._file(self.key(parser, text))
+        try:
+            with open(path_entry) as f:
+                value = json.load(f)["value"]
+            os.utime(path_entry)  # tandai baru dipakai (LRU)
+        except (FileNotFoundError, ValueError, KeyError):
+            with self._lock:
+                self.stats["miss"] += 1
+            return None
+        with self._lock:
+            self.stats["hit"] += 1
+        return value
+
+    def put(self, parser: str, text: str, value):
+        path_entry = self._file(self.key(parser, text))
+        os.makedirs(os.path.dirname(path_entry), exist_ok=True)
+        tmp = f"{path_entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"parser": parser, "version": self.versions[parser], "value": value}, f)
+        os.replace(tmp, path_entry)
+
+    def merge_stats(self, stats: dict):
+        """Tambah counter dari proses lain (worker ProcessPoolExecutor)."""
+        with self._lock:
+            for k, v in stats.items():
+                self.stats[k] += v
+
+    def prune(self):
+        """
+        Buang entry versi parser lama, lalu entry paling lama tidak dipakai sampai <= max_bytes.
+        Satu prune per cache sekaligus (lock), file yang keburu dihapus proses lain dilewati.
+        """
+        with self._lock:
+            return self._prune()
+
+    def _remove(self, path_entry: str) -> bool:
+        try:
+            os.remove(path_entry)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _prune(self):
+        entries = []
+        for sub in os.listdir(self.path):
+            folder = os.path.join(self.path, sub)
+            if not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                if not name.endswith(".json"):
+                    continue
+                path_entry = os.path.join(folder, name)
+                try:
+                    st = os.stat(path_entry)
+                    with open(path_entry) as f:
+                        meta = json.load(f)
+                except (FileNotFoundError, ValueError):
+                    continue
+                if self.versions.get(meta.get("parser")) != meta.get("version"):
+                    if self._remove(path_entry):
+                        self.stats["stale"] += 1
+                    continue
+                entries.append((st.st_mtime, st.st_size, path_entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path_entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            total -= size
+            if self._remove(path_entry):
+                self.stats["evicted"] += 1
+        return total
+
+    def summary(self) -> str:
+        s = self.stats
+        lookups = s["hit"] + s["miss"]
+        rate = s["hit"] / lookups * 100 if lookups else 0
+        return (f"[i] Parse cache: {s['hit']} hit, {s['miss']} miss ({rate:.0f}% hit), "
+                f"{s['evicted']} dibuang (LRU), {s['stale']} versi lama dibuang")
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import zlib
+import hashlib
+import threading
+from functools import lru_cache
+
+
+def is_store(path) -> bool:
+    """True kalau path adalah root RawStore (ada folder snapshots/ dan objects/)."""
+    return isinstance(path, str) and os.path.isdir(os.path.join(path, "snapshots")) \
+        and os.path.isdir(os.path.join(path, "objects"))
+
+
+def output_filename(router_name: str, cmd: str) -> str:
+    """Nama file rawdata satu (router, command), dipakai semua collector + fake_ios."""
+    return f"{router_name}_{cmd.replace(' ', '_').replace('|', '').replace('/', '')}.txt"
+
+
+@lru_cache(maxsize=4096)
+def _load_object(objects_dir: str, digest: str) -> str:
+    with open(os.path.join(objects_dir, digest[:2], digest), "rb") as f:
+        return zlib.decompress(f.read()).decode()
+
+
+class RawStore:
+    """
+    Penyimpanan rawdata per snapshot (topologi) yang content-addressed :
+
+        <root>/objects/<2 huruf>/<sha256>   isi output show command, dikompres zlib, disimpan sekali
+        <root>/snapshots/<id>.json          manifest {"routers": {router: {command: sha256}}}
+
+    Output yang sama persis di banyak snapshot cuma disimpan satu kali. Buka snapshot
+    cuma baca satu manifest kecil, isi output dibaca (dan di-cache) saat dibutuhkan.
+    """
+
+    def __init__(self, root: str, level: int = 6):
+        self.root = root
+        self.level = level
+        self.objects_dir = os.path.join(root, "objects")
+        self.snapshots_dir = os.path.join(root, "snapshots")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {"objects_written": 0, "objects_reused": 0}
+
+    # --- object --- #
+    def put(self, text: str) -> str:
+        """Simpan satu output, balikin hash-nya (tidak ditulis ulang kalau sudah ada)."""
+        data = text.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        path_obj = os.path.join(self.objects_dir, digest[:2], digest)
+        if os.path.exists(path_obj):
+            with self._lock:
+                self.stats["objects_reused"] += 1
+            return digest
+        os.makedirs(os.path.dirname(path_obj), exist_ok=True)
+        tmp = f"{path_obj}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(zlib.compress(data, self.level))
+        os.replace(tmp, path_obj)
+        with self._lock:
+            self.stats["objects_written"] += 1
+        return digest
+
+    def get(self, digest: str) -> str:
+        return _load_object(self.objects_dir, digest)
+
+    # --- snapshot --- #
+    def _manifest_path(self, snapshot_id) -> str:
+        return os.path.join(self.snapshots_dir, f"{snapshot_id}.json")
+
+    def save_snapshot(self, snapshot_id, outputs: dict) -> "Snapshot":
+        """Simpan snapshot dari {router: {command: output}}."""
+        routers = {router: {cmd: self.put(text) for cmd, text in cmds.items()} for router, cmds in outputs.items()}
+        manifest = {"id": str(snapshot_id), "created_at": time.time(), "routers": routers}
+        tmp = f"{self._manifest_path(snapshot_id)}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, self._manifest_path(snapshot_id))
+        return Snapshot(self.root, str(snapshot_id), routers)
+
+    def import_dir(self, snapshot_id, raw_dir: str, commands: dict) -> "Snapshot":
+        """
+        Simpan folder rawdata biasa (format 1_Ambil_RawData, `commands` = {command: folder})
+        sebagai snapshot. File yang tidak ada dilewati.
+        """
+        outputs = {}
+        for cmd, folder in commands.items():
+            path_folder = os.path.join(raw_dir, folder)
+            if not os.path.isdir(path_folder):
+                continue
+            suffix = output_filename("", cmd)
+            for fname in os.listdir(path_folder):
+                if fname.endswith(suffix) and len(fname) > len(suffix):
+                    with open(os.path.join(path_folder, fname)) as f:
+                        outputs.setdefault(fname[:-len(suffix)], {})[cmd] = f.read()
+        return self.save_snapshot(snapshot_id, outputs)
+
+    def snapshot(self, snapshot_id) -> "Snapshot":
+        with open(self._manifest_path(snapshot_id)) as f:
+            manifest = json.load(f)
+        return Snapshot(self.root, manifest["id"], manifest["routers"])
+
+    def snapshots(self) -> list:
+        ids = [f[:-5] for f in os.listdir(self.snapshots_dir) if f.endswith(".json")]
+        return sorted(ids, key=lambda s: (len(s), s))
+
+    def disk_usage(self) -> dict:
+        """Jumlah object + ukuran terkompres object dan manifest (byte)."""
+        n_obj = obj_bytes = 0
+        for folder, _, files in os.walk(self.objects_dir):
+            for fname in files:
+                n_obj += 1
+                obj_bytes += os.path.getsize(os.path.join(folder, fname))
+        manifest_bytes = sum(os.path.getsize(os.path.join(self.snapshots_dir, f))
+                             for f in os.listdir(self.snapshots_dir))
+        return {"objects": n_obj, "object_bytes": obj_bytes, "manifest_bytes": manifest_bytes}
+
+
+class Snapshot:
+    """
+    Satu snapshot di RawStore. Ringan (cuma path + isi manifest), jadi bisa dikirim
+    ke worker ProcessPoolExecutor. read() melempar FileNotFoundError kalau output
+    router / command itu tidak ada, sama seperti baca file rawdata biasa.
+    """
+
+    def __init__(self, root: str, snapshot_id: str, routers: dict):
+        self.root = root
+        self.id = snapshot_id
+        self.files = routers
+
+    def routers(self) -> list:
+        return sorted(self.files, key=lambda r: (len(r), r))
+
+    def read(self, router: str, cmd: str) -> str:
+        try:
+            digest = self.files[router][cmd]
+        except KeyError:
+            raise FileNotFoundError(f"snapshot {self.id}: tidak ada output '{cmd}' untuk {router}") from None
+        return _load_object(os.path.join(self.root, "objects"), digest)
+
+    def __repr__(self):
+        return f"Snapshot({self.root!r}, {self.id!r}, {len(self.files)} router)"
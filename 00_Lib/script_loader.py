@@ -0,0 +1,15 @@
+import os
+import sys
+import importlib.util
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(rel_path: str, name: str):
+    """Import script bernomor (nama file tidak valid buat `import` biasa), path relatif ke root repo."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT_DIR, rel_path))
+    module = importlib.util.module_from_spec(spec)
+    # didaftarkan di sys.modules supaya fungsinya bisa di-pickle (ProcessPoolExecutor)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,189 @@
+import os
+import json
+import bisect
+import hashlib
+import concurrent.futures
+
+from ios_prompt import latency_summary
+from collect_trace import Trace
+from jumphost import JumpHostPool
+
+# pembagian router ke jump host, lihat load_jump_hosts
+JUMP_HOSTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "01_IP_Management", "jump_hosts.json")
+
+# "prompt" = command selesai begitu prompt IOS muncul, "timing" = nunggu idle timer netmiko
+EXEC_MODE = "prompt"
+
+# parameter ConnectHandler yang boleh ada di entry jump_hosts.json (sisanya setting shard)
+CONNECT_KEYS = ("device_type", "host", "ip", "port", "username", "password", "secret")
+
+
+class HashRing:
+    """
+    Consistent hashing : tiap jump host dapet `replicas` titik di ring (md5),
+    router masuk ke titik pertama searah jarum jam dari hash namanya.
+    Nambah / ngurangin jump host cuma mindahin ~1/N router, sisanya tetap.
+    """
+
+    def __init__(self, nodes, replicas: int = 100):
+        self.replicas = replicas
+        self._ring = sorted((self._hash(f"{node}#{i}"), node) for node in nodes for i in range(replicas))
+        self._keys = [h for h, _ in self._ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int(hashlib.md5(key.encode()).hexdigest()[:16], 16)
+
+    def node_for(self, key: str) -> str:
+        if not self._ring:
+            raise ValueError("Ring kosong, belum ada jump host")
+        i = bisect.bisect(self._keys, self._hash(key)) % len(self._keys)
+        return self._ring[i][1]
+
+
+class ShardedJumpHostPool:
+    """
+    Beberapa jump host sekaligus, tiap jump host punya JumpHostPool sendiri
+    (jatah sesi / concurrency sendiri). Router dibagi ke jump host pakai :
+
+      - policy "static" : map router -> jump host dari `static_map`
+      - policy "hash"   : consistent hashing nama router (HashRing)
+
+    Router yang tidak ada di static map tetap jatuh ke hash ring. Interface-nya
+    sama dengan JumpHostPool (device, run, trace, latency_summary, close), jadi
+    script tinggal ganti objek pool-nya.
+
+        pool = ShardedJumpHostPool({"admin1": {"params": {...}, "size": 5},
+                                    "admin2": {"params": {...}, "size": 5}})
+        hasil = pool.run(ambil_data, router_list)
+    """
+
+    def __init__(self, jump_hosts: dict, policy: str = "hash", static_map: dict = None,
+                 mode: str = "timing", replicas: int = 100, username="cisco", password="cisco"):
+        if policy not in ("hash", "static"):
+            raise ValueError(f"policy harus 'hash' atau 'static', bukan {policy!r}")
+        if not jump_hosts:
+            raise ValueError("Minimal satu jump host")
+        self.policy = policy
+        self.static_map = dict(static_map or {}) if policy == "static" else {}
+        unknown = set(self.static_map.values()) - set(jump_hosts)
+        if unknown:
+            raise ValueError(f"Static map nunjuk ke jump host yang tidak ada: {sorted(unknown)}")
+
+        # satu trace buat semua shard, host di record "connect" = alamat jump host
+        self.trace = Trace()
+        self.pools = {}
+        for name, entry in jump_hosts.items():
+            pool = JumpHostPool(entry["params"], size=entry.get("size", 5),
+                                username=username, password=password, mode=mode)
+            pool.trace = self.trace
+            self.pools[name] = pool
+        self.ring = HashRing(self.pools, replicas=replicas)
+
+    # --- pembagian router --- #
+    def shard_for(self, router_name: str) -> str:
+        return self.static_map.get(router_name) or self.ring.node_for(router_name)
+
+    def plan(self, router_list: dict) -> dict:
+        """{jump host: {router: ip}} sesuai policy."""
+        shards = {name: {} for name in self.pools}
+        for rname, ip in router_list.items():
+            shards[self.shard_for(rname)][rname] = ip
+        return shards
+
+    @property
+    def size(self) -> int:
+        return sum(pool.size for pool in self.pools.values())
+
+    # --- pemakaian --- #
+    def device(self, target_ip: str, name: str = None):
+        """Sama dengan JumpHostPool.device, lewat jump host milik router `name` (atau IP-nya)."""
+        return self.pools[self.shard_for(name or target_ip)].device(target_ip, name)
+
+    def run(self, fn, router_list: dict) -> dict:
+        """
+        Jalankan fn(router, ip) untuk semua router. Tiap jump host punya executor
+        sendiri seukuran jatah sesinya, jadi shard yang lambat tidak nahan worker
+        shard lain. Balikin {router: hasil fn}.
+        """
+        executors = []
+        futures = {}
+        try:
+            for name, routers in self.plan(router_list).items():
+                if not routers:
+                    continue
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.pools[name].size)
+                executors.append(executor)
+                futures.update({rname: executor.submit(fn, rname, ip) for rname, ip in routers.items()})
+            return {rname: future.result() for rname, future in futures.items()}
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+    @property
+    def latency(self) -> list:
+        return [r for pool in self.pools.values() for r in pool.latency]
+
+    def latency_summary(self) -> str:
+        return latency_summary(self.latency)
+
+    @property
+    def stats(self) -> dict:
+        return {name: pool.stats for name, pool in self.pools.items()}
+
+    def close(self):
+        for pool in self.pools.values():
+            pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_jump_hosts(path: str, default_admin: dict, mode: str = "timing", size: int = 5) -> ShardedJumpHostPool:
+    """
+    Bikin ShardedJumpHostPool dari 01_IP_Management/jump_hosts.json :
+
+        {
+          "policy": "hash",
+          "jump_hosts": {
+            "admin1": {"max_sessions": 5},
+            "admin2": {"host": "192.168.6.101", "max_sessions": 5}
+          },
+          "static": {"R1": "admin1"}
+        }
+
+    Kredensial tidak ditulis ulang di file : tiap entry mulai dari `default_admin`
+    (router_admin di script), yang diisi di entry cuma yang beda (host lain, port, dst).
+    Kalau file-nya tidak ada, satu jump host `default_admin` dengan `size` sesi.
+    """
+    if not os.path.exists(path):
+        return ShardedJumpHostPool({"admin": {"params": default_admin, "size": size}}, mode=mode)
+
+    with open(path) as f:
+        config = json.load(f)
+    jump_hosts = {}
+    for name, entry in config["jump_hosts"].items():
+        params = dict(default_admin)
+        if "host" in entry or "ip" in entry:
+            # alamat jump host lain, jangan kecampur alamat default (netmiko dahuluin "ip")
+            params.pop("host", None)
+            params.pop("ip", None)
+        params.update({k: v for k, v in entry.items() if k in CONNECT_KEYS})
+        jump_hosts[name] = {"params": params, "size": entry.get("max_sessions", size)}
+    return ShardedJumpHostPool(jump_hosts, policy=config.get("policy", "hash"),
+                               static_map=config.get("static"), mode=mode)
+
+
+def open_jump_pool(default_admin: dict, mode: str = EXEC_MODE) -> ShardedJumpHostPool:
+    """
+    Pool jump host untuk script collect / konfig, dibuat di __main__ (bukan waktu import).
+
+    Sesi ke jump host dipakai ulang untuk semua router. Kalau 01_IP_Management/jump_hosts.json
+    berisi beberapa jump host, router dibagi ke jump host itu (static map / consistent hashing)
+    dan tiap jump host punya jatah sesi sendiri (max_sessions).
+    """
+    return load_jump_hosts(JUMP_HOSTS_PATH, default_admin, mode=mode)
@@ -0,0 +1,172 @@
+import re
+import json
+from sys import intern
+
+# Index ringkas file topologi JSON yang besar, tanpa json.load seluruh file.
+#
+# build_index() baca file per blok (BLOCK byte), jalan di object paling luar
+# {router: {...}} dan cuma nyimpen atribut level router (router_id, protocol,
+# redistribute) + posisi (offset, panjang dalam byte) tiap router dan tiap interface.
+# Isi interface dibaca lagi belakangan lewat read_span(), jadi yang dipegang di memori
+# cuma index-nya, bukan seluruh object graph topologi.
+#
+# File dibaca sebagai latin-1 (1 byte = 1 karakter) supaya posisi karakter = posisi
+# byte di file. json.dump default-nya ensure_ascii (isi file ASCII), string yang
+# berisi karakter UTF-8 mentah di-decode ulang dari byte aslinya.
+
+BLOCK = 1024 * 1024
+
+_WS = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+_scanstring = json.decoder.scanstring
+
+
+class RouterEntry:
+    """Satu router di index. interfaces : {nama interface: (offset, panjang)}."""
+
+    __slots__ = ("name", "router_id", "protocols", "redistribute", "offset", "length", "interfaces")
+
+    def __init__(self, name):
+        self.name = name
+        self.router_id = "none"
+        self.protocols = []
+        self.redistribute = False
+        self.offset = self.length = 0
+        self.interfaces = {}
+
+    def __repr__(self):
+        return f"RouterEntry({self.name!r}, {len(self.interfaces)} interface, offset={self.offset})"
+
+
+def _utf8(raw):
+    """Potongan teks latin-1 dikembalikan ke isi aslinya (UTF-8)."""
+    return raw.encode("latin-1").decode("utf-8")
+
+
+def _string(text, pos):
+    """Decode string JSON yang mulai di text[pos] ('"'), balikin (string, posisi sesudahnya)."""
+    value, end = _scanstring(text, pos + 1)
+    if not text[pos:end].isascii():  # ada karakter UTF-8 mentah (bukan escape \u)
+        value, _ = _scanstring(_utf8(text[pos:end]), 1)
+    return value, end
+
+
+def _value(text, pos):
+    """Decode satu nilai JSON yang mulai di text[pos], balikin (nilai, posisi sesudahnya)."""
+    value, end = _decoder.raw_decode(text, pos)
+    if not text[pos:end].isascii():
+        value = json.loads(_utf8(text[pos:end]))
+    return value, end
+
+
+def _ws(text, pos):
+    return _WS.match(text, pos).end()
+
+
+def _object(text, pos, on_value):
+    """
+    Jalan di object JSON yang mulai di text[pos] ("{"). on_value(key, posisi value)
+    harus balikin posisi sesudah value. Balikin posisi sesudah "}". Kalau teksnya
+    kepotong di tengah, hasilnya IndexError / ValueError (dipakai build_index buat
+    baca blok berikutnya).
+    """
+    if text[pos] != "{":
+        raise ValueError(f"harusnya object di posisi {pos}")
+    pos = _ws(text, pos + 1)
+    if text[pos] == "}":
+        return pos + 1
+    while True:
+        if text[pos] != '"':
+            raise ValueError(f"harusnya key di posisi {pos}")
+        key, pos = _string(text, pos)
+        pos = _ws(text, pos)
+        if text[pos] != ":":
+            raise ValueError(f"harusnya ':' di posisi {pos}")
+        pos = _ws(text, on_value(key, _ws(text, pos + 1)))
+        if text[pos] == "}":
+            return pos + 1
+        if text[pos] != ",":
+            raise ValueError(f"harusnya ',' atau '}}' di posisi {pos}")
+        pos = _ws(text, pos + 1)
+
+
+def _router(text, pos, base, name):
+    """Index satu router yang object-nya mulai di text[pos]. Balikin (RouterEntry, posisi sesudahnya)."""
+    entry = RouterEntry(intern(name))
+
+    def interface(intf, ipos):
+        _, end = _decoder.raw_decode(text, ipos)
+        entry.interfaces[intern(intf)] = (base + ipos, end - ipos)
+        return end
+
+    def member(key, vpos):
+        if key == "interfaces":
+            return _object(text, vpos, interface)
+        value, end = _value(text, vpos)
+        if key == "router_id":
+            entry.router_id = value
+        elif key == "routing" and isinstance(value, dict):
+            protocols = value.get("protocol", [])
+            entry.protocols = [intern(p) if isinstance(p, str) else p for p in protocols] \
+                if isinstance(protocols, list) else protocols
+            entry.redistribute = value.get("redistribute", False)
+        return end
+
+    end = _object(text, pos, member)
+    entry.offset, entry.length = base + pos, end - pos
+    return entry, end
+
+
+def build_index(path: str, block: int = BLOCK) -> dict:
+    """Pass pertama : {router: RouterEntry} sesuai urutan di file."""
+    index = {}
+    with open(path, "rb") as f:
+        text = f.read(block).decode("latin-1")
+        eof = len(text) < block
+        base = 0  # posisi byte text[0] di file
+        pos = _ws(text, 0)
+        if not text[pos:pos + 1] == "{":
+            raise ValueError(f"{path}: isi file bukan object JSON topologi")
+        pos += 1
+        first = True
+        while True:
+            try:
+                p = _ws(text, pos)
+                if text[p] == "}":
+                    break
+                if not first:
+                    if text[p] != ",":
+                        raise ValueError(f"harusnya ',' di posisi {base + p}")
+                    p = _ws(text, p + 1)
+                if text[p] != '"':
+                    raise ValueError(f"harusnya nama router di posisi {base + p}")
+                name, p = _string(text, p)
+                p = _ws(text, p)
+                if text[p] != ":":
+                    raise ValueError(f"harusnya ':' di posisi {base + p}")
+                entry, end = _router(text, _ws(text, p + 1), base, name)
+            except (IndexError, ValueError):  # termasuk UnicodeDecodeError (karakter UTF-8 kepotong)
+                if eof:
+                    raise ValueError(f"{path}: JSON topologi tidak valid sekitar byte {base + pos}") from None
+                # router ini kepotong di akhir blok : buang yang sudah selesai, baca blok berikutnya
+                chunk = f.read(block).decode("latin-1")
+                eof = len(chunk) < block
+                text = text[pos:] + chunk
+                base += pos
+                pos = 0
+                continue
+            index[entry.name] = entry
+            pos = end
+            first = False
+    return index
+
+
+def read_span(f, span):
+    """Decode satu potongan JSON (router / interface) dari file biner yang sudah dibuka."""
+    offset, length = span
+    f.seek(offset)
+    return json.loads(f.read(length))
+
+
+def read_router(f, entry: RouterEntry) -> dict:
+    return read_span(f, (entry.offset, entry.length))
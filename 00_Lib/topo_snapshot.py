@@ -0,0 +1,222 @@
+import os
+import json
+import zlib
+import struct
+from collections import Counter
+
+# Format biner ringkas untuk file topologi (pengganti topologi_<n>.json indent=4).
+#
+#   header  : b"TOPB" + versi (1 byte) + flag (1 byte, bit 0 = payload dikompres zlib)
+#   payload : satu nilai JSON, di-encode ala msgpack (tag 1 byte + isi)
+#
+# String yang sudah pernah muncul (nama key, "FastEthernet0/1", "Point_to_point", ...)
+# cuma ditulis sekali, berikutnya cukup nomor urutnya. Urutan key dict dan tipe nilai
+# (int / float / bool / null) ikut tersimpan, jadi load() hasilnya sama persis dengan
+# json.load file JSON-nya dan bisa ditulis balik jadi JSON yang sama byte per byte.
+
+MAGIC = b"TOPB"
+VERSION = 1
+FLAG_ZLIB = 1
+EXT = ".topo"
+
+# === Tag === #
+#   0x00-0x7f  int 0..127
+#   0x80-0xbf  string lama nomor 0..63
+#   0xc0 null, 0xc1 false, 0xc2 true
+#   0xc3 int (zigzag varint), 0xc4 float (8 byte), 0xc5 string baru (varint panjang),
+#   0xc6 string lama (varint nomor), 0xc7 list (varint n), 0xc8 dict (varint n)
+#   0xd0-0xdf  list 0..15 item, 0xe0-0xef dict 0..15 key, 0xf0-0xff string baru 0..15 byte
+T_NULL, T_FALSE, T_TRUE, T_INT, T_FLOAT, T_STR, T_REF, T_LIST, T_DICT = range(0xc0, 0xc9)
+FIX_REF, FIX_LIST, FIX_DICT, FIX_STR = 0x80, 0xd0, 0xe0, 0xf0
+
+_DOUBLE = struct.Struct(">d")
+
+
+def _varint(out: bytearray, n: int):
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def dumps(obj, compress: bool = False, level: int = 6) -> bytes:
+    """Encode satu nilai JSON (dict / list / str / int / float / bool / None)."""
+    out = bytearray()
+    strings = {}
+
+    def enc_str(s):
+        ref = strings.get(s)
+        if ref is not None:
+            if ref < 64:
+                out.append(FIX_REF + ref)
+            else:
+                out.append(T_REF)
+                _varint(out, ref)
+            return
+        strings[s] = len(strings)
+        data = s.encode()
+        if len(data) < 16:
+            out.append(FIX_STR + len(data))
+        else:
+            out.append(T_STR)
+            _varint(out, len(data))
+        out.extend(data)
+
+    def enc(v):
+        t = type(v)
+        if t is str:
+            enc_str(v)
+        elif t is dict:
+            if len(v) < 16:
+                out.append(FIX_DICT + len(v))
+            else:
+                out.append(T_DICT)
+                _varint(out, len(v))
+            for k, item in v.items():
+                if type(k) is not str:
+                    raise TypeError(f"key dict harus string, bukan {type(k).__name__}")
+                enc_str(k)
+                enc(item)
+        elif t is bool:
+            out.append(T_TRUE if v else T_FALSE)
+        elif t is int:
+            if 0 <= v < 128:
+                out.append(v)
+            else:
+                out.append(T_INT)
+                _varint(out, v * 2 if v >= 0 else -v * 2 - 1)
+        elif v is None:
+            out.append(T_NULL)
+        elif t is float:
+            out.append(T_FLOAT)
+            out.extend(_DOUBLE.pack(v))
+        elif t in (list, tuple):
+            if len(v) < 16:
+                out.append(FIX_LIST + len(v))
+            else:
+                out.append(T_LIST)
+                _varint(out, len(v))
+            for item in v:
+                enc(item)
+        else:
+            raise TypeError(f"tipe {t.__name__} tidak bisa disimpan ke snapshot topologi")
+
+    enc(obj)
+    payload = bytes(out)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, level)
+        flags |= FLAG_ZLIB
+    return MAGIC + bytes((VERSION, flags)) + payload
+
+
+def loads(data: bytes):
+    """Kebalikan dumps()."""
+    if data[:4] != MAGIC:
+        raise ValueError("bukan snapshot topologi biner (magic TOPB tidak ada)")
+    if data[4] != VERSION:
+        raise ValueError(f"versi snapshot {data[4]} tidak dikenal")
+    payload = zlib.decompress(data[6:]) if data[5] & FLAG_ZLIB else data[6:]
+    strings = []
+    pos = 0
+
+    def varint():
+        nonlocal pos
+        n = shift = 0
+        while True:
+            b = payload[pos]
+            pos += 1
+            n |= (b & 0x7f) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+
+    def new_str(n):
+        nonlocal pos
+        s = payload[pos:pos + n].decode()
+        pos += n
+        strings.append(s)
+        return s
+
+    def dec():
+        nonlocal pos
+        tag = payload[pos]
+        pos += 1
+        if tag < 0x80:
+            return tag
+        if tag < 0xc0:
+            return strings[tag - FIX_REF]
+        if tag >= FIX_STR:
+            return new_str(tag - FIX_STR)
+        if tag >= FIX_DICT:
+            return {dec(): dec() for _ in range(tag - FIX_DICT)}
+        if tag >= FIX_LIST:
+            return [dec() for _ in range(tag - FIX_LIST)]
+        if tag == T_NULL:
+            return None
+        if tag == T_FALSE:
+            return False
+        if tag == T_TRUE:
+            return True
+        if tag == T_INT:
+            n = varint()
+            return n >> 1 if not n & 1 else -((n + 1) >> 1)
+        if tag == T_FLOAT:
+            pos += 8
+            return _DOUBLE.unpack_from(payload, pos - 8)[0]
+        if tag == T_STR:
+            return new_str(varint())
+        if tag == T_REF:
+            return strings[varint()]
+        if tag == T_LIST:
+            return [dec() for _ in range(varint())]
+        if tag == T_DICT:
+            return {dec(): dec() for _ in range(varint())}
+        raise ValueError(f"tag {tag:#x} tidak dikenal di posisi {pos - 1}")
+
+    return dec()
+
+
+# === File === #
+def is_binary(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(4) == MAGIC
+
+
+def load(path: str):
+    """Baca file topologi, format (JSON atau biner) dideteksi dari isi file, bukan nama file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] == MAGIC:
+        return loads(data)
+    return json.loads(data)
+
+
+def save(obj, path: str, fmt: str = "json", compress: bool = False):
+    """Tulis file topologi : fmt "json" (indent=4, cara lama) atau "bin" (TOPB)."""
+    if fmt == "json":
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=4)
+    elif fmt == "bin":
+        with open(path, "wb") as f:
+            f.write(dumps(obj, compress))
+    else:
+        raise ValueError(f"format snapshot tidak dikenal: {fmt}")
+
+
+def topology_files(folder: str) -> list:
+    """
+    Nama file topologi (.json / .topo) di folder, diurutkan seperti os.listdir + sorted.
+    topologi_1.json dan topologi_1.topo sekaligus → ValueError : dua-duanya bakal ditulis
+    ke CSV yang sama dan tidak jelas mana yang terbaru, hapus salah satunya dulu.
+    """
+    files = sorted(f for f in os.listdir(folder) if f.endswith((".json", EXT)))
+    dobel = [s for s, n in Counter(os.path.splitext(f)[0] for f in files).items() if n > 1]
+    if dobel:
+        raise ValueError(f"{folder}: topologi ada dalam dua format (.json dan {EXT}): {', '.join(dobel)}")
+    return files
+
+
+def topology_id(fname: str) -> str:
+    """topologi_1.json / topologi_1.topo -> "1"."""
+    return os.path.splitext(fname)[0].split("_")[-1]
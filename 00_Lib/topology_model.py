@@ -0,0 +1,166 @@
+from sys import intern
+
+# Model data topologi yang dipakai parser (2_Pembuatan_JSON) untuk menggabungkan output
+# show command per router (parse_model). Tahap sesudahnya (converter, rule, daemon) tetap
+# jalan di dict JSON : di sana model tidak lebih cepat (build baris adjacency dari model
+# lebih lambat dari loop dict), jadi tidak dipakai.
+#
+# Semua class pakai __slots__ (tanpa __dict__ per objek) dan nama router / interface
+# di-intern, jadi "R1" atau "FastEthernet0/1" yang muncul ribuan kali cuma satu objek
+# string. Field yang tidak ada di JSON disimpan sebagai None dan tidak ikut ditulis
+# lagi oleh to_dict(), jadi JSON -> model -> JSON hasilnya sama persis.
+
+
+def _intern(value):
+    return intern(value) if isinstance(value, str) else value
+
+
+class OspfIfaceState:
+    """Bagian "ospf" satu interface. auth_key : tuple ((key_id, key), ...), None kalau tidak ada."""
+
+    __slots__ = ("auth_key", "auth", "area", "network_type", "hello", "dead", "passive")
+
+    # (atribut, key JSON) sesuai urutan key di topologi_<n>.json
+    FIELDS = (("auth", "ospf auth"), ("area", "area"), ("network_type", "Network Type"),
+              ("hello", "Hello"), ("dead", "Dead"), ("passive", "passive"))
+
+    def __init__(self, auth_key=None, auth=None, area=None, network_type=None, hello=None, dead=None, passive=None):
+        self.auth_key = auth_key
+        self.auth = auth
+        self.area = area
+        self.network_type = network_type
+        self.hello = hello
+        self.dead = dead
+        self.passive = passive
+
+    def update(self, data: dict):
+        """Isi field dari dict hasil parser "show ip ospf interface" (key JSON)."""
+        for attr, key in self.FIELDS:
+            if key in data:
+                setattr(self, attr, _intern(data[key]))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "OspfIfaceState":
+        ospf = cls()
+        if "auth_key" in data:
+            ospf.auth_key = tuple((intern(k), v) for k, v in data["auth_key"].items())
+        ospf.update(data)
+        return ospf
+
+    def to_dict(self) -> dict:
+        data = {}
+        if self.auth_key is not None:
+            data["auth_key"] = dict(self.auth_key)
+        for attr, key in self.FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = value
+        return data
+
+    def __eq__(self, other):
+        return isinstance(other, OspfIfaceState) and all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def __repr__(self):
+        return f"OspfIfaceState({', '.join(f'{a}={getattr(self, a)!r}' for a in self.__slots__ if getattr(self, a) is not None)})"
+
+
+class Interface:
+    """
+    Satu interface ber-IP. neighbor : (router, interface) dari CDP, interface-nya ditulis
+    seperti di output CDP ("FastEthernet 0/1"), peer_name versi tanpa spasi.
+    """
+
+    __slots__ = ("name", "ip", "subnet", "mtu", "ospf", "neighbor", "peer_name")
+
+    def __init__(self, name, ip=None, subnet=None, mtu=None, ospf=None, neighbor=None):
+        self.name = intern(name)
+        self.ip = ip
+        self.subnet = _intern(subnet)
+        self.mtu = mtu
+        self.ospf = ospf
+        self.set_neighbor(neighbor)
+
+    def set_neighbor(self, neighbor):
+        if neighbor is None:
+            self.neighbor = self.peer_name = None
+            return
+        router, interface = intern(neighbor[0]), intern(neighbor[1])
+        self.neighbor = (router, interface)
+        self.peer_name = intern(interface.replace(" ", ""))
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> "Interface":
+        nbr = data.get("neighbor")
+        return cls(name, data.get("ip"), data.get("subnet"), data.get("MTU"),
+                   OspfIfaceState.from_dict(data["ospf"]) if "ospf" in data else None,
+                   (nbr["router"], nbr["interface"]) if nbr else None)
+
+    def to_dict(self) -> dict:
+        data = {}
+        if self.ip is not None:
+            data["ip"] = self.ip
+        if self.subnet is not None:
+            data["subnet"] = self.subnet
+        # urutan key sama dengan parser : "ospf" yang sudah ada dari config (ada auth_key)
+        # muncul sebelum MTU, yang baru dibuat dari "show ip ospf interface" sesudahnya
+        config_ospf = self.ospf is not None and self.ospf.auth_key is not None
+        if config_ospf:
+            data["ospf"] = self.ospf.to_dict()
+        if self.mtu is not None:
+            data["MTU"] = self.mtu
+        if self.ospf is not None and not config_ospf:
+            data["ospf"] = self.ospf.to_dict()
+        if self.neighbor is not None:
+            data["neighbor"] = {"router": self.neighbor[0], "interface": self.neighbor[1]}
+        return data
+
+    def __eq__(self, other):
+        return isinstance(other, Interface) and all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def __repr__(self):
+        return f"Interface({self.name!r}, ip={self.ip!r}, ospf={self.ospf!r}, neighbor={self.neighbor!r})"
+
+
+class Router:
+    """Satu router : router-id, interface ber-IP {nama: Interface}, protokol routing + redistribute."""
+
+    __slots__ = ("name", "router_id", "interfaces", "protocols", "redistribute")
+
+    def __init__(self, name, router_id=None, interfaces=None, protocols=(), redistribute=False):
+        self.name = intern(name)
+        self.router_id = router_id
+        self.interfaces = interfaces if interfaces is not None else {}
+        self.protocols = tuple(intern(p) for p in protocols)
+        self.redistribute = redistribute
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> "Router":
+        routing = data.get("routing", {})
+        return cls(name, data.get("router_id"),
+                   {intern(i): Interface.from_dict(i, d) for i, d in data.get("interfaces", {}).items()},
+                   routing.get("protocol", []), routing.get("redistribute", False))
+
+    def to_dict(self) -> dict:
+        return {
+            "router_id": self.router_id,
+            "interfaces": {name: intf.to_dict() for name, intf in self.interfaces.items()},
+            "routing": {"protocol": list(self.protocols), "redistribute": self.redistribute},
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, Router) and all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def __repr__(self):
+        return f"Router({self.name!r}, router_id={self.router_id!r}, {len(self.interfaces)} interface)"
+
+
+# === Topologi {router: Router} === #
+def load_topology(routers: dict) -> dict:
+    """Dict JSON topologi ({router: dict}) jadi {router: Router}. Yang sudah Router dilewatkan apa adanya."""
+    return {intern(name): data if isinstance(data, Router) else Router.from_dict(name, data)
+            for name, data in routers.items()}
+
+
+def dump_topology(topology: dict) -> dict:
+    """Kebalikan load_topology : {router: Router} jadi dict JSON."""
+    return {name: router.to_dict() for name, router in topology.items()}
@@ -1,7 +1,8 @@
-from netmiko import ConnectHandler
 import os
+import sys
 import json
-import concurrent.futures
+import time
+import argparse
 
 router_admin = {
     "device_type": "cisco_ios",
@@ -12,57 +13,265 @@ router_admin = {
 
 script_dir = os.path.dirname(__file__)
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
+sys.path.insert(0, os.path.join(project_root, "00_Lib"))
+from shard import open_jump_pool  # noqa: E402
+from collect_trace import TRACE_DIR  # noqa: E402
+from ios_prompt import send_commands_batch  # noqa: E402
+from ios_config import section_commands, split_sections  # noqa: E402
+from collect_manifest import CollectManifest, PROBE_COMMAND, probe_value  # noqa: E402
+from checkpoint import Checkpoint, backoff_delay  # noqa: E402
+from raw_store import RawStore, output_filename  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
 base_dir = os.path.join(project_root, "03_Output", "rawdata")
 
 commands = {
     "show interfaces": "interfaces",
     "show ip ospf interface": "ospf",
-    "show ip protocols": "protocols",
+    "show ip protocols": "ip protocols",
     "show run | section interface": "config",
     "show run | section router ospf": "ospf_config",
+    "show cdp neighbor": "cdp",
 }
 
-for folder in set(commands.values()):
-    os.makedirs(os.path.join(base_dir, folder), exist_ok=True)
+def init_output(out_dir: str, resume: bool = False):
+    """Set folder output + manifest + checkpoint (dipakai juga oleh benchmark)."""
+    global base_dir, manifest, checkpoint
+    base_dir = out_dir
+    for folder in set(commands.values()):
+        os.makedirs(os.path.join(base_dir, folder), exist_ok=True)
+    # hash isi file per (router, command) + router yang berubah di run terakhir
+    manifest = CollectManifest(os.path.join(base_dir, "manifest.json"))
+    # unit (router, command) yang sudah selesai, buat --resume
+    checkpoint = Checkpoint(os.path.join(base_dir, "checkpoint.json"), resume=resume)
+
+init_output(base_dir)
 
 path = os.path.join(project_root, "01_IP_Management", "router_list.json")
 with open(path) as f:
     router_list = json.load(f)
 
-def nested_ssh(conn, target_ip: str, username="cisco", password="cisco"):
-    out = conn.send_command_timing(f"ssh -l {username} {target_ip}")
-    if "Password" in out:
-        out = conn.send_command_timing(password)
-    return out
+# "single" = show running-config sekali lalu dipotong lokal jadi output tiap "show run | section X",
+# "section" = tiap "show run | section X" dijalankan di router (cara lama)
+RUNCONFIG_MODE = "single"
 
-def ambil_data(router_name: str, mgmt_ip: str):
-    conn = None
-    try:
-        print(f"[+] SSH ke {router_name} ({mgmt_ip})")
-        conn = ConnectHandler(**router_admin)
+# "batch" = semua show command satu router dikirim dalam satu write lalu output dipecah per command,
+# "sequential" = satu send_command per command (cara lama)
+SHOW_MODE = "batch"
+
+# "incremental" = cek timestamp perubahan config dulu, router yang tidak berubah dilewati,
+# "full" = semua router diambil ulang. File yang isinya sama tidak ditulis ulang di dua mode.
+COLLECT_MODE = "incremental"
+
+# router yang gagal dicoba ulang sampai MAX_RETRY kali, jeda exponential backoff + jitter
+MAX_RETRY = 3
+BACKOFF_BASE = 1.0
+
+# pool jump host, dibuat di __main__ (shard.open_jump_pool)
+jump_pool = None
+
+# riwayat rawdata per topologi (content-addressed, output yang sama disimpan sekali), lihat --snapshot
+STORE_DIR = os.path.join(project_root, "03_Output", "RawStore")
+
+def simpan_snapshot(snapshot_id: str):
+    """Salin rawdata hasil collect ke RawStore sebagai snapshot `snapshot_id`."""
+    store = RawStore(STORE_DIR)
+    snap = store.import_dir(snapshot_id, base_dir, commands)
+    usage = store.disk_usage()
+    print(f"[✓] Snapshot {snap.id} ({len(snap.files)} router) disimpan : {store.stats['objects_written']} object baru, "
+          f"{store.stats['objects_reused']} dipakai ulang, total {usage['objects']} object "
+          f"({usage['object_bytes'] / 1024:.0f} KB)")
+
+# mode streaming (--stream) : output tiap router langsung di-parse (TopologyStream dari
+# 2_Pembuatan_JSON.py) begitu router itu selesai, file rawdata jadi opsional (SAVE_RAW)
+stream = None
+SAVE_RAW = True
+
+def output_path(router_name: str, cmd: str) -> str:
+    return os.path.join(base_dir, commands[cmd], output_filename(router_name, cmd))
+
+def simpan_output(router_name: str, cmd: str, result: str):
+    if not SAVE_RAW:
+        return
+    if not (result and result.strip()):
+        manifest.mark_empty(router_name, cmd)
+        return
+    path_out = output_path(router_name, cmd)
+    with jump_pool.trace.span("write", device=router_name, cmd=cmd) as info:
+        if manifest.update_file(router_name, cmd, result, path_out):
+            info["bytes"] = len(result.encode())
+
+def ambil_router(router_name: str, mgmt_ip: str, todo, outputs: dict = None):
+    """
+    Satu percobaan collect router. Unit (router, command) yang selesai langsung masuk checkpoint
+    (dan ke `outputs` {command: output} kalau diisi, buat mode streaming).
+    """
+    local = section_commands(todo) if RUNCONFIG_MODE == "single" else {}
+
+    def selesai(cmd, result):
+        simpan_output(router_name, cmd, result)
+        if outputs is not None and result and result.strip():
+            outputs[cmd] = result
+        checkpoint.mark_done(router_name, [cmd])
 
-        nested_ssh(conn, mgmt_ip)
+    with jump_pool.device(mgmt_ip, router_name) as conn:
         conn.send_command_timing("terminal length 0")
 
-        for cmd, folder in commands.items():
-            result = conn.send_command(cmd, expect_string=r"#")
-            if result and result.strip():
-                filename = f"{router_name}_{cmd.replace(' ', '_').replace('|', '').replace('/', '')}.txt"
-                path_out = os.path.join(base_dir, folder, filename)
-                with open(path_out, "w") as f:
-                    f.write(result)
+        probe = probe_value(conn.send_command(PROBE_COMMAND, expect_string=r"#"))
+        if COLLECT_MODE == "incremental" and manifest.unchanged(
+                router_name, probe, {cmd: output_path(router_name, cmd) for cmd in commands}):
+            print(f"[=] {router_name} tidak berubah, dilewati")
+            checkpoint.mark_done(router_name, todo)
+            return
 
-        conn.send_command_timing("exit")
-        print(f"[✓] Selesai: {router_name} ")
+        kirim = [cmd for cmd in todo if cmd not in local]
+        if local:
+            kirim.append("show running-config")
 
-    except Exception as e:
-        print(f"[!] Error {router_name}: {e}")
+        if SHOW_MODE == "batch":
+            hasil = send_commands_batch(conn, kirim).items()
+        else:
+            # generator : tiap command langsung disimpan begitu output-nya datang
+            hasil = ((cmd, conn.send_command(cmd, expect_string=r"#")) for cmd in kirim)
 
+        running = ""
+        for cmd, result in hasil:
+            if cmd == "show running-config":
+                running = result
+            else:
+                selesai(cmd, result)
+        for cmd, result in split_sections(running, local).items():
+            selesai(cmd, result)
+        manifest.set_probe(router_name, probe)
+
+def ambil_data(router_name: str, mgmt_ip: str) -> bool:
+    todo = checkpoint.todo(router_name, commands)
+    if not todo:
+        print(f"[=] {router_name} sudah lengkap di checkpoint, dilewati")
+        return True
+
+    # output semua percobaan dikumpulkan, percobaan ulang cuma nambah command yang belum selesai
+    outputs = {} if stream is not None else None
+    for attempt in range(1, MAX_RETRY + 2):
+        try:
+            print(f"[+] SSH ke {router_name} ({mgmt_ip})")
+            ambil_router(router_name, mgmt_ip, todo, outputs)
+            print(f"[✓] Selesai: {router_name} ")
+            if stream is not None:
+                stream.feed(router_name, outputs)
+            return True
+
+        except Exception as e:
+            # lanjut dari unit yang belum selesai aja
+            todo = checkpoint.todo(router_name, commands)
+            if attempt > MAX_RETRY:
+                checkpoint.mark_failed(router_name, str(e))
+                print(f"[!] Error {router_name}: {e} (nyerah setelah {attempt} percobaan)")
+                return False
+            delay = backoff_delay(attempt, BACKOFF_BASE)
+            print(f"[!] Error {router_name}: {e}, coba lagi dalam {delay:.1f}s ({attempt}/{MAX_RETRY})")
+            time.sleep(delay)
+
+def ambil_data_async(concurrency: int, timeout: float):
+    """Ambil data semua router pakai engine asyncio (banyak router sekaligus)."""
+    import asyncio
+    from async_collector import AsyncCollector
+
+    # hasil lewat manifest + checkpoint, sama seperti engine thread
+    def selesai(router_name, cmd, result):
+        simpan_output(router_name, cmd, result)
+        checkpoint.mark_done(router_name, [cmd])
+
+    # satu collector per jump host (shard), semua jalan bareng di satu event loop
+    collectors = []
+    for name, routers in jump_pool.plan(router_list).items():
+        if routers:
+            pool = jump_pool.pools[name]
+            collector = AsyncCollector(pool.admin_params, commands, base_dir, concurrency=concurrency,
+                                       timeout=timeout, jump_connections=min(pool.size, 4),
+                                       split_config=RUNCONFIG_MODE == "single",
+                                       save=selesai, trace=jump_pool.trace)
+            collectors.append((collector, pool, routers))
+
+    async def semua_shard():
+        hasil = await asyncio.gather(*(c.collect(routers) for c, _, routers in collectors))
+        return {rname: res for shard in hasil for rname, res in shard.items()}
+
+    results = asyncio.run(semua_shard())
+    for collector, pool, _ in collectors:
+        pool.latency.extend(collector.latency)
+    gagal = [r for r, res in results.items() if res["status"] != "ok"]
+    for rname in gagal:
+        checkpoint.mark_failed(rname, results[rname]["status"])
+    print(f"[i] {len(results) - len(gagal)}/{len(results)} router berhasil, gagal: {gagal or '-'}")
+
+def ambil_stream(topologi: str, out_dir: str = None, use_cache: bool = None):
+    """
+    Collect semua router sambil langsung parse ke topologi_<topologi>.json (tanpa tahap
+    2_Pembuatan_JSON terpisah). Balikin (file JSON, router yang tidak lengkap).
+    """
+    global stream
+    pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+    use_cache = pembuatan.PARSE_CACHE if use_cache is None else use_cache
+    stream = pembuatan.TopologyStream(pembuatan.open_cache() if use_cache else None)
+    try:
+        hasil = jump_pool.run(ambil_data, router_list)
+        output_file = stream.write(topologi, out_dir)
+        gagal = [rname for rname, ok in hasil.items() if not ok]
+        return output_file, sorted(set(stream.skipped + gagal), key=lambda r: (len(r), r))
     finally:
-        if conn:
-            conn.disconnect()
+        stream = None
 
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(ambil_data, rname, ip) for rname, ip in router_list.items()]
-        concurrent.futures.wait(futures)
+    parser = argparse.ArgumentParser(description="Ambil raw data show command dari semua router")
+    parser.add_argument("--engine", choices=["thread", "async"], default="thread",
+                        help="thread = ThreadPoolExecutor + netmiko, async = asyncio + asyncssh")
+    parser.add_argument("--concurrency", type=int, default=50, help="maks router bareng per jump host (engine async)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="batas waktu per router (engine async)")
+    parser.add_argument("--mode", choices=["incremental", "full"], default=COLLECT_MODE,
+                        help="incremental = router yang config-nya tidak berubah dilewati (engine thread)")
+    parser.add_argument("--resume", action="store_true",
+                        help="lanjut dari checkpoint, cuma (router, command) yang belum selesai (engine thread)")
+    parser.add_argument("--retry", type=int, default=MAX_RETRY, help="maks percobaan ulang per router")
+    parser.add_argument("--stream", metavar="TOPOLOGI",
+                        help="langsung parse tiap router ke topologi_<TOPOLOGI>.json selama collect (engine thread)")
+    parser.add_argument("--no-raw", action="store_true", help="mode --stream tanpa nulis file rawdata")
+    parser.add_argument("--snapshot", metavar="ID",
+                        help="simpan juga hasil collect ke 03_Output/RawStore sebagai snapshot ID (misal nomor topologi)")
+    args = parser.parse_args()
+    COLLECT_MODE = args.mode
+    MAX_RETRY = args.retry
+    if args.stream:
+        if args.engine == "async" or args.resume:
+            parser.error("--stream cuma untuk engine thread tanpa --resume")
+        # parser butuh output lengkap semua router, router yang tidak berubah tetap diambil
+        COLLECT_MODE = "full"
+        SAVE_RAW = not args.no_raw
+    init_output(base_dir, resume=args.resume)
+    jump_pool = open_jump_pool(router_admin)
+
+    t0 = time.perf_counter()
+    if args.stream:
+        output_file, skipped = ambil_stream(args.stream)
+    elif args.engine == "async":
+        ambil_data_async(args.concurrency, args.timeout)
+    else:
+        # tiap jump host jalan paralel dengan jatah sesinya sendiri
+        jump_pool.run(ambil_data, router_list)
+    jump_pool.close()
+    manifest.save()
+
+    # penutup sama untuk semua engine / mode
+    if args.stream:
+        if skipped:
+            print(f"[!] Output {', '.join(skipped)} tidak lengkap, tidak masuk JSON")
+        print(f"[✓] Data berhasil digabung ke {output_file} (collect -> JSON {time.perf_counter() - t0:.2f}s)")
+    gagal = sorted(checkpoint.data["failed"], key=lambda r: (len(r), r))
+    if gagal:
+        print(f"[!] Gagal: {', '.join(gagal)} -> jalankan lagi dengan --resume")
+    print(f"[i] Router berubah: {', '.join(manifest.data['changed']) or '-'} (manifest: {manifest.path})")
+    print(jump_pool.latency_summary())
+    print(jump_pool.trace.save(TRACE_DIR, "collect"))
+
+    if args.snapshot:
+        simpan_snapshot(args.snapshot)
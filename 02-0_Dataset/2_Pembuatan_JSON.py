@@ -1,24 +1,71 @@
 import os
 import re
+import sys
 import json
+import time
+import queue
+import argparse
+import threading
+import concurrent.futures
 
 # === Direktori input/output === #
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+import ios_parser  # noqa: E402
+from parse_cache import ParseCache  # noqa: E402
+from raw_store import RawStore, Snapshot, is_store  # noqa: E402
+from topology_model import Router, Interface, OspfIfaceState  # noqa: E402
+import topo_snapshot  # noqa: E402
+
 base_dir = os.path.join(ROOT_DIR, "03_Output", "rawdata")
 
-config_dir = os.path.join(base_dir, "config")
-interfaces_dir = os.path.join(base_dir, "interfaces")
-ospf_dir = os.path.join(base_dir, "ospf")
-ospf_config_dir = os.path.join(base_dir, "ospf_config")
-cdp_dir = os.path.join(base_dir, "cdp")
-proto_dir = os.path.join(base_dir, "ip protocols")
+# === File rawdata per router : (folder, nama file) === #
+rawdata_files = {
+    "config": ("config", "{router}_show_run__section_interface.txt"),
+    "interfaces": ("interfaces", "{router}_show_interfaces.txt"),
+    "ospf": ("ospf", "{router}_show_ip_ospf_interface.txt"),
+    "ospf_config": ("ospf_config", "{router}_show_run__section_router_ospf.txt"),
+    "cdp": ("cdp", "{router}_show_cdp_neighbor.txt"),
+    "protocols": ("ip protocols", "{router}_show_ip_protocols.txt"),
+}
+
+# === Command asal tiap jenis rawdata (kunci snapshot di RawStore) === #
+rawdata_commands = {
+    "config": "show run | section interface",
+    "interfaces": "show interfaces",
+    "ospf": "show ip ospf interface",
+    "ospf_config": "show run | section router ospf",
+    "cdp": "show cdp neighbor",
+    "protocols": "show ip protocols",
+}
 
 # === Folder output  === #
 data_json_dir = os.path.join(ROOT_DIR, "03_Output", "Data_JSON")
 os.makedirs(data_json_dir, exist_ok=True)
 
-# === Ubah nama file output manual sesuai topologi === #
-output_file = os.path.join(data_json_dir, "topologi_101.json") #! <-------------- ubah nama file topologinya disini
+# === Nomor topologi default untuk mode satu snapshot (bisa diganti lewat --topologi) === #
+TOPOLOGI = "101"
+
+# === Engine parser === #
+# "compiled" = ios_parser (satu lintasan per baris, tabel dispatch + regex ter-compile),
+# "regex" = parser di file ini (cara lama, beberapa re.match/re.search per baris)
+PARSER_ENGINE = "compiled"
+
+# === Format file topologi === #
+# "json" : topologi_<n>.json indent=4 (cara lama)
+# "bin"  : topologi_<n>.topo, format biner ringkas (00_Lib/topo_snapshot.py), COMPRESS = zlib
+OUTPUT_FORMAT = "json"
+COMPRESS = False
+
+# === Cache hasil parse per router (kunci: versi parser + sha256 isi rawdata) === #
+# naikkan PARSER_VERSION kalau logika parser berubah, entry cache lama otomatis tidak dipakai
+PARSE_CACHE = True
+PARSER_VERSION = "1"
+CACHE_MAX_MB = 64
+cache_dir = os.path.join(ROOT_DIR, "03_Output", "Cache", "parse")
+
+# === Daftar router cadangan kalau nama router tidak bisa ditebak dari file rawdata === #
+router_list_path = os.path.join(ROOT_DIR, "01_IP_Management", "router_list.json")
 
 
 # === Parser helper === #
@@ -197,83 +244,299 @@ def parse_show_ip_protocols(proto_output):
     return protocols, redistribute, router_id
 
 
-# === Main Processing === #
-def main():
+# === Parsing satu router === #
+def read_raw(router, raw_dir=None):
+    """
+    Isi semua rawdata satu router {jenis: teks}. `raw_dir` folder rawdata biasa atau
+    Snapshot dari RawStore. FileNotFoundError kalau ada yang belum ada.
+    """
+    if isinstance(raw_dir, Snapshot):
+        return {key: raw_dir.read(router, rawdata_commands[key]) for key in rawdata_files}
+    raw = {}
+    for key, (folder, fname) in rawdata_files.items():
+        with open(os.path.join(raw_dir or base_dir, folder, fname.format(router=router))) as f:
+            raw[key] = f.read()
+    return raw
+
+
+def open_cache():
+    return ParseCache(cache_dir, {"parse_router": f"{PARSER_VERSION}-{PARSER_ENGINE}"}, CACHE_MAX_MB * 1024 * 1024)
+
+
+def parse_router(router, raw_dir=None, cache=None):
+    """Baca semua file rawdata satu router lalu gabung jadi dict JSON router itu.
+    Kalau `cache` (ParseCache) diisi, router yang rawdata-nya sama persis tidak di-parse ulang."""
+    return parse_cached(read_raw(router, raw_dir), cache)
+
+
+def parse_cached(raw, cache=None):
+    """parse_raw lewat ParseCache (kalau ada)."""
+    if cache is None:
+        return parse_raw(raw)
+
+    text = "\0".join(f"{key}\0{raw[key]}" for key in rawdata_files)
+    data = cache.get("parse_router", text)
+    if data is None:
+        data = parse_raw(raw)
+        cache.put("parse_router", text, data)
+    return data
+
+
+def parse_raw(raw):
+    """Parse isi rawdata satu router ({jenis: teks}, lihat rawdata_files) jadi dict JSON router."""
+    return parse_model(raw).to_dict()
+
+
+def parse_model(raw, router="") -> Router:
+    """Parse isi rawdata satu router jadi Router (topology_model)."""
+    config_output = raw["config"]
+    interfaces_output = raw["interfaces"]
+    ospf_output = raw["ospf"]
+    ospf_config_output = raw["ospf_config"]
+    cdp_output = raw["cdp"]
+    proto_output = raw["protocols"]
+
+    # === Parsing === #
+    if PARSER_ENGINE == "compiled":
+        interfaces = ios_parser.parse_config_interface(config_output)
+        mtu_data = ios_parser.parse_show_interfaces(interfaces_output)
+        ospf_data = ios_parser.parse_show_ip_ospf_interface(ospf_output)
+        cdp_data = ios_parser.parse_show_cdp_neighbor(cdp_output)
+    else:
+        interfaces = parse_config_interface(config_output)
+        mtu_data = parse_show_interfaces(interfaces_output)
+        ospf_data = parse_show_ip_ospf_interface(ospf_output)
+        cdp_data = parse_show_cdp_neighbor(cdp_output)
+    router_id_conf, redistribute_conf, passive = parse_show_run_ospf_config(ospf_config_output)
+    protocols, redistribute_proto, router_id_proto = parse_show_ip_protocols(proto_output)
+
+    # === Gabungkan data per interface (hanya interface yg punya IP) === #
+    interfaces_clean = {}
+    for intf, data in interfaces.items():
+        if "ip" not in data:
+            continue
+        ospf = OspfIfaceState.from_dict(data["ospf"]) if "ospf" in data else None
+        if intf in ospf_data or intf in passive:
+            ospf = ospf or OspfIfaceState()
+            ospf.update(ospf_data.get(intf, {}))
+        if ospf is not None:
+            ospf.passive = intf in passive
+        nbr = cdp_data.get(intf)
+        interfaces_clean[intf] = Interface(intf, data["ip"], data.get("subnet"), mtu_data.get(intf), ospf,
+                                           (nbr["router"], nbr["interface"]) if nbr else None)
+
+    # pilih router-id & redistribute
+    return Router(router, router_id_conf or router_id_proto, interfaces_clean, protocols,
+                  redistribute_conf or redistribute_proto)
+
+
+# === Cari router & topologi === #
+def urut_router(names):
+    """R1, R2, ..., R10 (bukan R1, R10, R2)"""
+    return sorted(names, key=lambda r: (len(r), r))
+
+
+def discover_routers(raw_dir):
+    """Nama router dari file 'show interfaces' yang ada (atau isi snapshot), fallback ke router_list.json."""
+    if isinstance(raw_dir, Snapshot) and raw_dir.routers():
+        return raw_dir.routers()
+    folder, fname = rawdata_files["interfaces"]
+    suffix = fname.replace("{router}", "")
+    try:
+        found = [f[:-len(suffix)] for f in os.listdir(os.path.join(raw_dir, folder)) if f.endswith(suffix)]
+    except (FileNotFoundError, TypeError):
+        found = []
+    if found:
+        return urut_router(found)
+    with open(router_list_path) as f:
+        return list(json.load(f))
+
+
+def discover_topologies(root):
+    """
+    {nomor topologi: folder rawdata} dari sub-folder root (misal root/101, root/topologi_101).
+    Kalau root adalah RawStore : {id snapshot: Snapshot}.
+    """
+    if is_store(root):
+        store = RawStore(root)
+        return {sid: store.snapshot(sid) for sid in store.snapshots()}
+    topologies = {}
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if not os.path.isdir(path):
+            continue
+        match = re.search(r"(\d+)$", name)
+        topologies[match.group(1) if match else name] = path
+    return dict(sorted(topologies.items(), key=lambda t: (len(t[0]), t[0])))
+
+
+def parse_topology(raw_dir, cache=None):
+    """Parse semua router di satu folder rawdata. Balikin (hasil, router yang di-skip)."""
     results = {}
-    
-    for i in range(1, 13):
-        router = f"R{i}"
+    skipped = []
+    for router in discover_routers(raw_dir):
         try:
-            with open(os.path.join(config_dir, f"{router}_show_run__section_interface.txt")) as f:
-                config_output = f.read()
-
-            with open(os.path.join(interfaces_dir, f"{router}_show_interfaces.txt")) as f:
-                interfaces_output = f.read()
-
-            with open(os.path.join(ospf_dir, f"{router}_show_ip_ospf_interface.txt")) as f:
-                ospf_output = f.read()
-
-            with open(os.path.join(ospf_config_dir, f"{router}_show_run__section_router_ospf.txt")) as f:
-                ospf_config_output = f.read()
-
-            with open(os.path.join(cdp_dir, f"{router}_show_cdp_neighbor.txt")) as f:
-                cdp_output = f.read()
-
-            with open(os.path.join(proto_dir, f"{router}_show_ip_protocols.txt")) as f:
-                proto_output = f.read()
-
-            # === Parsing === #
-            interfaces = parse_config_interface(config_output)
-            mtu_data = parse_show_interfaces(interfaces_output)
-            ospf_data = parse_show_ip_ospf_interface(ospf_output)
-            router_id_conf, redistribute_conf, passive = parse_show_run_ospf_config(ospf_config_output)
-            cdp_data = parse_show_cdp_neighbor(cdp_output)
-            protocols, redistribute_proto, router_id_proto = parse_show_ip_protocols(proto_output)
-
-            # === Gabungkan data per interface === #
-            for intf, data in interfaces.items():
-                if intf in mtu_data:
-                    data["MTU"] = mtu_data[intf]
-                if intf in ospf_data:
-                    if "ospf" not in data:
-                        data["ospf"] = {}
-                    data["ospf"].update(ospf_data[intf])
-                if intf in passive:
-                    if "ospf" not in data:
-                        data["ospf"] = {}
-                    data["ospf"]["passive"] = True
-                elif "ospf" in data:
-                    data["ospf"]["passive"] = False
-                if intf in cdp_data:
-                    data["neighbor"] = cdp_data[intf]
-
-            # hanya interface yg punya IP
-            interfaces_clean = {k: v for k, v in interfaces.items() if "ip" in v}
-
-            # pilih router-id
-            router_id = router_id_conf or router_id_proto
-
-            # pilih redistribute 
-            redistribute = redistribute_conf or redistribute_proto
-
-            results[router] = {
-                "router_id": router_id,
-                "interfaces": interfaces_clean,
-                "routing": {
-                    "protocol": protocols,
-                    "redistribute": redistribute
-                }
-            }
-
+            results[router] = parse_router(router, raw_dir, cache)
         except FileNotFoundError:
-            print(f"[!] File untuk {router} tidak lengkap, skip...")
-            continue
+            skipped.append(router)
+    return results, skipped
+
+
+def write_topology(results, topologi, out_dir=None, fmt=None, compress=None) -> str:
+    """Tulis topologi_<n>.json (atau .topo kalau format "bin"), balikin path file-nya."""
+    fmt = fmt or OUTPUT_FORMAT
+    ext = topo_snapshot.EXT if fmt == "bin" else ".json"
+    output_file = os.path.join(out_dir or data_json_dir, f"topologi_{topologi}{ext}")
+    topo_snapshot.save(results, output_file, fmt, COMPRESS if compress is None else compress)
+    # snapshot topologi yang sama dari run sebelumnya dengan format lain sudah basi
+    lama = os.path.splitext(output_file)[0] + (".json" if fmt == "bin" else topo_snapshot.EXT)
+    if os.path.exists(lama):
+        os.remove(lama)
+    return output_file
+
+
+def build_topology(topologi, raw_dir, out_dir=None, use_cache=None, fmt=None, compress=None):
+    """
+    Parse satu topologi lalu tulis topologi_<n>.json. Dipanggil juga dari process pool,
+    jadi counter cache-nya ikut dibalikin : (file output, jumlah router, router di-skip, stats cache).
+    """
+    cache = open_cache() if (PARSE_CACHE if use_cache is None else use_cache) else None
+    results, skipped = parse_topology(raw_dir, cache)
+    output_file = write_topology(results, topologi, out_dir, fmt, compress)
+    return output_file, len(results), skipped, cache.stats if cache else None
+
+
+def _init_worker(parser_engine, cache_max_mb):
+    """Setting dari proses utama (argparse) buat worker process pool, jangan ngandelin fork."""
+    global PARSER_ENGINE, CACHE_MAX_MB
+    PARSER_ENGINE = parser_engine
+    CACHE_MAX_MB = cache_max_mb
+
+
+def build_batch(root, out_dir=None, workers=None, use_cache=None):
+    """Parse semua topologi di bawah root secara paralel (process pool). Balikin jumlah topologi."""
+    topologies = discover_topologies(root)
+    if not topologies:
+        print(f"[!] Tidak ada folder topologi di {root}")
+        return 0
+
+    use_cache = PARSE_CACHE if use_cache is None else use_cache
+    cache = open_cache() if use_cache else None
+    t0 = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                initargs=(PARSER_ENGINE, CACHE_MAX_MB)) as executor:
+        futures = {executor.submit(build_topology, n, path, out_dir, use_cache, OUTPUT_FORMAT, COMPRESS): n
+                   for n, path in topologies.items()}
+        for future in concurrent.futures.as_completed(futures):
+            n = futures[future]
+            try:
+                output_file, n_router, skipped, stats = future.result()
+            except Exception as e:
+                print(f"[!] Gagal topologi {n}: {e}")
+                continue
+            if cache:
+                cache.merge_stats(stats)
+            if skipped:
+                print(f"[!] Topologi {n}: file {', '.join(skipped)} tidak lengkap, skip...")
+            print(f"[✓] Topologi {n} ({n_router} router) -> {os.path.basename(output_file)}")
+    elapsed = time.perf_counter() - t0
+
+    print(f"[i] {len(topologies)} topologi dalam {elapsed:.2f}s ({len(topologies) / elapsed:.1f} topologi/s)")
+    if cache:
+        cache.prune()
+        print(cache.summary())
+    return len(topologies)
+
+
+# === Mode streaming (dipanggil dari 1_Ambil_RawData.py --stream) === #
+class TopologyStream:
+    """
+    Terima output satu router begitu selesai di-collect ({command: output}), parse di
+    thread sendiri, lalu gabung ke hasil topologi. Jadi parsing jalan bareng dengan
+    nunggu router lain, tanpa tulis/baca file rawdata dulu.
+
+        stream = TopologyStream()
+        stream.feed("R1", {"show interfaces": "...", ...})
+        ...
+        stream.write("101")
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.results = {}
+        self.skipped = []
+        self._queue = queue.Queue()
+        self._kind = {cmd: key for key, cmd in rawdata_commands.items()}
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def feed(self, router, outputs: dict):
+        self._queue.put((router, outputs))
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            router, outputs = item
+            raw = {self._kind[cmd]: text for cmd, text in outputs.items() if cmd in self._kind}
+            if len(raw) < len(rawdata_commands):
+                self.skipped.append(router)
+                continue
+            try:
+                self.results[router] = parse_cached(raw, self.cache)
+            except Exception as e:
+                print(f"[!] Gagal parse {router}: {e}")
+                self.skipped.append(router)
+
+    def close(self) -> dict:
+        """Tunggu semua router selesai di-parse, balikin hasil urut R1, R2, ..."""
+        self._queue.put(None)
+        self._thread.join()
+        return {router: self.results[router] for router in urut_router(self.results)}
+
+    def write(self, topologi, out_dir=None) -> str:
+        return write_topology(self.close(), topologi, out_dir)
 
-    with open(output_file, "w") as f:
-        json.dump(results, f, indent=4)
+
+# === Main Processing === #
+def main(topologi=TOPOLOGI, raw_dir=None, out_dir=None):
+    if is_store(raw_dir):
+        raw_dir = RawStore(raw_dir).snapshot(topologi)
+    output_file, _, skipped, stats = build_topology(topologi, raw_dir or base_dir, out_dir)
+    for router in skipped:
+        print(f"[!] File untuk {router} tidak lengkap, skip... (lengkapi dengan 1_Ambil_RawData.py --resume)")
 
     print(f"[✓] Data berhasil digabung ke {output_file}")
+    if stats:
+        cache = open_cache()
+        cache.merge_stats(stats)
+        cache.prune()
+        print(cache.summary())
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Gabung rawdata router jadi topologi_<n>.json")
+    parser.add_argument("--topologi", default=TOPOLOGI, help="nomor topologi untuk mode satu snapshot")
+    parser.add_argument("--raw", default=base_dir,
+                        help="folder rawdata untuk mode satu snapshot, atau RawStore (snapshot = --topologi)")
+    parser.add_argument("--batch", metavar="ROOT",
+                        help="folder berisi satu sub-folder rawdata per topologi (misal ROOT/1, ROOT/2, ...) "
+                             "atau RawStore (semua snapshot)")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (mode batch, default = jumlah CPU)")
+    parser.add_argument("--out", default=data_json_dir, help="folder output JSON")
+    parser.add_argument("--no-cache", action="store_true", help="parse ulang semua router tanpa parse cache")
+    parser.add_argument("--cache-size", type=int, default=CACHE_MAX_MB, help="batas ukuran parse cache (MB)")
+    parser.add_argument("--format", choices=["json", "bin"], default=OUTPUT_FORMAT,
+                        help="json = topologi_<n>.json indent=4, bin = topologi_<n>.topo (biner ringkas)")
+    parser.add_argument("--compress", action="store_true", help="kompres file .topo (zlib)")
+    args = parser.parse_args()
+    PARSE_CACHE = not args.no_cache
+    CACHE_MAX_MB = args.cache_size
+    OUTPUT_FORMAT = args.format
+    COMPRESS = args.compress
+
+    os.makedirs(args.out, exist_ok=True)
+    if args.batch:
+        sys.exit(0 if build_batch(args.batch, args.out, args.workers) else 1)
+    main(args.topologi, args.raw, args.out)
@@ -1,14 +1,31 @@
 import os
-import json
+import sys
 import csv
+import argparse
+import concurrent.futures
 
 # === Path utama === #
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+import topo_snapshot  # noqa: E402
+import topo_index  # noqa: E402
+
 input_dir = os.path.join(ROOT_DIR, "03_Output", "Data_JSON")
 output_dir = os.path.join(ROOT_DIR, "03_Output", "Data_CSV")
+cleaned_dir = os.path.join(ROOT_DIR, "03_Output", "Data_CSV_Cleaned")
+
+# === Jumlah proses untuk banyak file topologi (None = jumlah CPU, 1 = satu per satu) === #
+# default 1 : belum ada angka yang menunjukkan process pool lebih cepat
+WORKERS = 1
 
-os.makedirs(output_dir, exist_ok=True)
+# === Mode link kanonik === #
+# True : tiap link (pasangan router) cuma ditulis sekali dan baris tanpa hello OSPF dibuang
+# saat dibangun, langsung ke Data_CSV_Cleaned (hasilnya sama persis dengan 4_Cleaning_Dataset.py,
+# jadi tahap cleaning tidak perlu dijalankan). False : dua arah ke Data_CSV (cara lama).
+CANONICAL_LINKS = False
 
+# === File JSON sebesar ini (MB) ke atas dikonversi streaming (convert_stream), 0 = semua === #
+STREAM_MIN_MB = 64
 
 
 def safe_get(d, keys, default=None):
@@ -63,27 +80,13 @@ def normalize_routing_protocols(protocol_list):
     # Kasus lain (kalau nanti ada protokol tambahan): irutin pake alpabet
     return ",".join(sorted(unique))
 
-# === Proses semua file JSON === #
-for fname in sorted(os.listdir(input_dir)):
-    if not fname.endswith(".json"):
-        continue
-
-    fpath = os.path.join(input_dir, fname)
-    with open(fpath, "r") as f:
-        routers = json.load(f)
-
-    print(f"[✓] Membaca {fname} ({len(routers)} router ditemukan)")
-
+# === Baris adjacency dari satu topologi === #
+def build_rows(routers, topology_id):
+    """Buat baris dataset (satu per interface yang punya neighbor CDP) dari dict JSON topologi."""
     dataset = []
-    topology_id = fname.split("_")[-1].replace(".json", "")  # topologi_1.json → 1
-
     for r1_name, r1_data in routers.items():
         # === Data router A === #
-        router1_protocols = normalize_routing_protocols(
-            r1_data.get("routing", {}).get("protocol", [])
-        )
-        router1_id = r1_data.get("router_id", "none")
-        redis1 = r1_data.get("routing", {}).get("redistribute", False)
+        router1 = router_info(r1_data)
 
         for if1_name, if1_data in r1_data.get("interfaces", {}).items():
             if "neighbor" not in if1_data:
@@ -96,77 +99,248 @@ for fname in sorted(os.listdir(input_dir)):
             r2_data = routers[nbr_router]
 
             # === Data router B === #
-            router2_protocols = normalize_routing_protocols(
-                r2_data.get("routing", {}).get("protocol", [])
-            )
-            router2_id = r2_data.get("router_id", "none")
-            redis2 = r2_data.get("routing", {}).get("redistribute", False)
+            router2 = router_info(r2_data)
 
             # Data interface di router B
             intf2 = r2_data["interfaces"].get(nbr_intf.replace(" ", ""), {})
-            ospf1 = if1_data.get("ospf", {})
-            ospf2 = intf2.get("ospf", {})
-
-            # === Format auth_key dan auth_type === #
-            auth_key_a = format_auth_key(ospf1.get("auth_key", {}))
-            auth_key_b = format_auth_key(ospf2.get("auth_key", {}))
-            auth_type_a = ospf1.get("ospf auth", "none")
-            auth_type_b = ospf2.get("ospf auth", "none")
-
-            # === Buat baris dataset === #
-            row = {
-                "topologi": topology_id,
-
-                "router_a": r1_name,
-                "routing_a": router1_protocols,
-                "router_id_a": router1_id,
-                "redistribute_a": redis1,
-                "interface_a": if1_name,
-                "ip_a": if1_data.get("ip", "none"),
-                "subnet_a": if1_data.get("subnet", "none"),
-                "auth_key_a": auth_key_a,
-                "ospf_auth_a": auth_type_a,
-                "area_a": ospf1.get("area", "none"),
-                "network_type_a": ospf1.get("Network Type", "none"),
-                "hello_a": ospf1.get("Hello", "none"),
-                "dead_a": ospf1.get("Dead", "none"),
-                "passive_a": ospf1.get("passive", "none"),
-                "MTU_a": if1_data.get("MTU", "none"),
-                "neighbor_a": nbr_router,
-
-                "router_b": nbr_router,
-                "routing_b": router2_protocols,
-                "router_id_b": router2_id,
-                "redistribute_b": redis2,
-                "interface_b": nbr_intf,
-                "ip_b": intf2.get("ip", "none"),
-                "subnet_b": intf2.get("subnet", "none"),
-                "auth_key_b": auth_key_b,
-                "ospf_auth_b": auth_type_b,
-                "area_b": ospf2.get("area", "none"),
-                "network_type_b": ospf2.get("Network Type", "none"),
-                "hello_b": ospf2.get("Hello", "none"),
-                "dead_b": ospf2.get("Dead", "none"),
-                "passive_b": ospf2.get("passive", "none"),
-                "MTU_b": intf2.get("MTU", "none"),
-                "neighbor_b": safe_get(intf2, ["neighbor", "router"], "none")
-            }
-
-            dataset.append(row)
-
-    if len(dataset) == 0:
-        print(f"[!] Tidak ada pasangan router valid di {fname}")
-        continue
-
-    out_csv = os.path.join(
-        output_dir,
-        fname.replace("routers_", "dataset_").replace(".json", ".csv")
+            dataset.append(adjacency_row(topology_id, r1_name, router1, if1_name, if1_data,
+                                         nbr_router, router2, nbr_intf, intf2))
+
+    return dataset
+
+
+def router_info(r_data):
+    """(routing, router_id, redistribute) satu router dari dict JSON-nya."""
+    return (
+        normalize_routing_protocols(r_data.get("routing", {}).get("protocol", [])),
+        r_data.get("router_id", "none"),
+        r_data.get("routing", {}).get("redistribute", False),
     )
-    with open(out_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(dataset[0].keys()))
-        writer.writeheader()
-        writer.writerows(dataset)
 
-    print(f"[✓] Dataset dari {fname} disimpan ke {out_csv} ({len(dataset)} baris)\n")
 
-print(f"[✔] Semua file JSON telah diproses. Hasil tersimpan di folder: {output_dir}")
+def adjacency_row(topology_id, r1_name, router1, if1_name, if1_data, nbr_router, router2, nbr_intf, intf2):
+    """Satu baris dataset dari dict interface A & B (router1 / router2 dari router_info)."""
+    router1_protocols, router1_id, redis1 = router1
+    router2_protocols, router2_id, redis2 = router2
+    ospf1 = if1_data.get("ospf", {})
+    ospf2 = intf2.get("ospf", {})
+
+    # === Format auth_key dan auth_type === #
+    auth_key_a = format_auth_key(ospf1.get("auth_key", {}))
+    auth_key_b = format_auth_key(ospf2.get("auth_key", {}))
+    auth_type_a = ospf1.get("ospf auth", "none")
+    auth_type_b = ospf2.get("ospf auth", "none")
+
+    # === Buat baris dataset === #
+    return {
+        "topologi": topology_id,
+
+        "router_a": r1_name,
+        "routing_a": router1_protocols,
+        "router_id_a": router1_id,
+        "redistribute_a": redis1,
+        "interface_a": if1_name,
+        "ip_a": if1_data.get("ip", "none"),
+        "subnet_a": if1_data.get("subnet", "none"),
+        "auth_key_a": auth_key_a,
+        "ospf_auth_a": auth_type_a,
+        "area_a": ospf1.get("area", "none"),
+        "network_type_a": ospf1.get("Network Type", "none"),
+        "hello_a": ospf1.get("Hello", "none"),
+        "dead_a": ospf1.get("Dead", "none"),
+        "passive_a": ospf1.get("passive", "none"),
+        "MTU_a": if1_data.get("MTU", "none"),
+        "neighbor_a": nbr_router,
+
+        "router_b": nbr_router,
+        "routing_b": router2_protocols,
+        "router_id_b": router2_id,
+        "redistribute_b": redis2,
+        "interface_b": nbr_intf,
+        "ip_b": intf2.get("ip", "none"),
+        "subnet_b": intf2.get("subnet", "none"),
+        "auth_key_b": auth_key_b,
+        "ospf_auth_b": auth_type_b,
+        "area_b": ospf2.get("area", "none"),
+        "network_type_b": ospf2.get("Network Type", "none"),
+        "hello_b": ospf2.get("Hello", "none"),
+        "dead_b": ospf2.get("Dead", "none"),
+        "passive_b": ospf2.get("passive", "none"),
+        "MTU_b": intf2.get("MTU", "none"),
+        "neighbor_b": safe_get(intf2, ["neighbor", "router"], "none")
+    }
+
+
+# kolom CSV dataset, urutan sama dengan dict baris build_rows
+ROW_COLS = [
+    "topologi",
+    "router_a", "routing_a", "router_id_a", "redistribute_a", "interface_a", "ip_a", "subnet_a", "auth_key_a",
+    "ospf_auth_a", "area_a", "network_type_a", "hello_a", "dead_a", "passive_a", "MTU_a", "neighbor_a",
+    "router_b", "routing_b", "router_id_b", "redistribute_b", "interface_b", "ip_b", "subnet_b", "auth_key_b",
+    "ospf_auth_b", "area_b", "network_type_b", "hello_b", "dead_b", "passive_b", "MTU_b", "neighbor_b",
+]
+
+
+# === Mode streaming untuk file topologi yang sangat besar === #
+def convert_stream(fpath, out_csv, topology_id, canonical=False):
+    """
+    Konversi dua lintasan tanpa json.load seluruh file :
+    1. topo_index.build_index : atribut router + posisi tiap interface di file
+    2. baca router satu per satu, interface tetangga dibaca langsung dari posisinya
+    Baris ditulis langsung ke CSV. Balikin (jumlah baris dibangun, jumlah baris ditulis, jumlah router).
+    """
+    index = topo_index.build_index(fpath)
+    with open(fpath, "rb") as f:
+        n_built, n_written = write_rows(stream_rows(f, index, topology_id), out_csv, canonical)
+    return n_built, n_written, len(index)
+
+
+def stream_rows(f, index, topology_id):
+    """Pass kedua convert_stream : baris adjacency satu per satu dari file yang sudah di-index."""
+    info = {}
+    for r1_name, entry1 in index.items():
+        r1_data = topo_index.read_router(f, entry1)
+        router1 = router_info(r1_data)
+
+        for if1_name, if1_data in r1_data.get("interfaces", {}).items():
+            if "neighbor" not in if1_data:
+                continue
+
+            nbr_router = safe_get(if1_data, ["neighbor", "router"])
+            nbr_intf = safe_get(if1_data, ["neighbor", "interface"])
+            entry2 = index.get(nbr_router)
+            if entry2 is None:
+                continue
+            if nbr_router not in info:
+                info[nbr_router] = (normalize_routing_protocols(entry2.protocols), entry2.router_id,
+                                    entry2.redistribute)
+            span = entry2.interfaces.get(nbr_intf.replace(" ", ""))
+            intf2 = topo_index.read_span(f, span) if span else {}
+
+            yield adjacency_row(topology_id, r1_name, router1, if1_name, if1_data,
+                                nbr_router, info[nbr_router], nbr_intf, intf2)
+
+
+# === Link kanonik (pengganti 4_Cleaning_Dataset.py) === #
+# nilai hello_a yang dianggap kosong, sama dengan clean_dataset
+HELLO_KOSONG = ["none", "nan", "", "null"]
+
+
+def keep_link(row, seen: set) -> bool:
+    """
+    True kalau baris ini dipakai di mode kanonik : hello_a terisi dan pasangan router-nya
+    (tanpa arah) belum pernah muncul. Aturannya sama dengan clean_dataset : yang dipakai
+    baris pertama yang lolos, arahnya ikut baris itu.
+    """
+    hello = str(row["hello_a"]).strip().lower()
+    if hello in HELLO_KOSONG:
+        return False
+    a, b = str(row["router_a"]).strip(), str(row["neighbor_a"]).strip()
+    key = (a, b) if a <= b else (b, a)
+    if key in seen:
+        return False
+    seen.add(key)
+    row["hello_a"] = hello  # clean_dataset juga menulis ulang kolom ini (string lowercase)
+    return True
+
+
+def write_rows(rows, out_csv, canonical=False):
+    """
+    Tulis baris (iterable dict) ke CSV, format sama dengan csv.DictWriter cara lama. Mode
+    kanonik disaring keep_link dan ditulis seperti pandas to_csv di 4_Cleaning_Dataset.py
+    (akhir baris \\n, header tetap ditulis walau semua baris terbuang). File tidak dibuat
+    kalau tidak ada baris sama sekali. Balikin (jumlah baris dibangun, jumlah baris ditulis).
+    """
+    n_built = n_written = 0
+    seen = set()
+    f = writer = None
+    try:
+        for row in rows:
+            n_built += 1
+            if writer is None:
+                f = open(out_csv, "w", newline="", encoding="utf-8")
+                writer = csv.writer(f, lineterminator="\n" if canonical else "\r\n")
+                writer.writerow(ROW_COLS)
+            if canonical and not keep_link(row, seen):
+                continue
+            writer.writerow([row[c] for c in ROW_COLS])
+            n_written += 1
+    finally:
+        if f:
+            f.close()
+    return n_built, n_written
+
+
+# === Proses semua file JSON === #
+def convert_file(fpath, out_csv, topology_id, stream_min_mb=None, canonical=None):
+    """
+    Konversi satu file topologi jadi CSV. Dipanggil juga dari process pool, jadi opsinya
+    ikut dikirim. Balikin (jumlah router, baris dibangun, baris ditulis, streaming atau tidak).
+    """
+    stream_min_mb = STREAM_MIN_MB if stream_min_mb is None else stream_min_mb
+    canonical = CANONICAL_LINKS if canonical is None else canonical
+
+    # file JSON besar : dua lintasan, tanpa pegang seluruh topologi di memori
+    if os.path.getsize(fpath) >= stream_min_mb * 1024 * 1024 and not topo_snapshot.is_binary(fpath):
+        n_built, n_written, n_router = convert_stream(fpath, out_csv, topology_id, canonical)
+        return n_router, n_built, n_written, True
+
+    routers = topo_snapshot.load(fpath)
+    n_built, n_written = write_rows(build_rows(routers, topology_id), out_csv, canonical)
+    return len(routers), n_built, n_written, False
+
+
+def main(stream_min_mb=None, workers=None, canonical=None):
+    workers = WORKERS if workers is None else workers
+    canonical = CANONICAL_LINKS if canonical is None else canonical
+    out_dir = cleaned_dir if canonical else output_dir
+    os.makedirs(out_dir, exist_ok=True)
+
+    # topologi_<n>.json atau topologi_<n>.topo (biner), formatnya dideteksi dari isi file
+    jobs = []
+    for fname in topo_snapshot.topology_files(input_dir):
+        out_csv = os.path.join(
+            out_dir,
+            os.path.splitext(fname.replace("routers_", "dataset_"))[0] + ".csv"
+        )
+        topology_id = topo_snapshot.topology_id(fname)  # topologi_1.json → 1
+        jobs.append((fname, os.path.join(input_dir, fname), out_csv, topology_id))
+
+    if workers == 1 or len(jobs) <= 1:
+        results = (convert_file(fpath, out_csv, tid, stream_min_mb, canonical)
+                   for _, fpath, out_csv, tid in jobs)
+        report(jobs, results, canonical)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            n = len(jobs)
+            results = executor.map(convert_file, *zip(*[j[1:] for j in jobs]),
+                                   [stream_min_mb] * n, [canonical] * n)
+            report(jobs, results, canonical)
+
+    print(f"[✔] Semua file JSON telah diproses. Hasil tersimpan di folder: {out_dir}")
+
+
+def report(jobs, results, canonical=False):
+    """Cetak hasil tiap file sesuai urutan file."""
+    for (fname, _, out_csv, _), (n_router, n_built, n_written, streamed) in zip(jobs, results):
+        cara = " secara streaming" if streamed else ""
+        print(f"[✓] Membaca {fname}{cara} ({n_router} router ditemukan)")
+        if n_built == 0:
+            print(f"[!] Tidak ada pasangan router valid di {fname}")
+            continue
+        if canonical:
+            print(f"[–] {n_built - n_written} baris tidak ditulis (hello_a kosong / arah kebalikan link yang sama)")
+        print(f"[✓] Dataset dari {fname} disimpan ke {out_csv} ({n_written} baris)\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Konversi topologi JSON jadi dataset adjacency CSV")
+    parser.add_argument("--stream-min-mb", type=float, default=STREAM_MIN_MB,
+                        help="file JSON sebesar ini (MB) ke atas dibaca streaming dua lintasan, 0 = semua file")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="jumlah proses untuk banyak file (default 1 = satu per satu)")
+    parser.add_argument("--canonical", action="store_true", default=CANONICAL_LINKS,
+                        help="tiap link cukup satu baris + buang baris tanpa hello, langsung ke Data_CSV_Cleaned "
+                             "(pengganti 4_Cleaning_Dataset.py)")
+    args = parser.parse_args()
+    main(args.stream_min_mb, args.workers, args.canonical)
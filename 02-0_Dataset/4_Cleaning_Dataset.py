@@ -1,4 +1,8 @@
 import os
+import argparse
+import concurrent.futures
+
+import numpy as np
 import pandas as pd
 
 # === Path utama === #
@@ -8,25 +12,59 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 input_dir = os.path.join(ROOT_DIR, "03_Output", "Data_CSV")
 output_dir = os.path.join(ROOT_DIR, "03_Output", "Data_CSV_Cleaned")
 
-os.makedirs(output_dir, exist_ok=True)
+# === Engine cleaning === #
+# "vector" : hello dinormalisasi sekali per kolom, key pasangan router dari min/max
+#            kolom router_a / neighbor_a (tanpa apply per baris)
+# "apply"  : cara lama, make_pair_key + sorted() per baris lewat df.apply
+CLEAN_ENGINE = "vector"
+
+# === Cara memproses banyak file (engine vector) === #
+# "concat" : semua CSV dibaca dulu, hello + key pasangan dihitung di satu frame gabungan
+# "file"   : file satu per satu, bisa paralel pakai WORKERS proses
+BATCH_MODE = "concat"
+# jumlah proses untuk BATCH_MODE "file" (None = jumlah CPU, 1 = satu per satu)
+WORKERS = None
+
+# nilai hello yang dianggap kosong
+HELLO_KOSONG = ["none", "nan", "", "null"]
+
+
+def find_columns(df):
+    """Kolom hello_a, router_a, neighbor_a (nama tidak case-sensitive), None kalau tidak ada."""
+    col_hello = next((c for c in df.columns if c.lower() == "hello_a"), None)
+    col_router_a = next((c for c in df.columns if c.lower() == "router_a"), None)
+    col_neighbor_a = next((c for c in df.columns if c.lower() in ["neighbor_a", "neighbour_a"]), None)
+    return col_hello, col_router_a, col_neighbor_a
+
+
+def log_hello(log, col_hello, removed):
+    log(f"[–] Menghapus {removed} baris ({col_hello} kosong atau 'none')")
 
-# Cek semua file dataset csv
-for fname in sorted(os.listdir(input_dir)):
-    if not fname.endswith(".csv"):
-        continue
 
-    fpath = os.path.join(input_dir, fname)
-    df = pd.read_csv(fpath)
-    print(f"[✓] Membaca {fname} ({len(df)} baris awal)")
+def log_pairs(log, col_router_a, col_neighbor_a, removed_pairs):
+    log(
+        f"[–] Menghapus {removed_pairs} baris duplikat pasangan router "
+        f"({col_router_a} ↔ {col_neighbor_a}) yang berlawanan arah (R1-R2 vs R2-R1)"
+    )
 
+
+# === Bersihin satu dataset === #
+def clean_dataset(df, log=print, engine=None):
+    """Buang baris hello_a kosong/'none' dan pasangan router yang dobel (R1-R2 vs R2-R1)."""
+    if (engine or CLEAN_ENGINE) == "vector":
+        return clean_dataset_vector(df, log)
+    return clean_dataset_apply(df, log)
+
+
+def clean_dataset_apply(df, log=print):
+    """Cara lama : key pasangan dibuat per baris lewat df.apply."""
     # Hapus baris kalo kolom Hello_a yg isinya 'none'
     col_hello = next((c for c in df.columns if c.lower() == "hello_a"), None)
     if col_hello:
         before = len(df)
         df[col_hello] = df[col_hello].astype(str).str.strip().str.lower()
-        df = df[~df[col_hello].isin(["none", "nan", "", "null"])]
-        removed = before - len(df)
-        print(f"[–] Menghapus {removed} baris ({col_hello} kosong atau 'none')")
+        df = df[~df[col_hello].isin(HELLO_KOSONG)]
+        log_hello(log, col_hello, before - len(df))
 
     # Hapus baris yg duplikat (R1–R2 sama  R2–R1)
     col_router_a = next((c for c in df.columns if c.lower() == "router_a"), None)
@@ -48,21 +86,170 @@ for fname in sorted(os.listdir(input_dir)):
         # hapus kolom bantu
         df = df.drop(columns=["pair_key"])
 
-        removed_pairs = before - len(df)
-        print(
-            f"[–] Menghapus {removed_pairs} baris duplikat pasangan router "
-            f"({col_router_a} ↔ {col_neighbor_a}) yang berlawanan arah (R1-R2 vs R2-R1)"
-        )
+        log_pairs(log, col_router_a, col_neighbor_a, before - len(df))
     else:
-        print("[!] Kolom router_a / neighbor_a tidak ditemukan, skip penghapusan duplikat pasangan router.")
+        log("[!] Kolom router_a / neighbor_a tidak ditemukan, skip penghapusan duplikat pasangan router.")
 
     # Reset index
-    df = df.reset_index(drop=True)
+    return df.reset_index(drop=True)
+
+
+def per_unique(col, fn):
+    """
+    Operasi string kolom (fn) cukup dijalankan di nilai uniknya, hasilnya disebar lagi
+    ke semua baris. Nama router / nilai hello cuma sedikit variasinya, jadi ini jauh lebih
+    cepat dari .str.strip() di seluruh kolom (yang tetap jalan per elemen di Python).
+    """
+    codes, uniq = pd.factorize(col, use_na_sentinel=False)
+    return fn(pd.Series(uniq, dtype=col.dtype)).take(codes).set_axis(col.index)
+
+
+def hello_values(col):
+    """Kolom hello versi bersih, sama dengan cara lama (astype(str) + strip + lower)."""
+    return per_unique(col.astype(str), lambda s: s.str.strip().str.lower())
+
+
+def router_values(col):
+    """Kolom router sebagai array string, sama dengan str(nilai).strip() per baris."""
+    return per_unique(col.astype(str).fillna("nan"), lambda s: s.str.strip()).to_numpy(dtype=object)
+
+
+def pair_keys(a, b):
+    """
+    Key pasangan tanpa arah per baris (nomor int), key sama = "||".join(sorted([a, b])) sama.
+    Nama router diberi peringkat urutan string sekali, min/max peringkatnya per kolom jadi
+    (lo, hi), string "lo||hi" cuma dibuat untuk pasangan yang unik.
+    """
+    n = len(a)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    codes, names = pd.factorize(np.concatenate([a, b]))
+    order = np.argsort(names.astype(object))
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    ra, rb = rank[codes[:n]], rank[codes[n:]]
+    m = len(order)
+    pair_codes, pairs = pd.factorize(np.minimum(ra, rb) * m + np.maximum(ra, rb))
+    sorted_names = names.astype(object)[order]
+    keys = sorted_names[pairs // m] + "||" + sorted_names[pairs % m]
+    return pd.factorize(keys)[0][pair_codes]
 
+
+def clean_dataset_vector(df, log=print):
+    """clean_dataset tanpa apply per baris, hasil sama persis dengan cara lama."""
+    col_hello, col_router_a, col_neighbor_a = find_columns(df)
+    if col_hello:
+        hello = hello_values(df[col_hello])
+        keep = ~hello.isin(HELLO_KOSONG).to_numpy()
+        df = df.assign(**{col_hello: hello})[keep]
+        log_hello(log, col_hello, int((~keep).sum()))
+
+    if col_router_a and col_neighbor_a:
+        keys = pair_keys(router_values(df[col_router_a]), router_values(df[col_neighbor_a]))
+        dup = pd.Series(keys).duplicated(keep="first").to_numpy()
+        df = df[~dup]
+        log_pairs(log, col_router_a, col_neighbor_a, int(dup.sum()))
+    else:
+        log("[!] Kolom router_a / neighbor_a tidak ditemukan, skip penghapusan duplikat pasangan router.")
+
+    return df.reset_index(drop=True)
+
+
+def clean_concat(frames: dict, logs: dict) -> dict:
+    """
+    Bersihin banyak dataset sekaligus ({nama file: df}) : hello + key pasangan dihitung
+    di satu frame gabungan (key ditambah nomor file, jadi duplikat cuma dicari di file yang
+    sama). Tiap file tetap dipotong dari df aslinya, jadi tipe kolom tidak berubah.
+    File yang kolomnya tidak lengkap dibersihkan sendiri-sendiri. logs : {nama file: list pesan}.
+    """
+    hasil = {}
+    names = []
+    for fname, df in frames.items():
+        if None in find_columns(df):
+            hasil[fname] = clean_dataset_vector(df, logs[fname].append)
+        else:
+            names.append(fname)
+    if not names:
+        return hasil
+
+    parts = [frames[f] for f in names]
+    cols = [find_columns(df) for df in parts]
+    sizes = np.array([len(df) for df in parts])
+    file_no = np.repeat(np.arange(len(parts)), sizes)
+
+    # astype(str) per file dulu (tipe hasil read_csv bisa beda antar file), sisanya sekali jalan
+    hello = hello_values(pd.concat([df[c[0]].astype(str) for df, c in zip(parts, cols)], ignore_index=True))
+    keep = ~hello.isin(HELLO_KOSONG).to_numpy()
+    a = router_values(pd.concat([df[c[1]].astype(str) for df, c in zip(parts, cols)], ignore_index=True))
+    b = router_values(pd.concat([df[c[2]].astype(str) for df, c in zip(parts, cols)], ignore_index=True))
+    keys = pd.DataFrame({"file": file_no, "key": pair_keys(a, b)})
+    dup = np.zeros(len(keys), dtype=bool)
+    dup[keep] = keys[keep].duplicated(keep="first").to_numpy()
+
+    n_hello = np.bincount(file_no, weights=~keep, minlength=len(parts)).astype(int)
+    n_dup = np.bincount(file_no, weights=dup, minlength=len(parts)).astype(int)
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    for i, (fname, df, (col_hello, col_router_a, col_neighbor_a)) in enumerate(zip(names, parts, cols)):
+        lo, hi = bounds[i], bounds[i + 1]
+        rows = keep[lo:hi] & ~dup[lo:hi]
+        df = df.assign(**{col_hello: hello.iloc[lo:hi].set_axis(df.index)})
+        hasil[fname] = df[rows].reset_index(drop=True)
+        log_hello(logs[fname].append, col_hello, n_hello[i])
+        log_pairs(logs[fname].append, col_router_a, col_neighbor_a, n_dup[i])
+    return hasil
+
+
+def clean_file(fname, engine=None):
+    """Baca, bersihin dan simpan satu file. Dipanggil juga dari process pool. Balikin (baris awal, pesan log, baris akhir)."""
+    df = pd.read_csv(os.path.join(input_dir, fname))
+    logs = []
+    n_awal = len(df)
+    df = clean_dataset(df, logs.append, engine)
     # Simpan ke folder Data_CSV_Cleaned
-    out_path = os.path.join(output_dir, fname)
-    df.to_csv(out_path, index=False)
+    df.to_csv(os.path.join(output_dir, fname), index=False)
+    return n_awal, logs, len(df)
+
+
+def report(fname, n_awal, logs, n_akhir):
+    print(f"[✓] Membaca {fname} ({n_awal} baris awal)")
+    for msg in logs:
+        print(msg)
+    print(f"[✓] File {fname} disimpan ke Data_CSV_Cleaned ({n_akhir} baris)\n")
+
+
+# Cek semua file dataset csv
+def main(engine=None, mode=None, workers=None):
+    engine = engine or CLEAN_ENGINE
+    mode = mode or BATCH_MODE
+    workers = WORKERS if workers is None else workers
+    os.makedirs(output_dir, exist_ok=True)
+    files = [f for f in sorted(os.listdir(input_dir)) if f.endswith(".csv")]
+
+    if engine == "vector" and mode == "concat":
+        frames = {fname: pd.read_csv(os.path.join(input_dir, fname)) for fname in files}
+        logs = {fname: [] for fname in files}
+        hasil = clean_concat(frames, logs)
+        for fname in files:
+            hasil[fname].to_csv(os.path.join(output_dir, fname), index=False)
+            report(fname, len(frames[fname]), logs[fname], len(hasil[fname]))
+    elif workers == 1 or len(files) <= 1:
+        for fname in files:
+            report(fname, *clean_file(fname, engine))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            for fname, res in zip(files, executor.map(clean_file, files, [engine] * len(files))):
+                report(fname, *res)
+
+    print(f"[✔] Semua dataset selesai dibersihkan dan tersimpan di folder: {output_dir}")
 
-    print(f"[✓] File {fname} disimpan ke Data_CSV_Cleaned ({len(df)} baris)\n")
 
-print(f"[✔] Semua dataset selesai dibersihkan dan tersimpan di folder: {output_dir}")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cleaning dataset CSV (hello kosong + pasangan router dobel)")
+    parser.add_argument("--engine", choices=["vector", "apply"], default=CLEAN_ENGINE,
+                        help="vector = key pasangan dari min/max kolom, apply = cara lama (per baris)")
+    parser.add_argument("--mode", choices=["concat", "file"], default=BATCH_MODE,
+                        help="concat = semua file di satu frame gabungan, file = satu per satu / paralel")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="jumlah proses untuk --mode file (default = jumlah CPU, 1 = satu per satu)")
+    args = parser.parse_args()
+    main(args.engine, args.mode, args.workers)
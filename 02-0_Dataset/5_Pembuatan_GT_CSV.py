@@ -1,22 +1,39 @@
 import os
-import re
-from collections import defaultdict
+import sys
+import argparse
 
+import numpy as np
 import pandas as pd
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+import gt_table  # noqa: E402
 
 # Folder input dari hasil cleaning
 DATA_CLEAN_DIR = os.path.join(ROOT_DIR, "03_Output", "Data_CSV_Cleaned")
 
-# File ground truth (teks) ada di folder yang sama, sama script ini
+# File ground truth (teks) ada di folder yang sama, sama script ini.
+# Ini sumber utamanya : kalau GT berubah, yang diedit ground_truth.txt
 GT_TXT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ground_truth.txt")
 
+# Tabel GT (topologi, label, routers, scope), turunan ground_truth.txt lewat 00_Lib/gt_table.py.
+# GT_SOURCE "table" : baca tabel ini, dibuat ulang otomatis kalau ground_truth.txt berubah
+#           "text"  : cara lama, parse ground_truth.txt tiap run
+GT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ground_truth.csv")
+GT_SOURCE = "table"
+
+# True = info tambahan (sumber GT, tabel GT dibuat ulang). False : log sama dengan cara lama
+VERBOSE = False
+
 # Folder & file output GT CSV
 GT_OUTPUT_DIR = os.path.join(ROOT_DIR, "03_Output", "Ground_Truth")
 GT_OUTPUT_PATH = os.path.join(GT_OUTPUT_DIR, "GT.csv")
 
-os.makedirs(GT_OUTPUT_DIR, exist_ok=True)
+# Engine pengisian label
+# "vector"   : rules jadi tabel label (topologi, pasangan / router) -> label, diterapkan
+#              ke semua CSV sekaligus lewat merge (cepat untuk GT besar)
+# "iterrows" : cara lama, cek rules baris per baris
+GT_ENGINE = "vector"
 
 
 #  LABEL
@@ -46,79 +63,45 @@ def parse_ground_truth(gt_path: str):
       Topologi 10 -> RedistributeMismatch R2
       Topologi 7  -> AuthKeyMismatch & AuthMismatch R2 & R3
       Topologi 12 -> (HelloMismatch R1 & R2)  & (DeadMismatch R1 & R9)
-    """
-    pair_rules = defaultdict(lambda: defaultdict(set))
-    single_rules = defaultdict(lambda: defaultdict(set))
 
-    with open(gt_path, "r", encoding="utf-8") as f:
-        lines = [line.strip() for line in f if line.strip()]
+    RouterIDMismatch R1 & R7 artinya R1 dan R7 router bermasalah, jadi selain pasangan
+    juga masuk single_rules (semua adjacency yang melibatkan R1 atau R7 diberi label).
+    """
+    gt = read_ground_truth_text(gt_path)
+    return gt.pair_rules(), gt.single_rules()
 
-    for line in lines:
-        # Format: "Topologi X -> ...."
-        m = re.match(r"Topologi\s+(\d+)\s*->\s*(.+)", line)
-        if not m:
-            continue
 
-        topo_id = int(m.group(1))
-        desc = m.group(2).strip()
+def read_ground_truth_text(gt_path: str) -> gt_table.GroundTruth:
+    entries, _ = gt_table.parse_text(gt_path)
+    return gt_table.GroundTruth(entries, LABELS)
 
-        # Jika Normal, berarti tidak ada mismatch di topologi ini
-        if "Normal" in desc:
-            continue
 
-        # Rapiin ama pisah beberapa segmen mismatch:
-        # "(A)  & (B)" atau "(A) & (B)" → "<<A>>###<<B>>"
-        desc = desc.replace(")  & (", ") & (")
-        desc = desc.replace(") & (", ")###(")
-        segments = [seg.strip("() ").strip() for seg in desc.split("###")]
-
-        for seg in segments:
-            if not seg or seg == "...":
-                continue
-
-            # Bentuk segmen:
-            # 1) "DeadMismatch R1 & R9"
-            # 2) "RedistributeMismatch R2"
-            # 3) "AuthKeyMismatch & AuthMismatch R2 & R3"
-
-            # Cari pasangan router di ujung segmen
-            m_pair = re.search(r"(R\d+)\s*&\s*(R\d+)", seg)
-            m_single = re.search(r"(R\d+)\s*$", seg)
-
-            if m_pair:
-                r1, r2 = m_pair.group(1), m_pair.group(2)
-                label_part = seg[:m_pair.start()].strip()
-                label_names = [x.strip() for x in label_part.split("&")]
-
-                for lbl in label_names:
-                    if lbl in LABELS:
-                        # ==== pair-based ====
-                        key = frozenset({r1, r2})
-                        pair_rules[topo_id][key].add(lbl)
-
-                        # UNTUK RouterIDMismatch 
-                        # kalau ada "RouterIDMismatch R1 & R7"
-                        # artinya: R1 dan R7 adalah router bermasalah.
-                        # maka, semua adjacency yang melibatkan R1 atau R7
-                        # perlu diberi RouterIDMismatch = True.
-                        if lbl == "RouterIDMismatch":
-                            single_rules[topo_id][r1].add(lbl)
-                            single_rules[topo_id][r2].add(lbl)
-
-            elif m_single:
-                r = m_single.group(1)
-                label_part = seg[:m_single.start()].strip()
-                label_names = [x.strip() for x in label_part.split("&")]
-
-                for lbl in label_names:
-                    if lbl in LABELS:
-                        # Contoh utama: RedistributeMismatch R2
-                        single_rules[topo_id][r].add(lbl)
-
-    return pair_rules, single_rules
+def load_ground_truth() -> gt_table.GroundTruth:
+    """GroundTruth dari tabel GT (ground_truth.csv, disinkronkan dengan ground_truth.txt) atau dari ground_truth.txt."""
+    if GT_SOURCE == "table":
+        gt, rebuilt = gt_table.sync(GT_TXT_PATH, GT_TABLE_PATH, LABELS)
+        if VERBOSE:
+            if rebuilt:
+                print(f"[i] ground_truth.txt berubah / tabel GT belum ada, dibuat ulang : {GT_TABLE_PATH}")
+            print(f"[i] Ground truth dari tabel : {GT_TABLE_PATH} ({len(gt)} baris)")
+        return gt
+    return read_ground_truth_text(GT_TXT_PATH)
 
 
 # MENGISI LABEL GT UNTUK SATU DATAFRAME
+def prepare_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Cek kolom wajib, lalu hapus kolom label lama (bisi ada)."""
+    required_cols = ["topologi", "router_a", "router_b"]
+    for col in required_cols:
+        if col not in df.columns:
+            raise ValueError(f"Kolom wajib '{col}' tidak ditemukan di dataset.")
+
+    for lbl in LABELS:
+        if lbl in df.columns:
+            df = df.drop(columns=[lbl])
+    return df
+
+
 def apply_ground_truth_to_df(df: pd.DataFrame, pair_rules, single_rules) -> pd.DataFrame:
     """
     df: satu file CSV (hasil cleaning) yang punya kolom:
@@ -129,15 +112,7 @@ def apply_ground_truth_to_df(df: pd.DataFrame, pair_rules, single_rules) -> pd.D
       - menambahkan ulang 10 kolom LABELS dengan default False
       - mengisi True berdasarkan ground_truth.
     """
-    required_cols = ["topologi", "router_a", "router_b"]
-    for col in required_cols:
-        if col not in df.columns:
-            raise ValueError(f"Kolom wajib '{col}' tidak ditemukan di dataset.")
-
-    # Hapus kolom label lama (bisi ada)
-    for lbl in LABELS:
-        if lbl in df.columns:
-            df = df.drop(columns=[lbl])
+    df = prepare_df(df)
 
     # Tambahin kolom label baru dengan default False
     for lbl in LABELS:
@@ -178,8 +153,75 @@ def apply_ground_truth_to_df(df: pd.DataFrame, pair_rules, single_rules) -> pd.D
     return df
 
 
+# TABEL LABEL (ENGINE VECTOR)
+def label_tables(gt: gt_table.GroundTruth):
+    """
+    Index GroundTruth (by_pair / by_router) jadi tabel label long-format :
+      - pair_table   : topologi, lo, hi, label  (lo / hi = nama router pasangan, urut string)
+      - single_table : topologi, router, label
+    """
+    pairs = [(topo_id, lo, hi, lbl)
+             for (topo_id, lo, hi), labels in gt.by_pair.items()
+             for lbl in labels if lbl in LABELS]
+    singles = [(topo_id, router, lbl)
+               for (topo_id, router), labels in gt.by_router.items()
+               for lbl in labels if lbl in LABELS]
+    pair_table = pd.DataFrame(pairs, columns=["topologi", "lo", "hi", "label"])
+    single_table = pd.DataFrame(singles, columns=["topologi", "router", "label"])
+    return pair_table.astype({"topologi": "int64"}), single_table.astype({"topologi": "int64"})
+
+
+def _per_unique(col: pd.Series, fn) -> np.ndarray:
+    """fn dijalankan sekali per nilai unik kolom (bukan per baris), hasilnya disebar lagi ke semua baris."""
+    codes, uniq = pd.factorize(col, use_na_sentinel=False)
+    return np.array([fn(v) for v in uniq], dtype=object)[codes]
+
+
+def _topo_id(value):
+    """int(topologi) seperti cara lama, None kalau bukan angka (barisnya dilewati)."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def label_matrix(df: pd.DataFrame, pair_table: pd.DataFrame, single_table: pd.DataFrame) -> np.ndarray:
+    """
+    Matriks bool (baris x LABELS) : tiap baris di-merge ke pair_table lewat (topologi, pasangan
+    router_a / router_b tanpa arah) dan ke single_table lewat (topologi, router_a) dan
+    (topologi, router_b). Semua label yang kena di-OR per (baris, label).
+    """
+    topo = _per_unique(df["topologi"], _topo_id)
+    rows = np.flatnonzero(~pd.isna(topo))
+    topo = topo[rows].astype(np.int64)
+    ra = _per_unique(df["router_a"], lambda v: str(v).strip())[rows]
+    rb = _per_unique(df["router_b"], lambda v: str(v).strip())[rows]
+    swap = ra > rb
+
+    keys = pd.DataFrame({"row": rows, "topologi": topo,
+                         "lo": np.where(swap, rb, ra), "hi": np.where(swap, ra, rb)})
+    hits = [keys.merge(pair_table, on=["topologi", "lo", "hi"])[["row", "label"]]]
+    for router in (ra, rb):
+        keys = pd.DataFrame({"row": rows, "topologi": topo, "router": router})
+        hits.append(keys.merge(single_table, on=["topologi", "router"])[["row", "label"]])
+    hits = pd.concat(hits, ignore_index=True)
+
+    matrix = np.zeros((len(df), len(LABELS)), dtype=bool)
+    matrix[hits["row"].to_numpy(), pd.Categorical(hits["label"], categories=LABELS).codes] = True
+    return matrix
+
+
+def apply_ground_truth_vector(df: pd.DataFrame, pair_table: pd.DataFrame, single_table: pd.DataFrame) -> pd.DataFrame:
+    """apply_ground_truth_to_df versi vector, df boleh gabungan banyak CSV sekaligus."""
+    df = prepare_df(df)
+    matrix = label_matrix(df, pair_table, single_table)
+    return df.assign(**{lbl: matrix[:, i] for i, lbl in enumerate(LABELS)})
+
+
 # BACA SEMUA CSV CLEANED, ISI GT, GABUNG, SIMPAN GT.csv
-def main():
+def main(engine=None):
+    engine = engine or GT_ENGINE
+    os.makedirs(GT_OUTPUT_DIR, exist_ok=True)
     print("=== 5_Pembuatan_GT_CSV.py ===")
     print(f"ROOT_DIR           : {ROOT_DIR}")
     print(f"Data_CSV_Cleaned   : {DATA_CLEAN_DIR}")
@@ -187,11 +229,13 @@ def main():
     print(f"Output GT          : {GT_OUTPUT_PATH}")
     print("")
 
-    # --- Parsing ground_truth.txt ---
-    pair_rules, single_rules = parse_ground_truth(GT_TXT_PATH)
+    # --- Baca ground truth (tabel GT / ground_truth.txt) ---
+    gt = load_ground_truth()
+    if engine == "iterrows":
+        pair_rules, single_rules = gt.pair_rules(), gt.single_rules()
 
-    print(f"[i] Jumlah topologi dengan pair_rules   : {len(pair_rules)}")
-    print(f"[i] Jumlah topologi dengan single_rules : {len(single_rules)}")
+    print(f"[i] Jumlah topologi dengan pair_rules   : {len({key[0] for key in gt.by_pair})}")
+    print(f"[i] Jumlah topologi dengan single_rules : {len({key[0] for key in gt.by_router})}")
     print("")
 
     # --- Proses semua file di Data_CSV_Cleaned ---
@@ -212,8 +256,8 @@ def main():
         df = pd.read_csv(in_path)
         print(f"    - Jumlah baris awal (dari cleaning): {len(df)}")
 
-        # 2) Terapkan ground truth ke dataframe ini
-        df_gt = apply_ground_truth_to_df(df, pair_rules, single_rules)
+        # 2) Terapkan ground truth ke dataframe ini (engine vector : nanti sekaligus)
+        df_gt = apply_ground_truth_to_df(df, pair_rules, single_rules) if engine == "iterrows" else prepare_df(df)
         all_dfs.append(df_gt)
 
         topo_values = df_gt["topologi"].unique()
@@ -222,6 +266,8 @@ def main():
 
     # 3) Gabungkan semua topologi menjadi satu GT.csv
     final_df = pd.concat(all_dfs, ignore_index=True)
+    if engine == "vector":
+        final_df = apply_ground_truth_vector(final_df, *label_tables(gt))
 
     # SORTING DARI TOPOLOGI 1 sampe 100 
     final_df = final_df.sort_values(by=["topologi", "router_a", "router_b"]).reset_index(drop=True)
@@ -234,4 +280,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Buat GT.csv dari Data_CSV_Cleaned + ground_truth.txt")
+    parser.add_argument("--engine", choices=["vector", "iterrows"], default=GT_ENGINE,
+                        help="vector = tabel label + merge (semua CSV sekaligus), iterrows = cara lama")
+    parser.add_argument("--verbose", action="store_true", help="tampilkan sumber ground truth (tabel GT)")
+    args = parser.parse_args()
+    VERBOSE = args.verbose
+    main(args.engine)
@@ -94,15 +94,16 @@ def check_authkey_mismatch(row):
     return True
 
 
-# === Fungsi utama === #
-for fname in sorted(os.listdir(input_dir)):
-    if not fname.endswith(".csv"):
-        continue
+# === Urutan kolom label === #
+label_cols = [
+    "HelloMismatch", "DeadMismatch", "NetworkTypeMismatch",
+    "RouterIDMismatch", "AuthMismatch", "AuthKeyMismatch",
+    "PassiveMismatch", "RedistributeMismatch", "AreaMismatch", "MTUMismatch"
+]
 
-    fpath = os.path.join(input_dir, fname)
-    df = pd.read_csv(fpath)
-    print(f"[✓] Membaca {fname} ({len(df)} baris)")
 
+def label_dataset(df):
+    """Tambah kolom label mismatch (label_cols) ke dataset adjacency yang sudah dibersihkan."""
     # === RouterIDMismatch (FIXED) === #
     # 1. Mapping router_id → router names
     rid_map = {}
@@ -151,21 +152,31 @@ for fname in sorted(os.listdir(input_dir)):
     )
 
     df["RedistributeMismatch"] = df.apply(check_redistribute, axis=1)
+    return df
+
 
-    # === Urutan kolom label === #
-    label_cols = [
-        "HelloMismatch", "DeadMismatch", "NetworkTypeMismatch",
-        "RouterIDMismatch", "AuthMismatch", "AuthKeyMismatch",
-        "PassiveMismatch", "RedistributeMismatch", "AreaMismatch", "MTUMismatch"
-    ]
+# === Fungsi utama === #
+def main():
+    for fname in sorted(os.listdir(input_dir)):
+        if not fname.endswith(".csv"):
+            continue
 
+        fpath = os.path.join(input_dir, fname)
+        df = pd.read_csv(fpath)
+        print(f"[✓] Membaca {fname} ({len(df)} baris)")
+
+        df = label_dataset(df)
+
+        # === Simpan hasil === #
+        out_csv = os.path.join(
+            output_dir,
+            fname.replace("clean_", "labeled_").replace("dataset_", "labeled_")
+        )
+        df.to_csv(out_csv, index=False)
+        print(f"[✓] File {fname} selesai diberi label ({len(df)} baris) → {out_csv}\n")
+
+    print(f"[✔] Semua dataset selesai diberi label. Hasil tersimpan di folder: {output_dir}")
 
-    # === Simpan hasil === #
-    out_csv = os.path.join(
-        output_dir,
-        fname.replace("clean_", "labeled_").replace("dataset_", "labeled_")
-    )
-    df.to_csv(out_csv, index=False)
-    print(f"[✓] File {fname} selesai diberi label ({len(df)} baris) → {out_csv}\n")
 
-print(f"[✔] Semua dataset selesai diberi label. Hasil tersimpan di folder: {output_dir}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import io
+import os
+import re
+import sys
+import json
+import time
+import queue
+import socket
+import argparse
+import threading
+
+import pandas as pd
+
+# === Path utama === #
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+from script_loader import load_script  # noqa: E402
+from shard import open_jump_pool  # noqa: E402
+
+output_dir = os.path.join(ROOT_DIR, "03_Output", "Realtime")
+
+# === Fungsi dari tahap pipeline yang sudah ada === #
+ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+convert = load_script(os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"), "convert_csv")
+cleaning = load_script(os.path.join("02-0_Dataset", "4_Cleaning_Dataset.py"), "cleaning_dataset")
+rules = load_script(os.path.join("02-1_Scripts (Rule Based)", "1_Rule_Based.py"), "rule_based")
+
+# === Pesan syslog yang memicu collect ulang === #
+#   <189>45: R3: *Oct 18 06:10:01.123: %SYS-5-CONFIG_I: Configured from console by cisco on vty0 (...)
+#   <189>46: R3: *Oct 18 06:10:09.881: %OSPF-5-ADJCHG: Process 1, Nbr 2.2.2.2 on FastEthernet0/0 from FULL to DOWN
+TRIGGER_RE = re.compile(r"%(SYS-5-CONFIG_I|OSPF-5-ADJCHG):")
+# hostname di depan pesan (kalau router pakai "logging origin-id hostname")
+ORIGIN_RE = re.compile(r"^(?:<\d+>)?(?:\d+: )?(?P<host>[\w.\-]+): ")
+
+# event yang datang berdekatan (satu perubahan config biasanya bikin beberapa pesan) digabung
+DEBOUNCE = 2.0
+
+
+def parse_syslog(message: str, sender_ip: str, router_list: dict):
+    """Balikin (router, jenis event) dari satu pesan syslog, atau None kalau bukan pemicu."""
+    trigger = TRIGGER_RE.search(message)
+    if not trigger:
+        return None
+    origin = ORIGIN_RE.match(message)
+    if origin and origin.group("host") in router_list:
+        return origin.group("host"), trigger.group(1)
+    # tanpa origin-id : cocokin IP pengirim dengan IP management router
+    for name, ip in router_list.items():
+        if ip == sender_ip:
+            return name, trigger.group(1)
+    return None
+
+
+def csv_roundtrip(df):
+    """Lewatin DataFrame ke CSV dan baca lagi, biar tipe kolomnya sama dengan pipeline file."""
+    buf = io.StringIO()
+    df.to_csv(buf, index=False)
+    buf.seek(0)
+    return pd.read_csv(buf)
+
+
+class SyslogDaemon:
+    """
+    Dengerin syslog UDP, lalu untuk tiap router yang berubah : collect ulang router
+    itu + tetangga CDP-nya (ambil_data), parse ulang (parse_router), bangun
+    adjacency (build_rows), bersihin (clean_dataset) dan cek rule (label_dataset).
+    Yang dilaporkan cuma adjacency yang menyentuh router-router tadi.
+    """
+
+    def __init__(self, router_list: dict, raw_dir: str = None, debounce: float = DEBOUNCE):
+        self.router_list = router_list
+        self.raw_dir = raw_dir or ambil.base_dir
+        self.debounce = debounce
+        self.events = queue.Queue()
+        self.reports = []
+        self._stop = threading.Event()
+
+        # kondisi topologi terakhir, awalnya dari rawdata yang sudah ada
+        self.state = {}
+        for router in router_list:
+            try:
+                self.state[router] = pembuatan.parse_router(router, self.raw_dir)
+            except FileNotFoundError:
+                print(f"[!] File untuk {router} tidak lengkap, nunggu event berikutnya")
+
+        # output collect diset sekali, manifest / checkpoint dipakai terus antar event
+        ambil.COLLECT_MODE = "full"
+        ambil.init_output(self.raw_dir)
+
+    # --- event --- #
+    def handle_message(self, message: str, sender_ip: str):
+        event = parse_syslog(message, sender_ip, self.router_list)
+        if event:
+            print(f"[i] Syslog {event[1]} dari {event[0]}")
+            self.events.put((time.perf_counter(), event[0]))
+
+    def neighbors(self, routers) -> set:
+        """Tetangga CDP router-router ini (dua arah) menurut kondisi topologi terakhir."""
+        found = set()
+        for name, data in self.state.items():
+            for intf in data.get("interfaces", {}).values():
+                nbr = intf.get("neighbor", {}).get("router")
+                if name in routers and nbr:
+                    found.add(nbr)
+                if nbr in routers:
+                    found.add(name)
+        return (found - set(routers)) & set(self.router_list)
+
+    # --- proses --- #
+    def process(self, changed, received_at: float):
+        targets = set(changed) | self.neighbors(changed)
+        urut = sorted(targets, key=lambda r: (len(r), r))
+        print(f"[+] Collect ulang {', '.join(urut)} (berubah: {', '.join(sorted(changed))})")
+
+        # router yang sudah pernah di-collect event sebelumnya jangan dilewati checkpoint
+        ambil.checkpoint.forget(urut)
+        ambil.jump_pool.run(ambil.ambil_data, {r: self.router_list[r] for r in urut})
+        ambil.manifest.save()
+
+        for router in urut:
+            try:
+                self.state[router] = pembuatan.parse_router(router, self.raw_dir)
+            except FileNotFoundError:
+                print(f"[!] File untuk {router} tidak lengkap, pakai data lama")
+        # tetangga baru (misal link baru) ikut dilaporkan
+        targets |= self.neighbors(changed)
+
+        # rule dicek di seluruh topologi (RouterIDMismatch butuh semua router),
+        # yang dilaporkan cuma adjacency di sekitar router yang berubah
+        df = csv_roundtrip(pd.DataFrame(convert.build_rows(self.state, "realtime")))
+        df = csv_roundtrip(cleaning.clean_dataset(df, log=lambda *a: None))
+        df = rules.label_dataset(df)
+        sekitar = df[df["router_a"].isin(targets) | df["router_b"].isin(targets)]
+
+        elapsed = time.perf_counter() - received_at
+        mismatches = []
+        for _, row in sekitar.iterrows():
+            labels = [c for c in rules.label_cols if bool(row[c])]
+            if labels:
+                mismatches.append((row["router_a"], row["interface_a"], row["router_b"], row["interface_b"], labels))
+                print(f"[!] {row['router_a']} {row['interface_a']} ↔ {row['router_b']} {row['interface_b']} : "
+                      f"{', '.join(labels)}")
+        if not mismatches:
+            print(f"[✓] Tidak ada mismatch di sekitar {', '.join(sorted(changed))}")
+        print(f"[i] Event → laporan : {elapsed:.2f}s ({len(sekitar)} adjacency dicek)\n")
+
+        os.makedirs(output_dir, exist_ok=True)
+        df.to_csv(os.path.join(output_dir, "labeled_realtime.csv"), index=False)
+        with open(os.path.join(output_dir, "topologi_realtime.json"), "w") as f:
+            json.dump(self.state, f, indent=4)
+
+        report = {"changed": sorted(changed), "targets": urut, "mismatches": mismatches, "seconds": elapsed}
+        self.reports.append(report)
+        return report
+
+    def worker(self):
+        while not self._stop.is_set():
+            try:
+                received_at, router = self.events.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            changed = {router}
+            # kumpulin event lain yang datang dalam jendela debounce
+            deadline = time.perf_counter() + self.debounce
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    changed.add(self.events.get(timeout=remaining)[1])
+                except queue.Empty:
+                    break
+            try:
+                self.process(changed, received_at)
+            except Exception as e:
+                print(f"[!] Gagal proses event {sorted(changed)}: {e}")
+
+    # --- UDP --- #
+    def serve(self, host: str = "0.0.0.0", port: int = 514, ready: threading.Event = None):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.settimeout(0.2)
+        self.port = sock.getsockname()[1]
+
+        thread = threading.Thread(target=self.worker, daemon=True)
+        thread.start()
+        print(f"[i] Dengerin syslog di udp/{host}:{self.port}")
+        if ready:
+            ready.set()
+        try:
+            while not self._stop.is_set():
+                try:
+                    data, (sender_ip, _) = sock.recvfrom(8192)
+                except socket.timeout:
+                    continue
+                for line in data.decode(errors="replace").splitlines():
+                    if line.strip():
+                        self.handle_message(line.strip(), sender_ip)
+        finally:
+            sock.close()
+            self._stop.set()
+            thread.join()
+
+    def stop(self):
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deteksi realtime : collect + rule ulang saat ada syslog perubahan config")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=514, help="port UDP syslog (514 butuh root)")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE, help="jendela penggabungan event (detik)")
+    args = parser.parse_args()
+
+    ambil.jump_pool = open_jump_pool(ambil.router_admin)
+    daemon = SyslogDaemon(ambil.router_list, debounce=args.debounce)
+    try:
+        daemon.serve(args.host, args.port)
+    except KeyboardInterrupt:
+        print("\n[i] Daemon dihentikan")
+    finally:
+        ambil.jump_pool.close()
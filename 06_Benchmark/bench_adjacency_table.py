@@ -0,0 +1,71 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+from bench_common import sintetis  # noqa: E402
+
+
+def satu_file(convert, fpath, tmp, repeat):
+    """Waktu terbaik convert_file satu topologi, balikin (waktu, jumlah baris)."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _, n_rows, _, _ = convert.convert_file(fpath, os.path.join(tmp, "hasil.csv"), "1", float("inf"))
+        best = min(best, time.perf_counter() - t0)
+    return best, n_rows
+
+
+def banyak_file(convert, in_dir, out_dir, workers):
+    convert.input_dir, convert.output_dir = in_dir, out_dir
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        convert.main(float("inf"), workers)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="3_Convert JSON to CSV : waktu per ukuran topologi + process pool")
+    parser.add_argument("--routers", default="100,1000,10000", help="ukuran topologi sintetis (jumlah router)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--files", type=int, default=16, help="jumlah file untuk uji process pool")
+    parser.add_argument("--pool-routers", type=int, default=1000, help="ukuran tiap file untuk uji process pool")
+    args = parser.parse_args()
+
+    convert = load_script(os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"), "convert_csv")
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'router':>8}{'adjacency':>11}{'convert (s)':>13}")
+        for n in [int(x) for x in args.routers.split(",")]:
+            fpath = os.path.join(tmp, f"topologi_{n}.json")
+            with open(fpath, "w") as f:
+                json.dump(sintetis(n), f, indent=4)
+            best, n_rows = satu_file(convert, fpath, tmp, args.repeat)
+            print(f"{n:>8}{n_rows:>11}{best:>13.3f}")
+
+        # banyak file : satu proses vs process pool
+        in_dir = os.path.join(tmp, "json")
+        os.makedirs(in_dir)
+        routers = sintetis(args.pool_routers)
+        for i in range(args.files):
+            with open(os.path.join(in_dir, f"topologi_{i + 1}.json"), "w") as f:
+                json.dump(routers, f, indent=4)
+        workers = os.cpu_count() or 1
+        print(f"\n=== {args.files} file x {args.pool_routers} router ===")
+        for w in sorted({1, workers}):
+            out_dir = os.path.join(tmp, f"csv_{w}")
+            os.makedirs(out_dir)
+            elapsed = banyak_file(convert, in_dir, out_dir, w)
+            print(f"[i] {w} proses : {elapsed:.2f}s ({args.files / elapsed:.1f} file/s)")
+        if workers == 1:
+            print("[i] cuma 1 CPU di mesin ini, process pool tidak bisa lebih cepat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import concurrent.futures
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+from fake_ios import FakeIOSServer, make_fleet  # noqa: E402
+from async_collector import AsyncCollector  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from bench_common import commands, cek_output  # noqa: E402
+
+
+def run_thread(admin, fleet, workers=5):
+    """Pembanding : cara lama ThreadPoolExecutor(5) + netmiko (lewat JumpHostPool)."""
+    pool = JumpHostPool(admin, size=workers)
+
+    def job(ip):
+        with pool.device(ip) as conn:
+            conn.send_command_timing("terminal length 0")
+            for cmd in commands:
+                conn.send_command(cmd, expect_string=r"#")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(job, fleet.values()))
+    pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput AsyncCollector di fake IOS (10/100/1000 device)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--jump-connections", type=int, default=4)
+    parser.add_argument("--nested-delay", type=float, default=0.2, help="simulasi nested ssh (detik)")
+    parser.add_argument("--command-delay", type=float, default=0.02, help="simulasi waktu jawab command (detik)")
+    parser.add_argument("--thread-baseline", action="store_true",
+                        help="ukur juga engine thread (5 worker netmiko) di ukuran terkecil")
+    args = parser.parse_args()
+
+    fleet_all = make_fleet(max(args.sizes))
+    with FakeIOSServer(router_list=fleet_all, nested_delay=args.nested_delay,
+                       command_delay=args.command_delay) as server:
+        print(f"{'device':>8}{'ok':>8}{'total (s)':>12}{'device/s':>12}")
+        for n in args.sizes:
+            fleet = dict(list(fleet_all.items())[:n])
+            with tempfile.TemporaryDirectory() as out_dir:
+                collector = AsyncCollector(server.admin_params(), commands, out_dir,
+                                           concurrency=args.concurrency, timeout=120,
+                                           jump_connections=args.jump_connections)
+                t0 = time.perf_counter()
+                results = _diam(collector.run, fleet)
+                total = time.perf_counter() - t0
+                ok = sum(1 for r in results.values() if r["status"] == "ok")
+                print(f"{n:>8}{ok:>8}{total:>12.2f}{n / total:>12.1f}")
+                if n >= 12:
+                    print(f"{'':>8}[i] file R1..R12 yang beda dari rawdata asli: {cek_output(out_dir)}")
+
+        if args.thread_baseline:
+            n = min(args.sizes)
+            fleet = dict(list(fleet_all.items())[:n])
+            t0 = time.perf_counter()
+            run_thread(server.admin_params(), fleet)
+            total = time.perf_counter() - t0
+            print(f"[i] engine thread (5 worker netmiko), {n} device : {total:.2f}s ({n / total:.1f} device/s)")
+
+
+def _diam(func, *a):
+    # print per router dimatiin biar tabel benchmark kebaca
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return func(*a)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from bench_common import cek_output  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def run(ambil, admin, out_dir, show_mode):
+    """ambil_data semua router satu per satu, balikin list waktu per router (detik)."""
+    ambil.SHOW_MODE = show_mode
+    ambil.init_output(out_dir)
+    ambil.jump_pool = JumpHostPool(admin, size=1, mode="prompt")
+
+    # sesi jump host dibuka duluan supaya yang diukur cuma kerja per device
+    with ambil.jump_pool.device(next(iter(ambil.router_list.values()))):
+        pass
+
+    per_router = []
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        for rname, ip in ambil.router_list.items():
+            t0 = time.perf_counter()
+            ambil.ambil_data(rname, ip)
+            per_router.append(time.perf_counter() - t0)
+    ambil.jump_pool.close()
+    return per_router
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show command per router : sequential vs batch satu write")
+    parser.add_argument("--rtts", type=float, nargs="+", default=[0.0, 0.02, 0.1],
+                        help="simulasi round trip per write (detik)")
+    parser.add_argument("--runconfig-mode", choices=["single", "section"], default="section",
+                        help="section = 5 show command per router, single = 4")
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+    ambil.COLLECT_MODE = "full"
+    ambil.RUNCONFIG_MODE = args.runconfig_mode
+
+    print(f"=== {len(ambil.router_list)} router, RUNCONFIG_MODE {args.runconfig_mode} (rata-rata per router) ===")
+    print(f"{'rtt (s)':>8}{'sequential (s)':>16}{'batch (s)':>11}{'file beda':>11}")
+    for rtt in args.rtts:
+        hasil = {}
+        beda = 0
+        with FakeIOSServer(rtt=rtt) as server:
+            for mode in ("sequential", "batch"):
+                with tempfile.TemporaryDirectory() as tmp:
+                    per_router = run(ambil, server.admin_params(), tmp, mode)
+                    hasil[mode] = sum(per_router) / len(per_router)
+                    beda += cek_output(tmp)
+        print(f"{rtt:>8.2f}{hasil['sequential']:>16.3f}{hasil['batch']:>11.3f}{beda:>11}")
+
+
+if __name__ == "__main__":
+    main()
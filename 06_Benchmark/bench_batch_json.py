@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="2_Pembuatan_JSON mode batch : loop biasa vs process pool")
+    parser.add_argument("--topologi", type=int, default=101, help="jumlah folder topologi tiruan")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # tiap topologi tiruan = symlink ke rawdata yang sama (isi sama, parsing tetap penuh)
+        root = os.path.join(tmp, "rawdata_topologi")
+        os.makedirs(root)
+        for n in range(1, args.topologi + 1):
+            os.symlink(pembuatan.base_dir, os.path.join(root, str(n)))
+        out_seq, out_pool = os.path.join(tmp, "seq"), os.path.join(tmp, "pool")
+        os.makedirs(out_seq)
+        os.makedirs(out_pool)
+
+        t0 = time.perf_counter()
+        for n, path in pembuatan.discover_topologies(root).items():
+            pembuatan.build_topology(n, path, out_seq)
+        t_seq = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            pembuatan.build_batch(root, out_pool, args.workers)
+        t_pool = time.perf_counter() - t0
+
+        beda = [f for f in os.listdir(out_seq)
+                if open(os.path.join(out_seq, f)).read() != open(os.path.join(out_pool, f)).read()]
+
+    print(f"=== {args.topologi} topologi, {args.workers} proses (cpu: {os.cpu_count()}) ===")
+    print(f"{'cara':<16}{'waktu (s)':>10}{'topologi/s':>12}")
+    print(f"{'loop biasa':<16}{t_seq:>10.2f}{args.topologi / t_seq:>12.1f}")
+    print(f"{'process pool':<16}{t_pool:>10.2f}{args.topologi / t_pool:>12.1f}")
+    print(f"[i] file JSON beda antara dua cara : {len(beda)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from ios_prompt import send_config_bulk  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def push_line(conn, lines):
+    conn.send_command_timing("conf t")
+    for cmd in lines:
+        conn.send_command_timing(cmd)
+    conn.send_command_timing("end")
+    return []
+
+
+def push_bulk(conn, lines, chunk_size=0):
+    _, errors = send_config_bulk(conn, lines, chunk_size=chunk_size)
+    return errors
+
+
+def run(admin, configs, push):
+    """Push semua router, balikin rata-rata waktu push per router + semua error."""
+    pool = JumpHostPool(admin, size=1, mode="prompt")
+    per_router, errors = [], []
+    for ip, lines in configs.items():
+        with pool.device(ip) as conn:
+            t0 = time.perf_counter()
+            errors += push(conn, lines)
+            per_router.append(time.perf_counter() - t0)
+    pool.close()
+    return sum(per_router) / len(per_router), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Push config per baris vs bulk (0_Init_Konfig router_configs)")
+    parser.add_argument("--rtts", type=float, nargs="+", default=[0.0, 0.05, 0.2],
+                        help="simulasi round trip jaringan per write (detik)")
+    parser.add_argument("--chunk-size", type=int, default=8, help="ukuran chunk untuk mode bulk-chunk")
+    args = parser.parse_args()
+
+    init = load_script(os.path.join("00_Init Konfig (opsional - simulasi lab)", "0_Init_Konfig.py"), "init_konfig")
+    configs = init.router_configs
+
+    print(f"=== push router_configs {len(configs)} router (rata-rata per router) ===")
+    print(f"{'rtt (s)':>8}{'per baris (s)':>15}{'bulk (s)':>10}{f'bulk/{args.chunk_size} (s)':>14}")
+    for rtt in args.rtts:
+        with FakeIOSServer(rtt=rtt) as server:
+            admin = server.admin_params()
+            t_line, _ = run(admin, configs, push_line)
+            t_bulk, _ = run(admin, configs, push_bulk)
+            t_chunk, _ = run(admin, configs, lambda c, lines: push_bulk(c, lines, args.chunk_size))
+        print(f"{rtt:>8.2f}{t_line:>15.3f}{t_bulk:>10.3f}{t_chunk:>14.3f}")
+
+    # cek deteksi error : satu baris sengaja salah
+    with FakeIOSServer() as server:
+        ip = next(iter(configs))
+        _, errors = run(server.admin_params(), {ip: configs[ip] + ["ip ospf hello 5", "bogus-command 1"]}, push_bulk)
+    print(f"[i] deteksi error bulk : {errors}")
+
+
+if __name__ == "__main__":
+    main()
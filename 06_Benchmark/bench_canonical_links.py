@@ -0,0 +1,66 @@
+import os
+import sys
+import json
+import time
+import filecmp
+import argparse
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+from bench_common import sintetis  # noqa: E402
+
+
+def cara_lama(convert, cleaning, fpath, tmp):
+    """3_Convert (dua arah) lalu 4_Cleaning_Dataset : baca CSV lagi, buang hello kosong + arah kebalikan."""
+    raw_csv = os.path.join(tmp, "dua_arah.csv")
+    out_csv = os.path.join(tmp, "lama.csv")
+    t0 = time.perf_counter()
+    _, n_built, _, _ = convert.convert_file(fpath, raw_csv, "1", canonical=False)
+    df = cleaning.clean_dataset(pd.read_csv(raw_csv), log=lambda *_: None)
+    df.to_csv(out_csv, index=False)
+    return time.perf_counter() - t0, n_built, len(df)
+
+
+def kanonik(convert, fpath, tmp):
+    out_csv = os.path.join(tmp, "kanonik.csv")
+    t0 = time.perf_counter()
+    _, _, n_written, _ = convert.convert_file(fpath, out_csv, "1", canonical=True)
+    return time.perf_counter() - t0, n_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="3_Convert + 4_Cleaning vs 3_Convert --canonical (link ditulis sekali)")
+    parser.add_argument("--routers", default="100,1000,10000", help="ukuran topologi sintetis (jumlah router)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    convert = load_script(os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"), "convert_csv")
+    cleaning = load_script(os.path.join("02-0_Dataset", "4_Cleaning_Dataset.py"), "cleaning_dataset")
+
+    print(f"{'router':>8}{'baris 2 arah':>14}{'baris bersih':>14}{'lama (s)':>10}{'kanonik (s)':>13}"
+          f"{'speedup':>9}  CSV sama")
+    with tempfile.TemporaryDirectory() as tmp:
+        # topologi_101 asli + topologi sintetis yang lebih besar
+        files = [(len(json.load(open(os.path.join(convert.input_dir, "topologi_101.json")))),
+                  os.path.join(convert.input_dir, "topologi_101.json"))]
+        for n in [int(x) for x in args.routers.split(",")]:
+            fpath = os.path.join(tmp, f"topologi_{n}.json")
+            with open(fpath, "w") as f:
+                json.dump(sintetis(n), f, indent=4)
+            files.append((n, fpath))
+
+        for n, fpath in files:
+            lama = min(cara_lama(convert, cleaning, fpath, tmp) for _ in range(args.repeat))
+            baru = min(kanonik(convert, fpath, tmp) for _ in range(args.repeat))
+            sama = filecmp.cmp(os.path.join(tmp, "lama.csv"), os.path.join(tmp, "kanonik.csv"), shallow=False)
+            print(f"{n:>8}{lama[1]:>14}{baru[1]:>14}{lama[0]:>10.3f}{baru[0]:>13.3f}"
+                  f"{lama[0] / baru[0]:>8.1f}x  {sama}")
+
+
+if __name__ == "__main__":
+    main()
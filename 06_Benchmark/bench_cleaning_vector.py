@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import filecmp
+import argparse
+import tempfile
+import contextlib
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+from bench_common import sintetis  # noqa: E402
+
+# (label, engine, mode, workers)
+CARA = [
+    ("apply (lama)", "apply", "file", 1),
+    ("vector file", "vector", "file", 1),
+    ("vector concat", "vector", "concat", 1),
+    ("vector pool", "vector", "file", None),
+]
+
+
+def buat_csv(convert, csv_dir, n_files, n_routers):
+    """CSV dua arah (input 4_Cleaning) : topologi_101 asli + n_files topologi sintetis."""
+    os.makedirs(csv_dir)
+    convert.convert_file(os.path.join(convert.input_dir, "topologi_101.json"),
+                         os.path.join(csv_dir, "topologi_101.csv"), "101", canonical=False)
+    routers = sintetis(n_routers)
+    for i in range(n_files):
+        convert.write_rows(convert.build_rows(routers, str(i + 1)), os.path.join(csv_dir, f"topologi_{i + 1}.csv"))
+
+
+def clean_saja(cleaning, frames, engine, mode):
+    """Waktu cleaning saja (CSV sudah dibaca), tanpa baca / tulis file."""
+    t0 = time.perf_counter()
+    if mode == "concat":
+        cleaning.clean_concat(frames, {f: [] for f in frames})
+    else:
+        for df in frames.values():
+            cleaning.clean_dataset(df.copy(), lambda *_: None, engine)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="4_Cleaning_Dataset : apply per baris vs vector (per file / concat / pool)")
+    parser.add_argument("--files", type=int, default=50, help="jumlah CSV sintetis")
+    parser.add_argument("--routers", type=int, default=1000, help="jumlah router tiap topologi sintetis")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    convert = load_script(os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"), "convert_csv")
+    cleaning = load_script(os.path.join("02-0_Dataset", "4_Cleaning_Dataset.py"), "cleaning_dataset")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = os.path.join(tmp, "csv")
+        buat_csv(convert, csv_dir, args.files, args.routers)
+        cleaning.input_dir = csv_dir
+        frames = {f: pd.read_csv(os.path.join(csv_dir, f)) for f in sorted(os.listdir(csv_dir))}
+        n_rows = sum(len(df) for df in frames.values())
+        print(f"[i] {len(frames)} file CSV, {n_rows} baris, {os.cpu_count()} CPU\n")
+
+        print(f"{'cara':<16}{'clean (s)':>10}{'baris/s':>12}{'+ baca/tulis (s)':>18}{'baris/s':>12}  CSV sama")
+        base = None
+        for label, engine, mode, workers in CARA:
+            out_dir = os.path.join(tmp, label.split()[0] + "_" + mode + "_" + str(workers))
+            cleaning.output_dir = out_dir
+            clean = min(clean_saja(cleaning, frames, engine, mode) for _ in range(args.repeat)) \
+                if workers == 1 else float("nan")
+            total = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+                    cleaning.main(engine, mode, workers)
+                total = min(total, time.perf_counter() - t0)
+            base = base or out_dir
+            sama = all(filecmp.cmp(os.path.join(base, f), os.path.join(out_dir, f), shallow=False) for f in frames)
+            print(f"{label:<16}{clean:>10.3f}{n_rows / clean:>12,.0f}{total:>18.3f}{n_rows / total:>12,.0f}  {sama}")
+        if os.cpu_count() == 1:
+            print("\n[i] cuma 1 CPU di mesin ini, process pool tidak bisa lebih cepat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+import random
+import shutil
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+from fake_ios import RAWDATA_DIR  # noqa: E402
+from raw_store import output_filename  # noqa: E402
+
+# === Helper bersama untuk script benchmark === #
+
+commands = {
+    "show interfaces": "interfaces",
+    "show ip ospf interface": "ospf",
+    "show ip protocols": "ip protocols",
+    "show run | section interface": "config",
+    "show run | section router ospf": "ospf_config",
+    "show cdp neighbor": "cdp",
+}
+
+CONTOH = os.path.join(ROOT_DIR, "03_Output", "Data_JSON", "topologi_101.json")
+
+
+def cek_output(out_dir: str) -> int:
+    """Bandingin file hasil R1..R12 dengan rawdata asli (yang dipakai fake server)."""
+    beda = 0
+    for i in range(1, 13):
+        router = f"R{i}"
+        for cmd, folder in commands.items():
+            fname = output_filename(router, cmd)
+            with open(os.path.join(RAWDATA_DIR, folder, fname)) as f:
+                expected = f.read()
+            with open(os.path.join(out_dir, folder, fname)) as f:
+                if f.read() != expected:
+                    beda += 1
+    return beda
+
+
+def sintetis(n: int) -> dict:
+    """Topologi n router : topologi_101 disalin berulang, nama router digeser per salinan."""
+    with open(CONTOH) as f:
+        contoh = json.load(f)
+    size = len(contoh)
+    routers = {}
+    for i in range(n):
+        copy, idx = divmod(i, size)
+        name = list(contoh)[idx]
+        data = json.loads(json.dumps(contoh[name]))
+        for intf in data["interfaces"].values():
+            if "neighbor" in intf:
+                nbr = int(intf["neighbor"]["router"][1:]) + copy * size
+                intf["neighbor"]["router"] = f"R{nbr}"
+        routers[f"R{i + 1}"] = data
+    return routers
+
+
+def buat_topologi(pembuatan, root, n, seed=1):
+    """n folder rawdata tiruan : salinan rawdata asli, tiap topologi 1-2 router diubah Hello-nya."""
+    rnd = random.Random(seed)
+    routers = pembuatan.discover_routers(pembuatan.base_dir)
+    folder, fname = pembuatan.rawdata_files["ospf"]
+    for i in range(1, n + 1):
+        path = os.path.join(root, str(i))
+        shutil.copytree(pembuatan.base_dir, path, ignore=shutil.ignore_patterns("*.json"))
+        for router in rnd.sample(routers, rnd.choice([1, 2])):
+            file_ospf = os.path.join(path, folder, fname.format(router=router))
+            with open(file_ospf) as f:
+                teks = f.read()
+            with open(file_ospf, "w") as f:
+                f.write(teks.replace("Hello 10,", f"Hello {rnd.choice([1, 5, 15])},", 1))
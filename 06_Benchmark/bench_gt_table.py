@@ -0,0 +1,72 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+import gt_table  # noqa: E402
+
+# nomor topologi salinan ke-j = nomor asli + j * GESER
+GESER = 1000
+
+
+def gt_besar(path, n_skenario):
+    """ground_truth.txt asli disalin berulang (nomor topologi digeser) sampai n_skenario baris."""
+    with open(gt_table.GT_TXT_PATH, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n_skenario):
+            j, line = divmod(i, len(lines))
+            f.write(re.sub(r"Topologi\s+(\d+)", lambda m: f"Topologi {int(m.group(1)) + j * GESER}", lines[line]) + "\n")
+
+
+def terbaik(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        hasil = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GT : parse ground_truth.txt tiap run vs tabel GT (.csv / .json) + index")
+    parser.add_argument("--skenario", default="100,1000,10000,100000", help="jumlah baris skenario GT")
+    parser.add_argument("--lookup", type=int, default=100_000, help="jumlah lookup adjacency")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gt_script = load_script(os.path.join("02-0_Dataset", "5_Pembuatan_GT_CSV.py"), "pembuatan_gt")
+    labels = gt_script.LABELS
+    print(f"{'skenario':>9}{'baris tabel':>13}{'parse txt (s)':>15}{'load csv (s)':>14}{'load json (s)':>15}"
+          f"{'lookup/s':>12}  rules sama")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in [int(x) for x in args.skenario.split(",")]:
+            txt = os.path.join(tmp, f"gt_{n}.txt")
+            gt_besar(txt, n)
+            entries, _ = gt_table.parse_text(txt)
+            for ext in ("csv", "json"):
+                gt_table.save(entries, os.path.join(tmp, f"gt_{n}.{ext}"))
+
+            t_txt, (pair_rules, single_rules) = terbaik(lambda: gt_script.parse_ground_truth(txt), args.repeat)
+            t_csv, gt = terbaik(lambda: gt_table.load(os.path.join(tmp, f"gt_{n}.csv"), labels), args.repeat)
+            t_json, _ = terbaik(lambda: gt_table.load(os.path.join(tmp, f"gt_{n}.json"), labels), args.repeat)
+            sama = (gt.pair_rules(), gt.single_rules()) == (pair_rules, single_rules)
+
+            # lookup adjacency acak (topologi, router_a, router_b) lewat index
+            rng = random.Random(1)
+            topo = gt.topologies()
+            queries = [(rng.choice(topo), f"R{rng.randint(1, 12)}", f"R{rng.randint(1, 12)}") for _ in range(args.lookup)]
+            t_lookup, _ = terbaik(lambda: [gt.labels_for(*q) for q in queries], args.repeat)
+            print(f"{n:>9}{len(entries):>13}{t_txt:>15.4f}{t_csv:>14.4f}{t_json:>15.4f}"
+                  f"{args.lookup / t_lookup:>12,.0f}  {sama}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import os
+import re
+import sys
+import time
+import filecmp
+import argparse
+import tempfile
+import contextlib
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+
+# nomor topologi salinan ke-j = nomor asli + j * GESER
+GESER = 1000
+
+
+def buat_gt_besar(convert, gt, tmp, target):
+    """
+    Data_CSV_Cleaned + ground_truth.txt yang diperbesar : 101 topologi asli disalin
+    berulang dengan nomor topologi digeser, sampai jumlah adjacency >= target.
+    Tiap salinan satu file CSV. Balikin (folder CSV, path ground_truth.txt, jumlah baris).
+    """
+    clean_dir = os.path.join(tmp, "clean_asli")
+    convert.cleaned_dir = clean_dir
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        convert.main(workers=1, canonical=True)
+    asli = pd.concat([pd.read_csv(os.path.join(clean_dir, f)) for f in sorted(os.listdir(clean_dir))],
+                     ignore_index=True)
+    with open(gt.GT_TXT_PATH, encoding="utf-8") as f:
+        gt_lines = [line.strip() for line in f if line.strip()]
+
+    csv_dir = os.path.join(tmp, "clean")
+    os.makedirs(csv_dir)
+    gt_path = os.path.join(tmp, "ground_truth.txt")
+    n_copy = -(-target // len(asli))
+    with open(gt_path, "w", encoding="utf-8") as f:
+        for j in range(n_copy):
+            asli.assign(topologi=asli["topologi"] + j * GESER).to_csv(
+                os.path.join(csv_dir, f"salinan_{j:04d}.csv"), index=False)
+            for line in gt_lines:
+                f.write(re.sub(r"Topologi\s+(\d+)", lambda m: f"Topologi {int(m.group(1)) + j * GESER}", line) + "\n")
+    return csv_dir, gt_path, n_copy * len(asli)
+
+
+def label_saja(gt, frames, gt_path, engine):
+    """Waktu parse ground_truth.txt + isi label (CSV sudah dibaca, tanpa sort / tulis)."""
+    t0 = time.perf_counter()
+    if engine == "iterrows":
+        pair_rules, single_rules = gt.parse_ground_truth(gt_path)
+        for df in frames:
+            gt.apply_ground_truth_to_df(df.copy(), pair_rules, single_rules)
+    else:
+        gt.apply_ground_truth_vector(pd.concat(frames, ignore_index=True),
+                                     *gt.label_tables(gt.read_ground_truth_text(gt_path)))
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="5_Pembuatan_GT_CSV : iterrows + df.at vs tabel label + merge")
+    parser.add_argument("--adjacency", type=int, default=100_000, help="target jumlah adjacency di GT")
+    args = parser.parse_args()
+
+    convert = load_script(os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"), "convert_csv")
+    gt = load_script(os.path.join("02-0_Dataset", "5_Pembuatan_GT_CSV.py"), "pembuatan_gt")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir, gt_path, n_rows = buat_gt_besar(convert, gt, tmp, args.adjacency)
+        frames = [pd.read_csv(os.path.join(csv_dir, f)) for f in sorted(os.listdir(csv_dir))]
+        print(f"[i] {n_rows} adjacency di {len(frames)} file, {sum(1 for _ in open(gt_path))} baris ground_truth.txt\n")
+
+        gt.DATA_CLEAN_DIR, gt.GT_TXT_PATH = csv_dir, gt_path
+        gt.GT_SOURCE = "text"  # ground_truth.txt yang diperbesar, bukan tabel GT asli
+        print(f"{'engine':<10}{'label (s)':>11}{'baris/s':>12}{'main (s)':>10}  GT.csv sama")
+        hasil = {}
+        for engine in ("iterrows", "vector"):
+            label = label_saja(gt, frames, gt_path, engine)
+            gt.GT_OUTPUT_PATH = os.path.join(tmp, f"GT_{engine}.csv")
+            t0 = time.perf_counter()
+            with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+                gt.main(engine)
+            hasil[engine] = label, time.perf_counter() - t0
+            sama = filecmp.cmp(os.path.join(tmp, "GT_iterrows.csv"), gt.GT_OUTPUT_PATH, shallow=False)
+            print(f"{engine:<10}{label:>11.2f}{n_rows / label:>12,.0f}{hasil[engine][1]:>10.2f}  {sama}")
+        print(f"\n[i] speedup label : {hasil['iterrows'][0] / hasil['vector'][0]:.0f}x, "
+              f"main : {hasil['iterrows'][1] / hasil['vector'][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
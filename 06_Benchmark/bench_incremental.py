@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+import concurrent.futures
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from ios_prompt import send_config_bulk  # noqa: E402
+from bench_common import cek_output  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def collect(ambil, admin, out_dir, mode):
+    """Satu run 1_Ambil_RawData (engine thread), balikin (waktu, router berubah, file ditulis)."""
+    ambil.COLLECT_MODE = mode
+    ambil.init_output(out_dir)
+    ambil.jump_pool = JumpHostPool(admin, size=5, mode="prompt")
+    mtimes = {p: os.stat(p).st_mtime_ns for p in files(out_dir)}
+
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
+            list(ex.map(lambda item: ambil.ambil_data(*item), ambil.router_list.items()))
+    elapsed = time.perf_counter() - t0
+    ambil.jump_pool.close()
+    ambil.manifest.save()
+
+    ditulis = sum(1 for p in files(out_dir) if mtimes.get(p) != os.stat(p).st_mtime_ns)
+    return elapsed, list(ambil.manifest.data["changed"]), ditulis
+
+
+def files(out_dir):
+    return [os.path.join(root, f) for root, _, names in os.walk(out_dir) for f in names if f.endswith(".txt")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect full vs incremental setelah fault di sebagian router")
+    parser.add_argument("--rtt", type=float, default=0.02, help="simulasi round trip per write (detik)")
+    parser.add_argument("--command-delay", type=float, default=0.05, help="simulasi waktu jawab command (detik)")
+    parser.add_argument("--fault-routers", nargs="+", default=["R3", "R7"])
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+
+    with FakeIOSServer(rtt=args.rtt, command_delay=args.command_delay) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        admin = server.admin_params()
+        t_awal, _, n_awal = collect(ambil, admin, tmp, "full")
+        beda_awal = cek_output(tmp)
+
+        # timestamp "Last configuration change" punya resolusi detik
+        time.sleep(1.1)
+        pool = JumpHostPool(admin, size=1, mode="prompt")
+        for rname in args.fault_routers:
+            with pool.device(ambil.router_list[rname]) as conn:
+                send_config_bulk(conn, ["interface FastEthernet0/1", " ip ospf hello-interval 5"])
+        pool.close()
+
+        t_inc, berubah, n_inc = collect(ambil, admin, tmp, "incremental")
+        t_full, _, n_full = collect(ambil, admin, tmp, "full")
+
+    print(f"=== {len(ambil.router_list)} router, fault di {', '.join(args.fault_routers)} ===")
+    print(f"{'run':<22}{'waktu (s)':>10}{'file ditulis':>14}")
+    print(f"{'awal (full)':<22}{t_awal:>10.2f}{n_awal:>14}")
+    print(f"{'incremental':<22}{t_inc:>10.2f}{n_inc:>14}")
+    print(f"{'full (pembanding)':<22}{t_full:>10.2f}{n_full:>14}")
+    print(f"[i] router berubah menurut manifest : {berubah}")
+    print(f"[i] file beda dengan rawdata di run awal : {beda_awal}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import concurrent.futures
+
+from netmiko import ConnectHandler
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer, make_fleet  # noqa: E402
+from jumphost import JumpHostPool, nested_ssh  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def run_tanpa_pool(admin, fleet, workers, commands):
+    """Cara lama : ConnectHandler baru ke jump host untuk tiap router.
+    setup = waktu sampai sesi ke router siap (login jump host + nested ssh)."""
+    setup = []
+
+    def job(ip):
+        t0 = time.perf_counter()
+        conn = ConnectHandler(**admin)
+        nested_ssh(conn, ip)
+        setup.append(time.perf_counter() - t0)
+        for cmd in commands:
+            conn.send_command(cmd, expect_string=r"#")
+        conn.send_command_timing("exit")
+        conn.disconnect()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(job, fleet.values()))
+    return setup
+
+
+def run_dengan_pool(pool, fleet, workers, commands):
+    """Cara baru : sesi jump host dipinjam dari JumpHostPool (setup = sampai pool.device() siap)."""
+    setup = []
+
+    def job(ip):
+        t0 = time.perf_counter()
+        with pool.device(ip) as conn:
+            setup.append(time.perf_counter() - t0)
+            for cmd in commands:
+                conn.send_command(cmd, expect_string=r"#")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(job, fleet.values()))
+    return setup
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark setup per device : ConnectHandler baru vs JumpHostPool")
+    parser.add_argument("--routers", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--login-delay", type=float, default=0.3,
+                        help="simulasi waktu auth di jump host (detik)")
+    args = parser.parse_args()
+
+    # command yang sama dengan yang diambil 1_Ambil_RawData.py
+    commands = list(load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata").commands)
+    fleet = make_fleet(args.routers)
+    with FakeIOSServer(router_list=fleet, login_delay=args.login_delay) as server:
+        admin = server.admin_params()
+
+        t0 = time.perf_counter()
+        setup_lama = run_tanpa_pool(admin, fleet, args.workers, commands)
+        total_lama = time.perf_counter() - t0
+        login_lama = server.stats["auth"]
+
+        # pool ditutup sebelum server fake berhenti, sesi jump host tidak diputus sepihak
+        with JumpHostPool(admin, size=args.workers) as pool:
+            t0 = time.perf_counter()
+            setup_baru = run_dengan_pool(pool, fleet, args.workers, commands)
+            total_baru = time.perf_counter() - t0
+        login_baru = server.stats["auth"] - login_lama
+
+    print(f"=== {args.routers} router, {args.workers} worker, login delay {args.login_delay}s ===")
+    print(f"{'mode':<14}{'login':>8}{'setup per device (s)':>22}{'total (s)':>12}")
+    print(f"{'tanpa pool':<14}{login_lama:>8}{statistics.mean(setup_lama):>22.3f}{total_lama:>12.2f}")
+    print(f"{'JumpHostPool':<14}{login_baru:>8}{statistics.mean(setup_baru):>22.3f}{total_baru:>12.2f}")
+    print(f"[i] sesi jump host yang dibuka pool: {pool.stats['opened']}")
+    print(f"[✓] Setup per device berkurang {statistics.mean(setup_lama) - statistics.mean(setup_baru):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
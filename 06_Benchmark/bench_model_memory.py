@@ -0,0 +1,50 @@
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+from topology_model import load_topology, dump_topology  # noqa: E402
+from bench_common import sintetis  # noqa: E402
+
+
+def ukur(fn):
+    """(hasil, memori yang masih dipegang hasil (byte), waktu)."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    hasil = fn()
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return hasil, current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memori topologi : dict JSON vs topology_model (__slots__)")
+    parser.add_argument("--routers", type=int, default=10000)
+    args = parser.parse_args()
+
+    text = json.dumps(sintetis(args.routers))
+
+    routers, mem_dict, t_dict = ukur(lambda: json.loads(text))
+    del routers
+    topology, mem_model, t_model = ukur(lambda: load_topology(json.loads(text)))
+    n_intf = sum(len(r.interfaces) for r in topology.values())
+    sama = dump_topology(topology) == json.loads(text)
+
+    print(f"=== {len(topology)} router, {n_intf} interface ber-IP ===")
+    print(f"{'representasi':<26}{'memori (MB)':>12}{'byte/router':>13}{'load (s)':>10}")
+    print(f"{'dict JSON':<26}{mem_dict / 1e6:>12.1f}{mem_dict / len(topology):>13.0f}{t_dict:>10.2f}")
+    print(f"{'topology_model (__slots__)':<26}{mem_model / 1e6:>12.1f}{mem_model / len(topology):>13.0f}{t_model:>10.2f}")
+    print(f"[i] memori model = {mem_model / mem_dict * 100:.0f}% dari dict")
+    print(f"[i] JSON -> model -> JSON sama : {sama}")
+
+
+if __name__ == "__main__":
+    main()
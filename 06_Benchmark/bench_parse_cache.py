@@ -0,0 +1,55 @@
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+from bench_common import buat_topologi  # noqa: E402
+
+
+def run(pembuatan, root, out_dir, use_cache):
+    """Satu rebuild mode batch, balikin (waktu, baris ringkasan cache)."""
+    log = io.StringIO()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        pembuatan.build_batch(root, out_dir, workers=1, use_cache=use_cache)
+    elapsed = time.perf_counter() - t0
+    ringkasan = [line for line in log.getvalue().splitlines() if "Parse cache" in line]
+    return elapsed, ringkasan[0].replace("[i] Parse cache: ", "") if ringkasan else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild semua topologi : tanpa cache vs parse cache")
+    parser.add_argument("--topologi", type=int, default=101)
+    args = parser.parse_args()
+
+    pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pembuatan.cache_dir = os.path.join(tmp, "cache")
+        root = os.path.join(tmp, "rawdata_topologi")
+        buat_topologi(pembuatan, root, args.topologi)
+        outs = {k: os.path.join(tmp, k) for k in ("tanpa", "dingin", "hangat")}
+        for path in outs.values():
+            os.makedirs(path)
+
+        hasil = {k: run(pembuatan, root, out_dir, k != "tanpa") for k, out_dir in outs.items()}
+
+        beda = sum(open(os.path.join(outs["tanpa"], f)).read() != open(os.path.join(outs[k], f)).read()
+                   for f in os.listdir(outs["tanpa"]) for k in ("dingin", "hangat"))
+
+    print(f"=== rebuild {args.topologi} topologi (tiap topologi 1-2 router berubah) ===")
+    print(f"{'run':<16}{'waktu (s)':>10}{'topologi/s':>12}  cache")
+    for label, (elapsed, ringkasan) in zip(["tanpa cache", "cache dingin", "cache hangat"], hasil.values()):
+        print(f"{label:<16}{elapsed:>10.2f}{args.topologi / elapsed:>12.1f}  {ringkasan}")
+    print(f"[i] file JSON beda dengan tanpa cache : {beda}")
+
+
+if __name__ == "__main__":
+    main()
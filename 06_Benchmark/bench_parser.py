@@ -0,0 +1,124 @@
+import os
+import sys
+import random
+import timeit
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import ios_parser  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+OSPF_BLOCK = """{intf} is up, line protocol is up
+  Internet Address 10.{a}.{b}.1/30, Area {area}
+  Process ID 1, Router ID 1.1.1.1, Network Type {net}, Cost: 1
+  Transmit Delay is 1 sec, State {net}
+  Timer intervals configured, Hello {hello}, Dead {dead}, Wait {dead}, Retransmit 5
+    oob-resync timeout 40
+    Hello due in 00:00:03
+  Supports Link-local Signaling (LLS)
+  Cisco NSF helper support enabled
+  IETF NSF helper support enabled
+  Index 2/2, flood queue length 0
+  Next 0x0(0)/0x0(0)
+  Last flood scan length is 1, maximum is 3
+  Last flood scan time is 0 msec, maximum is 4 msec
+  Neighbor Count is 1, Adjacent neighbor count is 1
+    Adjacent with neighbor 2.2.2.2
+  Suppress hello for 0 neighbor(s)
+{auth}"""
+
+INTERFACES_BLOCK = """{intf} is up, line protocol is up
+  Hardware is Gt96k FE, address is c21b.2577.0001 (bia c21b.2577.0001)
+  Internet address is 10.{a}.{b}.1/30
+  MTU {mtu} bytes, BW 100000 Kbit/sec, DLY 100 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  Keepalive set (10 sec)
+  Full-duplex, 100Mb/s, 100BaseTX/FX
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Last input 00:00:00, output 00:00:00, output hang never
+  Last clearing of "show interface" counters never
+  Input queue: 0/75/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate 1000 bits/sec, 1 packets/sec
+  5 minute output rate 1000 bits/sec, 1 packets/sec
+     519 packets input, 73353 bytes
+     Received 140 broadcasts, 0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     1524 packets output, 177256 bytes, 0 underruns
+     0 output errors, 0 collisions, 0 interface resets
+"""
+
+AUTH = {
+    "none": ("", ""),
+    "simple": ("  Simple password authentication enabled\n",
+               " ip ospf authentication\n ip ospf authentication-key cisco123\n"),
+    "md5": ("  Message digest authentication enabled\n    Youngest key id is 1\n",
+            " ip ospf authentication message-digest\n ip ospf message-digest-key 1 md5 cisco\n"),
+}
+
+
+def sintetis(n: int, seed: int = 1):
+    """Output show command tiruan untuk satu router dengan n interface."""
+    rnd = random.Random(seed)
+    ospf, intfs, config = [], [], []
+    cdp = ["Capability Codes: R - Router, T - Trans Bridge, B - Source Route Bridge",
+           "                  S - Switch, H - Host, I - IGMP, r - Repeater", "",
+           "Device ID        Local Intrfce     Holdtme    Capability  Platform  Port ID"]
+    for i in range(n):
+        slot, port = divmod(i, 16)
+        intf = f"FastEthernet{slot}/{port}"
+        a, b = divmod(i, 64)
+        auth = rnd.choice(list(AUTH))
+        hello = rnd.choice([10, 10, 10, 5, 1])
+        ospf.append(OSPF_BLOCK.format(intf=intf, a=a, b=b * 4, area=rnd.choice([0, 0, 1]),
+                                      net=rnd.choice(["POINT_TO_POINT", "BROADCAST"]),
+                                      hello=hello, dead=hello * 4, auth=AUTH[auth][0]))
+        intfs.append(INTERFACES_BLOCK.format(intf=intf, a=a, b=b * 4, mtu=rnd.choice([1500, 1500, 1400])))
+        config.append(f"interface {intf}\n ip address 10.{a}.{b * 4}.1 255.255.255.252\n{AUTH[auth][1]}"
+                      " ip ospf network point-to-point\n duplex auto\n speed auto\n")
+        cdp.append(f"R{i + 2}.cisco         Fas {slot}/{port}            158         R S I     3725      Fas 0/1")
+    return {
+        "parse_show_ip_ospf_interface": "".join(ospf) + "R1#",
+        "parse_show_interfaces": "".join(intfs) + "R1#",
+        "parse_config_interface": "".join(config) + "R1#",
+        "parse_show_cdp_neighbor": "\n".join(cdp) + "\nR1#",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser regex lama vs ios_parser (satu lintasan) di output besar")
+    parser.add_argument("--interfaces", type=int, default=500, help="jumlah interface per output sintetis")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+    # benchmark parser, jangan sampai nulis ke 03_Output/Cache
+    pembuatan.PARSE_CACHE = False
+    outputs = sintetis(args.interfaces)
+
+    # cek dulu hasilnya sama, di output sintetis dan di rawdata asli
+    beda = [name for name, text in outputs.items()
+            if getattr(pembuatan, name)(text) != getattr(ios_parser, name)(text)]
+    for router in pembuatan.discover_routers(pembuatan.base_dir):
+        pembuatan.PARSER_ENGINE = "regex"
+        lama = pembuatan.parse_router(router)
+        pembuatan.PARSER_ENGINE = "compiled"
+        if lama != pembuatan.parse_router(router):
+            beda.append(router)
+
+    total = sum(len(text.splitlines()) for text in outputs.values())
+    print(f"=== {args.interfaces} interface ({total} baris), terbaik dari {args.repeat}x ===")
+    print(f"{'parser':<32}{'regex (ms)':>12}{'compiled (ms)':>15}{'speedup':>9}")
+    for name, text in outputs.items():
+        t_lama = min(timeit.repeat(lambda: getattr(pembuatan, name)(text), number=1, repeat=args.repeat))
+        t_baru = min(timeit.repeat(lambda: getattr(ios_parser, name)(text), number=1, repeat=args.repeat))
+        print(f"{name:<32}{t_lama * 1000:>12.2f}{t_baru * 1000:>15.2f}{t_lama / t_baru:>8.2f}x")
+    print(f"[i] hasil beda antara dua engine : {beda or 0}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def push(admin, ip, lines, mode):
+    """Push config satu router seperti configure_router di 0_Init_Konfig.py"""
+    pool = JumpHostPool(admin, size=1, mode=mode)
+    t0 = time.perf_counter()
+    with pool.device(ip) as conn:
+        conn.send_command_timing("conf t")
+        for cmd in lines:
+            conn.send_command_timing(cmd)
+        conn.send_command_timing("end")
+        conn.send_command_timing("wr")
+    total = time.perf_counter() - t0
+    pool.close()
+    return total, pool
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Push config : send_command_timing vs deteksi prompt")
+    parser.add_argument("--router", default="R1")
+    parser.add_argument("--delays", type=float, nargs="+", default=[0.0, 0.2],
+                        help="delay jawab per command di fake device (detik)")
+    args = parser.parse_args()
+
+    init = load_script(os.path.join("00_Init Konfig (opsional - simulasi lab)", "0_Init_Konfig.py"), "init_konfig")
+    ip = init.router_list[args.router]
+    lines = init.router_configs[ip]
+
+    print(f"=== push {len(lines)} baris config {args.router} ===")
+    print(f"{'delay (s)':>10}{'timing (s)':>12}{'prompt (s)':>12}{'per cmd prompt (ms)':>22}{'fallback':>10}")
+    for delay in args.delays:
+        with FakeIOSServer(command_delay=delay) as server:
+            t_timing, _ = push(server.admin_params(), ip, lines, "timing")
+            t_prompt, pool = push(server.admin_params(), ip, lines, "prompt")
+        per_cmd = sum(r["seconds"] for r in pool.latency) / len(pool.latency) * 1000
+        fallback = sum(1 for r in pool.latency if r["mode"] == "timing")
+        print(f"{delay:>10.2f}{t_timing:>12.2f}{t_prompt:>12.2f}{per_cmd:>22.1f}{fallback:>10}")
+
+
+if __name__ == "__main__":
+    main()
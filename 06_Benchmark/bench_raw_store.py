@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from raw_store import RawStore  # noqa: E402
+from script_loader import load_script  # noqa: E402
+from bench_common import buat_topologi  # noqa: E402
+
+
+def ukuran(path):
+    """(ukuran isi file, ukuran terpakai di disk) semua file di bawah path, byte."""
+    isi = disk = 0
+    for folder, _, files in os.walk(path):
+        for fname in files:
+            st = os.stat(os.path.join(folder, fname))
+            isi += st.st_size
+            disk += st.st_blocks * 512
+    return isi, disk
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Riwayat rawdata : folder per topologi vs RawStore (content-addressed)")
+    parser.add_argument("--topologi", type=int, default=101)
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+    pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+    pembuatan.PARSE_CACHE = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "rawdata_topologi")
+        buat_topologi(pembuatan, root, args.topologi)
+        store = RawStore(os.path.join(tmp, "store"))
+
+        t0 = time.perf_counter()
+        for n, path in pembuatan.discover_topologies(root).items():
+            store.import_dir(n, path, ambil.commands)
+        t_import = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        snap = RawStore(store.root).snapshot(str(args.topologi))
+        t_open = time.perf_counter() - t0
+
+        out_dir, out_store = os.path.join(tmp, "json_dir"), os.path.join(tmp, "json_store")
+        os.makedirs(out_dir)
+        os.makedirs(out_store)
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            t0 = time.perf_counter()
+            pembuatan.build_batch(root, out_dir, workers=1)
+            t_dir = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            pembuatan.build_batch(store.root, out_store, workers=1)
+            t_store = time.perf_counter() - t0
+        beda = sum(open(os.path.join(out_dir, f)).read() != open(os.path.join(out_store, f)).read()
+                   for f in os.listdir(out_dir))
+
+        flat, store_usage = ukuran(root), ukuran(store.root)
+        usage = store.disk_usage()
+
+    print(f"=== {args.topologi} snapshot, tiap snapshot 1-2 router berubah ===")
+    print(f"{'penyimpanan':<22}{'isi (KB)':>10}{'di disk (KB)':>14}")
+    print(f"{'folder per topologi':<22}{flat[0] / 1024:>10.0f}{flat[1] / 1024:>14.0f}")
+    print(f"{'RawStore':<22}{store_usage[0] / 1024:>10.0f}{store_usage[1] / 1024:>14.0f}")
+    print(f"[i] {usage['objects']} object unik ({usage['object_bytes'] / 1024:.0f} KB terkompres), "
+          f"manifest {usage['manifest_bytes'] / 1024:.0f} KB, import {t_import:.2f}s")
+    print(f"[i] buka snapshot {snap.id} : {t_open * 1000:.2f} ms ({len(snap.files)} router)")
+    print(f"[i] parse semua : folder {t_dir:.2f}s, RawStore {t_store:.2f}s, file JSON beda : {beda}")
+
+
+if __name__ == "__main__":
+    main()
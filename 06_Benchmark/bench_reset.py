@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from ios_prompt import send_config_bulk  # noqa: E402
+from ios_config import config_delta  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+# skenario fault injection : beberapa baris yang bikin mismatch
+FAULT = [
+    "interface FastEthernet0/1",
+    " ip ospf hello-interval 5",
+    " mtu 1400",
+    " no ip ospf authentication",
+]
+
+# (running-config, baseline, delta yang benar) untuk child "no X" yang kelebihan
+NEGASI = [
+    # baseline punya baris pengganti -> cukup kirim baris baseline, "no X" tidak dinegasikan
+    ("interface FastEthernet0/0\n no ip address\n no shutdown\n",
+     "interface FastEthernet0/0\n ip address 10.0.0.1 255.255.255.0\n shutdown\n",
+     ["interface FastEthernet0/0", " ip address 10.0.0.1 255.255.255.0", " shutdown"]),
+    # baseline tidak punya apa-apa -> "no X" dinegasikan jadi "X"
+    ("interface FastEthernet0/0\n no ip ospf authentication\n no shutdown\n",
+     "interface FastEthernet0/0\n",
+     ["interface FastEthernet0/0", " ip ospf authentication", " shutdown"]),
+]
+
+
+def cek_negasi() -> bool:
+    """config_delta untuk child "no X" : dengan dan tanpa baris pengganti di baseline."""
+    return all(config_delta(cur, base) == expected for cur, base, expected in NEGASI)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reset antar skenario : clear per interface vs restore baseline")
+    parser.add_argument("--rtt", type=float, default=0.02, help="simulasi round trip per write (detik)")
+    parser.add_argument("--mode", choices=["prompt", "timing"], default="prompt")
+    args = parser.parse_args()
+
+    hapus = load_script(os.path.join("00_Init Konfig (opsional - simulasi lab)", "0_Hapus_OSPF_EIGRP.py"), "hapus")
+
+    with FakeIOSServer(rtt=args.rtt) as server, tempfile.TemporaryDirectory() as tmp:
+        hapus.BASELINE_DIR = tmp
+        hapus.jump_pool = JumpHostPool(server.admin_params(), size=5, mode=args.mode)
+        routers = hapus.router_list
+
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            for rname, ip in routers.items():
+                hapus.save_baseline(rname, ip)
+
+            def inject():
+                for ip in routers.values():
+                    with hapus.jump_pool.device(ip) as conn:
+                        send_config_bulk(conn, FAULT)
+
+            inject()
+            clear_times = []
+            for rname, ip in routers.items():
+                t0 = time.perf_counter()
+                hapus.clear_config(rname, ip)
+                clear_times.append(time.perf_counter() - t0)
+
+            # clear_config juga ngehapus router ospf, jadi mulai lagi dari baseline
+            for rname, ip in routers.items():
+                hapus.reset_to_baseline(rname, ip)
+            inject()
+            reset_times = [hapus.reset_to_baseline(rname, ip) for rname, ip in routers.items()]
+            sisa = [len(hapus.config_delta(server.router_for_ip(ip).running_config(),
+                                           open(hapus.baseline_path(rname)).read()))
+                    for rname, ip in routers.items()]
+        hapus.jump_pool.close()
+
+    print(f"=== reset {len(routers)} router, mode {args.mode}, rtt {args.rtt}s ===")
+    print(f"{'router':<8}{'clear (s)':>11}{'baseline (s)':>14}")
+    for rname, t_clear, t_reset in zip(routers, clear_times, reset_times):
+        print(f"{rname:<8}{t_clear:>11.2f}{t_reset:>14.2f}")
+    print(f"{'total':<8}{sum(clear_times):>11.2f}{sum(reset_times):>14.2f}")
+    print(f"[i] baris delta tersisa setelah reset baseline (harus 0): {sum(sisa)}")
+    print(f"[i] config_delta child \"no X\" (ada / tidak ada pengganti di baseline) benar : {cek_negasi()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+import concurrent.futures
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from bench_common import cek_output  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def collect(ambil, server, out_dir, resume):
+    """Satu run 1_Ambil_RawData (engine thread), balikin (waktu, nested ssh, router gagal)."""
+    ambil.init_output(out_dir, resume=resume)
+    ambil.jump_pool = JumpHostPool(server.admin_params(), size=5, mode="prompt")
+    nested = server.stats["nested"]
+
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
+            list(ex.map(lambda item: ambil.ambil_data(*item), ambil.router_list.items()))
+    elapsed = time.perf_counter() - t0
+    ambil.jump_pool.close()
+    return elapsed, server.stats["nested"] - nested, sorted(ambil.checkpoint.data["failed"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect dengan router gagal : retry/backoff lalu --resume vs ulang semua")
+    parser.add_argument("--nested-delay", type=float, default=0.3, help="simulasi nested ssh (detik)")
+    parser.add_argument("--command-delay", type=float, default=0.05, help="simulasi waktu jawab command (detik)")
+    parser.add_argument("--down", default="R4", help="router yang mati selama run pertama")
+    parser.add_argument("--flaky", default="R9", help="router yang gagal 2x lalu pulih (ketolong retry)")
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+    ambil.COLLECT_MODE = "full"
+    ambil.BACKOFF_BASE = 0.2
+    down_ip, flaky_ip = ambil.router_list[args.down], ambil.router_list[args.flaky]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        failures = {down_ip: -1, flaky_ip: 2}
+        with FakeIOSServer(nested_delay=args.nested_delay, command_delay=args.command_delay,
+                           failures=failures) as server:
+            t1, n1, gagal1 = collect(ambil, server, tmp, resume=False)
+            server.failures.pop(down_ip)
+            t2, n2, gagal2 = collect(ambil, server, tmp, resume=True)
+        beda = cek_output(tmp)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with FakeIOSServer(nested_delay=args.nested_delay, command_delay=args.command_delay) as server:
+            t3, n3, _ = collect(ambil, server, tmp, resume=False)
+
+    print(f"=== {len(ambil.router_list)} router, {args.down} mati, {args.flaky} gagal 2x ===")
+    print(f"{'run':<26}{'waktu (s)':>10}{'nested ssh':>12}  gagal")
+    print(f"{'pertama (retry 3x)':<26}{t1:>10.2f}{n1:>12}  {gagal1 or '-'}")
+    print(f"{'--resume':<26}{t2:>10.2f}{n2:>12}  {gagal2 or '-'}")
+    print(f"{'ulang semua (pembanding)':<26}{t3:>10.2f}{n3:>12}  -")
+    print(f"[i] file beda dengan rawdata setelah resume : {beda}")
+
+
+if __name__ == "__main__":
+    main()
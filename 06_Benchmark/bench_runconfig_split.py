@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+import concurrent.futures
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from async_collector import AsyncCollector  # noqa: E402
+from bench_common import cek_output  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def run_thread(ambil, admin, out_dir, mode):
+    """Jalankan ambil_data (engine thread) semua router dengan RUNCONFIG_MODE tertentu."""
+    ambil.RUNCONFIG_MODE = mode
+    ambil.init_output(out_dir)
+    ambil.jump_pool = JumpHostPool(admin, size=5, mode="prompt")
+
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
+            list(ex.map(lambda item: ambil.ambil_data(*item), ambil.router_list.items()))
+    elapsed = time.perf_counter() - t0
+    ambil.jump_pool.close()
+    return elapsed
+
+
+def run_async(ambil, admin, out_dir, split):
+    collector = AsyncCollector(admin, ambil.commands, out_dir, concurrency=12, split_config=split)
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        collector.run(ambil.router_list)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="show run | section di router vs show running-config sekali + potong lokal")
+    parser.add_argument("--rtt", type=float, default=0.02, help="simulasi round trip per write (detik)")
+    parser.add_argument("--command-delay", type=float, default=0.05, help="simulasi waktu jawab command (detik)")
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+    ambil.COLLECT_MODE = "full"
+
+    print(f"=== {len(ambil.router_list)} router, rtt {args.rtt}s, delay command {args.command_delay}s ===")
+    print(f"{'engine':<8}{'mode':<9}{'waktu (s)':>10}{'command':>10}{'file beda':>11}")
+    with FakeIOSServer(rtt=args.rtt, command_delay=args.command_delay) as server:
+        admin = server.admin_params()
+        for mode in ("section", "single"):
+            with tempfile.TemporaryDirectory() as tmp:
+                before = server.stats["commands"]
+                elapsed = run_thread(ambil, admin, tmp, mode)
+                n_cmd = server.stats["commands"] - before
+                print(f"{'thread':<8}{mode:<9}{elapsed:>10.2f}{n_cmd:>10}{cek_output(tmp):>11}")
+        for mode in ("section", "single"):
+            with tempfile.TemporaryDirectory() as tmp:
+                before = server.stats["commands"]
+                elapsed = run_async(ambil, admin, tmp, mode == "single")
+                n_cmd = server.stats["commands"] - before
+                print(f"{'async':<8}{mode:<9}{elapsed:>10.2f}{n_cmd:>10}{cek_output(tmp):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+from collections import Counter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer, make_fleet  # noqa: E402
+from shard import ShardedJumpHostPool  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def collect(ambil, servers, fleet, sessions, policy):
+    """Satu run collect (engine thread) lewat len(servers) jump host, balikin (waktu, router per shard)."""
+    jump_hosts = {f"admin{i + 1}": {"params": s.admin_params(), "size": sessions} for i, s in enumerate(servers)}
+    # static : dibagi rata berurutan (round robin), hash : consistent hashing
+    static_map = {rname: f"admin{i % len(servers) + 1}" for i, rname in enumerate(fleet)}
+    ambil.jump_pool = ShardedJumpHostPool(jump_hosts, policy=policy, static_map=static_map, mode="prompt")
+    ambil.router_list = fleet
+    sebaran = Counter(ambil.jump_pool.shard_for(rname) for rname in fleet)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ambil.init_output(tmp)
+        t0 = time.perf_counter()
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            hasil = ambil.jump_pool.run(ambil.ambil_data, fleet)
+        elapsed = time.perf_counter() - t0
+    ambil.jump_pool.close()
+    if not all(hasil.values()):
+        print(f"[!] Ada router gagal: {[r for r, ok in hasil.items() if not ok]}")
+    return elapsed, [sebaran[name] for name in jump_hosts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput collect vs jumlah jump host (shard)")
+    parser.add_argument("--routers", type=int, default=48)
+    parser.add_argument("--jump-hosts", default="1,2,4", help="daftar jumlah jump host yang diuji")
+    parser.add_argument("--sessions", type=int, default=3, help="jatah sesi per jump host")
+    parser.add_argument("--policy", choices=["hash", "static"], default="hash")
+    parser.add_argument("--nested-delay", type=float, default=0.2, help="simulasi nested ssh (detik)")
+    parser.add_argument("--command-delay", type=float, default=0.02, help="simulasi waktu jawab command (detik)")
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+    ambil.COLLECT_MODE = "full"
+    fleet = make_fleet(args.routers)
+
+    print(f"=== {len(fleet)} router, {args.sessions} sesi per jump host, policy {args.policy} ===")
+    print(f"{'jump host':<11}{'waktu (s)':>10}{'router/s':>10}{'speedup':>9}  router per shard")
+    base = None
+    for n in [int(x) for x in args.jump_hosts.split(",")]:
+        servers = [FakeIOSServer(router_list=fleet, hostname=f"Admin{i + 1}", nested_delay=args.nested_delay,
+                                 command_delay=args.command_delay) for i in range(n)]
+        for server in servers:
+            server.start()
+        try:
+            elapsed, sebaran = collect(ambil, servers, fleet, args.sessions, args.policy)
+        finally:
+            for server in servers:
+                server.stop()
+        base = base or elapsed
+        print(f"{n:<11}{elapsed:>10.2f}{len(fleet) / elapsed:>10.1f}{base / elapsed:>8.2f}x  {sebaran}")
+
+
+if __name__ == "__main__":
+    main()
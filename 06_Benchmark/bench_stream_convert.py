@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import time
+import filecmp
+import argparse
+import resource
+import tempfile
+import subprocess
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_loader import load_script  # noqa: E402
+
+
+def peak_rss_kb() -> int:
+    """
+    Peak RSS proses ini (KB). Di Linux pakai VmHWM : ru_maxrss ikut membawa peak
+    proses induk (sebelum exec), jadi tidak bisa dipakai di proses anak.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def worker(mode, fpath, out_dir):
+    """Dijalankan di proses terpisah supaya peak RSS tiap cara tidak tercampur."""
+    convert = load_script(os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"), "convert_csv")
+    convert.input_dir = os.path.dirname(fpath)
+    convert.output_dir = out_dir
+    base_rss = peak_rss_kb()
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        convert.main(0 if mode == "stream" else float("inf"))
+    elapsed = time.perf_counter() - t0
+    peak = peak_rss_kb()
+    print(json.dumps({"seconds": elapsed, "peak_kb": peak, "base_kb": base_rss}))
+
+
+def run(mode, fpath, out_dir):
+    os.makedirs(out_dir)
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", mode, fpath, out_dir],
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS 3_Convert : json.load seluruh file vs streaming dua lintasan")
+    parser.add_argument("--routers", default="10000,50000", help="daftar ukuran topologi sintetis (jumlah router)")
+    parser.add_argument("--worker", nargs=3, metavar=("MODE", "FILE", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        worker(*args.worker)
+        return
+
+    from bench_common import sintetis
+    print(f"{'router':>8}{'file (MB)':>11}  {'cara':<10}{'waktu (s)':>10}{'peak RSS (MB)':>15}{'di atas import (MB)':>21}")
+    for n in [int(x) for x in args.routers.split(",")]:
+        with tempfile.TemporaryDirectory() as tmp:
+            in_dir = os.path.join(tmp, "json")
+            os.makedirs(in_dir)
+            fpath = os.path.join(in_dir, "topologi_1.json")
+            with open(fpath, "w") as f:
+                json.dump(sintetis(n), f, indent=4)
+            size = os.path.getsize(fpath) / 1e6
+
+            hasil = {mode: run(mode, fpath, os.path.join(tmp, mode)) for mode in ("load", "stream")}
+            sama = filecmp.cmp(os.path.join(tmp, "load", "topologi_1.csv"),
+                               os.path.join(tmp, "stream", "topologi_1.csv"), shallow=False)
+            for mode, h in hasil.items():
+                print(f"{n:>8}{size:>11.1f}  {mode:<10}{h['seconds']:>10.2f}{h['peak_kb'] / 1024:>15.1f}"
+                      f"{(h['peak_kb'] - h['base_kb']) / 1024:>21.1f}")
+            print(f"[i] CSV sama : {sama}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_ios import FakeIOSServer  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from script_loader import load_script  # noqa: E402
+
+
+def dua_tahap(ambil, pembuatan, admin, raw_dir, out_dir):
+    """Cara lama : collect -> file rawdata, lalu parse file-file itu. Balikin (collect, total)."""
+    ambil.init_output(raw_dir)
+    ambil.jump_pool = JumpHostPool(admin, size=5, mode="prompt")
+    t0 = time.perf_counter()
+    ambil.jump_pool.run(ambil.ambil_data, ambil.router_list)
+    t_collect = time.perf_counter() - t0
+    output_file, _, _, _ = pembuatan.build_topology("101", raw_dir, out_dir, use_cache=False)
+    total = time.perf_counter() - t0
+    ambil.jump_pool.close()
+    return t_collect, total, output_file
+
+
+def streaming(ambil, admin, raw_dir, out_dir, save_raw):
+    """Mode --stream : tiap router langsung di-parse begitu selesai."""
+    ambil.init_output(raw_dir)
+    ambil.SAVE_RAW = save_raw
+    ambil.jump_pool = JumpHostPool(admin, size=5, mode="prompt")
+    t0 = time.perf_counter()
+    output_file, _ = ambil.ambil_stream("101", out_dir, use_cache=False)
+    total = time.perf_counter() - t0
+    ambil.jump_pool.close()
+    ambil.SAVE_RAW = True
+    return total, output_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Waktu sampai topologi JSON : dua tahap vs streaming")
+    parser.add_argument("--nested-delay", type=float, default=0.3, help="simulasi nested ssh (detik)")
+    parser.add_argument("--command-delay", type=float, default=0.05, help="simulasi waktu jawab command (detik)")
+    args = parser.parse_args()
+
+    ambil = load_script(os.path.join("02-0_Dataset", "1_Ambil_RawData.py"), "ambil_rawdata")
+    pembuatan = load_script(os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"), "pembuatan_json")
+    ambil.COLLECT_MODE = "full"
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            FakeIOSServer(nested_delay=args.nested_delay, command_delay=args.command_delay) as server:
+        dirs = {k: (os.path.join(tmp, k, "raw"), os.path.join(tmp, k, "json")) for k in ("dua", "raw", "noraw")}
+        for raw_dir, out_dir in dirs.values():
+            os.makedirs(out_dir)
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            t_collect, t_dua, f_dua = dua_tahap(ambil, pembuatan, server.admin_params(), *dirs["dua"])
+            t_raw, f_raw = streaming(ambil, server.admin_params(), *dirs["raw"], save_raw=True)
+            t_noraw, f_noraw = streaming(ambil, server.admin_params(), *dirs["noraw"], save_raw=False)
+
+        acuan = open(os.path.join(ROOT_DIR, "03_Output", "Data_JSON", "topologi_101.json")).read()
+        beda = [f for f in (f_dua, f_raw, f_noraw) if open(f).read() != acuan]
+        n_raw = sum(len(files) for _, _, files in os.walk(dirs["noraw"][0]))
+
+    print(f"=== {len(ambil.router_list)} router, nested {args.nested_delay}s, command {args.command_delay}s ===")
+    print(f"{'cara':<30}{'collect -> JSON (s)':>20}")
+    print(f"{'dua tahap (file rawdata)':<30}{t_dua:>20.2f}   (collect {t_collect:.2f}s + parse {t_dua - t_collect:.2f}s)")
+    print(f"{'streaming + file rawdata':<30}{t_raw:>20.2f}")
+    print(f"{'streaming tanpa file rawdata':<30}{t_noraw:>20.2f}   ({n_raw} file rawdata ditulis)")
+    print(f"[i] JSON beda dengan topologi_101.json : {len(beda)}")
+    print("[i] dua tahap lewat run_all.py juga nambah start proses Python kedua (~0.5s import pandas/netmiko)")
+
+
+if __name__ == "__main__":
+    main()
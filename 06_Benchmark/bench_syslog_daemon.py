@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, BENCH_DIR)
+from fake_ios import FakeIOSServer, RAWDATA_DIR  # noqa: E402
+from jumphost import JumpHostPool  # noqa: E402
+from ios_prompt import send_config_bulk  # noqa: E402
+from script_loader import load_script  # noqa: E402
+from syslog_replay import replay  # noqa: E402
+
+# fault : Fa0/1 R3 (ke R1) dijadikan passive
+FAULT = ["router ospf 1", " passive-interface FastEthernet0/1"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji 5_Syslog_Daemon.py : fault di fake R3 + replay syslog")
+    parser.add_argument("--syslog", default=os.path.join(BENCH_DIR, "syslog_sample.log"))
+    parser.add_argument("--debounce", type=float, default=0.5)
+    parser.add_argument("--nested-delay", type=float, default=0.2, help="simulasi nested ssh (detik)")
+    args = parser.parse_args()
+
+    daemon_mod = load_script(os.path.join("02-1_Scripts (Rule Based)", "5_Syslog_Daemon.py"), "syslog_daemon")
+    ambil = daemon_mod.ambil
+
+    with FakeIOSServer(nested_delay=args.nested_delay) as server, tempfile.TemporaryDirectory() as tmp:
+        # rawdata awal = salinan rawdata asli, output daemon ke tmp
+        raw_dir = os.path.join(tmp, "rawdata")
+        shutil.copytree(RAWDATA_DIR, raw_dir)
+        daemon_mod.output_dir = os.path.join(tmp, "Realtime")
+        ambil.jump_pool = JumpHostPool(server.admin_params(), size=5, mode="prompt")
+
+        daemon = daemon_mod.SyslogDaemon(ambil.router_list, raw_dir=raw_dir, debounce=args.debounce)
+        ready = threading.Event()
+        thread = threading.Thread(target=daemon.serve, args=("127.0.0.1", 0), kwargs={"ready": ready})
+        thread.start()
+        ready.wait()
+
+        with ambil.jump_pool.device(ambil.router_list["R3"]) as conn:
+            send_config_bulk(conn, FAULT)
+
+        t0 = time.perf_counter()
+        sent = replay(args.syslog, port=daemon.port, interval=0.05)
+        while not daemon.reports and time.perf_counter() - t0 < 60:
+            time.sleep(0.05)
+        total = time.perf_counter() - t0
+        daemon.stop()
+        thread.join()
+        ambil.jump_pool.close()
+
+    print("\n=== hasil ===")
+    print(f"[i] {sent} syslog dikirim, {len(daemon.reports)} batch diproses")
+    for report in daemon.reports:
+        print(f"[i] berubah {report['changed']}, collect ulang {report['targets']}, "
+              f"event → laporan {report['seconds']:.2f}s")
+        for ra, ia, rb, ib, labels in report["mismatches"]:
+            print(f"    {ra} {ia} ↔ {rb} {ib} : {', '.join(labels)}")
+    print(f"[i] replay pertama → laporan pertama : {total:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "00_Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import topo_snapshot  # noqa: E402
+from bench_common import sintetis  # noqa: E402
+
+FORMAT = {
+    "json indent=4": ("json", False),
+    "topo": ("bin", False),
+    "topo + zlib": ("bin", True),
+}
+
+
+def ukur(routers, tmp, fmt, compress, repeat):
+    """(ukuran file, waktu dump terbaik, waktu load terbaik, hasil load sama dengan input)."""
+    path = os.path.join(tmp, f"topologi.{fmt}")
+    t_dump = t_load = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        topo_snapshot.save(routers, path, fmt, compress)
+        t_dump = min(t_dump, time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        hasil = topo_snapshot.load(path)
+        t_load = min(t_load, time.perf_counter() - t0)
+    sama = json.dumps(hasil, indent=4) == json.dumps(routers, indent=4)
+    return os.path.getsize(path), t_dump, t_load, sama
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ukuran & waktu dump/load topologi : JSON indent=4 vs format biner .topo")
+    parser.add_argument("--routers", default="100,1000,10000", help="daftar ukuran topologi (jumlah router)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in [int(x) for x in args.routers.split(",")]:
+            routers = sintetis(n)
+            print(f"=== {n} router ===")
+            print(f"{'format':<16}{'ukuran (KB)':>12}{'rasio':>8}{'dump (ms)':>11}{'load (ms)':>11}  lossless")
+            base = None
+            for name, (fmt, compress) in FORMAT.items():
+                size, t_dump, t_load, sama = ukur(routers, tmp, fmt, compress, args.repeat)
+                base = base or size
+                print(f"{name:<16}{size / 1024:>12.1f}{size / base:>8.2f}{t_dump * 1000:>11.1f}"
+                      f"{t_load * 1000:>11.1f}  {sama}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
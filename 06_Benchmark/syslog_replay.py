@@ -0,0 +1,31 @@
+import time
+import socket
+import argparse
+
+
+def replay(path: str, host: str = "127.0.0.1", port: int = 5514, interval: float = 0.1) -> int:
+    """Kirim ulang baris syslog rekaman ke daemon lewat UDP, satu baris satu datagram."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sent = 0
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            sock.sendto(line.encode(), (host, port))
+            sent += 1
+            time.sleep(interval)
+    sock.close()
+    return sent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay syslog rekaman ke 5_Syslog_Daemon.py")
+    parser.add_argument("file", help="file syslog (satu pesan per baris)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5514)
+    parser.add_argument("--interval", type=float, default=0.1, help="jeda antar pesan (detik)")
+    args = parser.parse_args()
+
+    n = replay(args.file, args.host, args.port, args.interval)
+    print(f"[✓] {n} pesan syslog dikirim ke {args.host}:{args.port}")
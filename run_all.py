@@ -8,6 +8,15 @@ RUN_PEMBUATAN_JSON          = True   # 2_Pembuatan_JSON.py
 RUN_CONVERT_JSON_TO_CSV     = True   # 3_Convert JSON to CSV.py
 RUN_CLEANING_DATASET        = True   # 4_Cleaning_Dataset.py
 
+# True = tahap 1 + 2 digabung : 1_Ambil_RawData.py --stream (tiap router langsung di-parse
+# begitu output-nya datang), RUN_AMBIL_RAWDATA & RUN_PEMBUATAN_JSON diabaikan
+RUN_STREAM_AMBIL_JSON       = False
+STREAM_TOPOLOGI             = "101"
+
+# True = 3_Convert JSON to CSV.py --canonical : tiap link ditulis sekali + baris tanpa hello
+# dibuang saat konversi, langsung ke Data_CSV_Cleaned (hasil sama), RUN_CLEANING_DATASET diabaikan
+RUN_CANONICAL_LINKS         = True
+
 # 02-1_Scripts (Rule Based)
 RUN_RULE_BASED_DETECTION    = True   # 1_Rule_Based.py
 RUN_BUAT_LAPORAN_TXT        = True   # 3_Buat_Laporan.py
@@ -18,7 +27,7 @@ RUN_DOWNLOAD_LAPORAN        = True   # 4_Download_Laporan.py
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
-def run_script(label: str, rel_path: str, enabled: bool = True, stop_on_error: bool = True):
+def run_script(label: str, rel_path: str, enabled: bool = True, stop_on_error: bool = True, args=()):
     if not enabled:
         print(f"[SKIP] {label}")
         return
@@ -36,7 +45,7 @@ def run_script(label: str, rel_path: str, enabled: bool = True, stop_on_error: b
     print(f"  -> {script_path}")
     print("===================================================\n")
 
-    result = subprocess.run([sys.executable, script_path])
+    result = subprocess.run([sys.executable, script_path, *args])
 
     if result.returncode != 0:
         print(f"\n[ERROR] {label} gagal (exit code {result.returncode})")
@@ -47,28 +56,36 @@ def run_script(label: str, rel_path: str, enabled: bool = True, stop_on_error: b
 
 
 def main():
+    run_script(
+        "Dataset - 1_Ambil_RawData --stream (+ 2_Pembuatan_JSON)",
+        os.path.join("02-0_Dataset", "1_Ambil_RawData.py"),
+        enabled=RUN_STREAM_AMBIL_JSON,
+        args=("--stream", STREAM_TOPOLOGI),
+    )
+
     run_script(
         "Dataset - 1_Ambil_RawData",
         os.path.join("02-0_Dataset", "1_Ambil_RawData.py"),
-        enabled=RUN_AMBIL_RAWDATA,
+        enabled=RUN_AMBIL_RAWDATA and not RUN_STREAM_AMBIL_JSON,
     )
 
     run_script(
         "Dataset - 2_Pembuatan_JSON",
         os.path.join("02-0_Dataset", "2_Pembuatan_JSON.py"),
-        enabled=RUN_PEMBUATAN_JSON,
+        enabled=RUN_PEMBUATAN_JSON and not RUN_STREAM_AMBIL_JSON,
     )
 
     run_script(
         "Dataset - 3_Convert JSON to CSV",
         os.path.join("02-0_Dataset", "3_Convert JSON to CSV.py"),
         enabled=RUN_CONVERT_JSON_TO_CSV,
+        args=("--canonical",) if RUN_CANONICAL_LINKS else (),
     )
 
     run_script(
         "Dataset - 4_Cleaning_Dataset",
         os.path.join("02-0_Dataset", "4_Cleaning_Dataset.py"),
-        enabled=RUN_CLEANING_DATASET,
+        enabled=RUN_CLEANING_DATASET and not RUN_CANONICAL_LINKS,
     )
 
     run_script(